@@ -1,29 +1,292 @@
+import json
+from typing import List
+
 import typer
 from pysleigh.utilities.date import AoCDate
 from pysleigh.modules.benchmark import AoCBenchmark
+from pysleigh.modules.history import AoCBenchmarkHistory
+from pysleigh.modules.matrix import AoCBenchmarkMatrix
+from pysleigh.modules.report import AoCBenchmarkReport
+from pysleigh.modules.profiler import AoCProfiler
+from pysleigh.cli.common import echo_profile
 
 benchmark_app = typer.Typer(help="Benchmark AoC solutions.")
 
 
-@benchmark_app.command("solution")
+def _format_stats(label: str, stats: dict) -> str:
+    return (
+        f"  {label}: median {stats['median']:.6f}s | min {stats['min']:.6f}s | "
+        f"p95 {stats['p95']:.6f}s | stddev {stats['stddev']:.6f}s | "
+        f"MAD {stats['mad']:.6f}s | rse {stats['rse']:.2%} | "
+        f"{stats['outliers']} outlier(s)"
+    )
+
+
 @benchmark_app.command("solution")
 def benchmark_solution(
     year: int = typer.Option(None, help="Year of the puzzle"),
     day: int = typer.Option(None, help="Day of the puzzle"),
-    runs: int = typer.Option(5, help="Number of times to run the benchmark."),
+    runs: int = typer.Option(5, help="Minimum number of timed runs."),
+    warmup: int = typer.Option(1, help="Untimed warmup iterations before sampling."),
+    max_runs: int = typer.Option(
+        None, help="Upper bound on timed runs when sampling adaptively."
+    ),
+    target_rse: float = typer.Option(
+        None,
+        help="Keep sampling until the relative standard error drops below this "
+        "fraction (e.g. 0.01 for 1%).",
+    ),
+    time_budget: float = typer.Option(
+        None, help="Keep sampling for at most this many seconds per day."
+    ),
+    jobs: int = typer.Option(
+        1, help="Worker processes for year/all sweeps. Each day runs in its own."
+    ),
+    pin_cpus: bool = typer.Option(
+        False, "--pin-cpus", help="Pin each worker process to its own CPU."
+    ),
+    timeout: float = typer.Option(
+        None, help="Kill a worker whose day takes longer than this many seconds."
+    ),
+    part_timeout: float = typer.Option(
+        None,
+        help="Kill a worker that spends longer than this in parse or one part.",
+    ),
+    record: bool = typer.Option(
+        True, "--record/--no-record", help="Append results to the benchmark history."
+    ),
+    memory: bool = typer.Option(
+        False,
+        "--memory",
+        help="Also record peak RSS and top allocation sites per phase.",
+    ),
+    reverify: bool = typer.Option(
+        False,
+        "--reverify",
+        help="Check answers even if the solution and input are unchanged.",
+    ),
+    fmt: str = typer.Option(
+        "text",
+        "--format",
+        help="Output format: text, json, csv or markdown.",
+    ),
+    output: str = typer.Option(
+        None,
+        help="Write the report to this file (format inferred from .json/.csv/.md).",
+    ),
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="After timing a single day, profile each phase with cProfile.",
+    ),
+    profile_dir: str = typer.Option(
+        None, help="Directory for .prof and collapsed-stack files"
+    ),
+    top: int = typer.Option(15, help="Number of hotspots to print when profiling"),
 ):
     aoc_date = AoCDate(year, day) if year and day else None
-    benchmark = AoCBenchmark(aoc_date, runs=runs)
+    benchmark = AoCBenchmark(
+        aoc_date,
+        runs=runs,
+        warmup=warmup,
+        max_runs=max_runs,
+        target_rse=target_rse,
+        time_budget=time_budget,
+        jobs=jobs,
+        timeout=timeout,
+        pin_cpus=pin_cpus,
+        record=record,
+        memory=memory,
+        part_timeout=part_timeout,
+        reverify=reverify,
+    )
+
+    if output and fmt == "text":
+        fmt = AoCBenchmarkReport.infer_format(output) or "markdown"
+    if fmt != "text" and fmt not in AoCBenchmarkReport.FORMATS:
+        typer.secho(f"[Error] Unknown format '{fmt}'", fg=typer.colors.RED)
+        raise typer.Exit(code=2)
+
+    if year and day:
+        results = [benchmark.benchmark_day(year, day)]
+    else:
+        results = benchmark.benchmark_year(year) if year else benchmark.benchmark_all()
+        results = results or []
+
+    if fmt != "text":
+        report = AoCBenchmarkReport(results)
+        if output:
+            path = report.write(output, fmt)
+            typer.secho(f"Report written to {path}", fg=typer.colors.GREEN)
+        else:
+            typer.echo(report.render(fmt), nl=False)
+        return
 
     if year and day:
-        result = benchmark.benchmark_day(year, day)
-        if result:
+        result = results[0]
+        if result.get("status") == "timeout":
             typer.secho(
-                f"{year}-Day{day:02d} ✓ avg1: {result['avg_part1']:.6f}s, avg2: {result['avg_part2']:.6f}s "
-                f"over {result['runs']} runs",
+                f"{year}-Day{day:02d} ⏱ timed out in {result.get('phase', 'setup')}",
+                fg=typer.colors.RED,
+            )
+        elif result.get("runs"):
+            typer.secho(
+                f"{year}-Day{day:02d} ✓ parse: {result['avg_parse']:.6f}s, "
+                f"avg1: {result['avg_part1']:.6f}s, avg2: {result['avg_part2']:.6f}s, "
+                f"total: {result['avg_total']:.6f}s "
+                f"over {result['runs']} runs ({result['warmup']} warmup)",
                 fg=typer.colors.GREEN,
             )
+            typer.echo(_format_stats("Parse ", result["parse"]))
+            typer.echo(_format_stats("Part 1", result["part1"]))
+            typer.echo(_format_stats("Part 2", result["part2"]))
+            typer.echo(_format_stats("Total ", result["total"]))
+            if result.get("memory"):
+                _echo_memory(result["memory"])
+        if profile:
+            profiler = AoCProfiler(aoc_date=aoc_date, output_dir=profile_dir, top=top)
+            echo_profile(profiler.profile())
+    else:
+        _echo_sweep_summary(results)
+
+
+def _mib(size: int | None) -> str:
+    return "n/a" if size is None else f"{size / 2**20:.1f} MiB"
+
+
+def _echo_memory(memory: dict):
+    if memory.get("status"):
+        typer.secho(f"  Memory profiling {memory['status']}", fg=typer.colors.RED)
+        return
+
+    scope = memory.get("peak_rss_scope")
+    for phase in AoCBenchmark.PHASES:
+        stats = memory[phase]
+        typer.echo(
+            f"  {phase}: peak RSS {_mib(stats['peak_rss'])} ({scope}), "
+            f"traced peak {_mib(stats['peak_traced'])}"
+        )
+        for site in stats["top"][:3]:
+            typer.echo(
+                f"    {site['file']}:{site['line']} +{_mib(site['size'])} "
+                f"in {site['count']} block(s)"
+            )
+
+
+def _echo_sweep_summary(results: list):
+    passed = [r for r in results if r.get("runs")]
+    timed_out = [r for r in results if r.get("status") == "timeout"]
+    typer.secho(
+        f"Benchmarked {len(passed)}/{len(results)} days"
+        + (f", {len(timed_out)} timed out" if timed_out else ""),
+        fg=typer.colors.GREEN if not timed_out else typer.colors.YELLOW,
+    )
+
+
+@benchmark_app.command("compare")
+def benchmark_compare(
+    baseline: str = typer.Option(
+        None, help="Baseline revision (default: the one before the candidate)"
+    ),
+    candidate: str = typer.Option(
+        None, help="Candidate revision (default: the latest recorded)"
+    ),
+    threshold: float = typer.Option(
+        0.05, help="Relative median slowdown that counts as a regression."
+    ),
+    year: int = typer.Option(None, help="Only compare days from this year"),
+):
+    history = AoCBenchmarkHistory()
+    rows = history.compare(
+        baseline=baseline, candidate=candidate, threshold=threshold, year=year
+    )
+    if not rows:
+        typer.secho("Nothing to compare.", fg=typer.colors.YELLOW)
+        return
+
+    typer.echo(f"{rows[0]['baseline']} -> {rows[0]['candidate']}")
+    for row in rows:
+        typer.secho(
+            f"{row['year']}-Day{row['day']:02d}: {row['baseline_median']:.6f}s -> "
+            f"{row['candidate_median']:.6f}s ({row['ratio'] - 1:+.1%})",
+            fg=typer.colors.RED if row["regressed"] else typer.colors.GREEN,
+        )
+
+    regressions = [row for row in rows if row["regressed"]]
+    if regressions:
+        typer.secho(
+            f"❌ {len(regressions)} day(s) slowed by more than {threshold:.0%}.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(code=1)
+    typer.secho("✅ No regressions.", fg=typer.colors.GREEN)
+
+
+@benchmark_app.command("matrix")
+def benchmark_matrix(
+    year: int = typer.Option(None, help="Year of the puzzle"),
+    day: int = typer.Option(None, help="Day of the puzzle"),
+    interpreter: List[str] = typer.Option(
+        None,
+        "--interpreter",
+        "-i",
+        help="Interpreter to compare (repeatable). Defaults to "
+        "[benchmark].interpreters; the first one is the baseline.",
+    ),
+    runs: int = typer.Option(5, help="Timed runs per interpreter."),
+    warmup: int = typer.Option(1, help="Untimed warmup iterations per interpreter."),
+    timeout: float = typer.Option(
+        None, help="Kill an interpreter run that takes longer than this many seconds."
+    ),
+    fmt: str = typer.Option("text", "--format", help="Output format: text or json."),
+):
+    matrix = AoCBenchmarkMatrix(
+        interpreters=interpreter or None, runs=runs, warmup=warmup, timeout=timeout
+    )
+    if year and day:
+        rows = [matrix.compare_day(year, day)]
     elif year:
-        benchmark.benchmark_year(year)
+        rows = matrix.compare_year(year)
     else:
-        benchmark.benchmark_all()
+        rows = matrix.compare_all()
+
+    if fmt == "json":
+        typer.echo(json.dumps(rows, indent=2))
+        return
+    if not rows:
+        typer.secho("Nothing to benchmark.", fg=typer.colors.YELLOW)
+        return
+
+    interpreters = matrix.interpreters
+    for index, name in enumerate(interpreters):
+        info = next(
+            (
+                row["results"][name]["interpreter"]
+                for row in rows
+                if "interpreter" in row["results"][name]
+            ),
+            None,
+        )
+        label = (
+            f"{info['implementation']} {info['version']}"
+            + (" free-threaded" if info["free_threaded"] else "")
+            if info
+            else "unavailable"
+        )
+        typer.echo(f"[{index}] {name}: {label}" + (" (baseline)" if index == 0 else ""))
+
+    typer.echo(
+        "Day          " + "".join(f"{f'[{i}]':>24}" for i in range(len(interpreters)))
+    )
+    for row in rows:
+        cells = []
+        for name in interpreters:
+            result = row["results"][name]
+            if result.get("status") != "ok":
+                cells.append(f"{result.get('status', 'error'):>24}")
+                continue
+            cell = f"{result['total']['median']:.6f}s"
+            if row["speedup"][name] is not None:
+                cell += f" ({row['speedup'][name]:.2f}x)"
+            cells.append(f"{cell:>24}")
+        typer.echo(f"{row['year']}-Day{row['day']:02d}  " + "".join(cells))
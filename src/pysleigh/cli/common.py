@@ -0,0 +1,23 @@
+import typer
+from pysleigh.modules.profiler import AoCProfiler
+
+
+def echo_profile(results: dict):
+    if not results:
+        typer.secho("Profiling failed.", fg=typer.colors.RED)
+        return
+
+    for phase in AoCProfiler.PHASES:
+        stats = results[phase]
+        typer.secho(
+            f"{phase}: {stats['time']:.6f}s under cProfile, "
+            f"{stats['samples']} stack sample(s) → {stats['prof']}",
+            fg=typer.colors.CYAN,
+        )
+        typer.echo(f"  {'cumtime':>10} {'tottime':>10} {'calls':>8}  function")
+        for row in stats["hotspots"]:
+            typer.echo(
+                f"  {row['cumtime']:>10.6f} {row['tottime']:>10.6f} "
+                f"{row['calls']:>8}  {row['function']}"
+            )
+    typer.secho(f"Collapsed stacks: {results['collapsed']}", fg=typer.colors.CYAN)
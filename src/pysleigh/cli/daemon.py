@@ -0,0 +1,65 @@
+import typer
+from pysleigh.modules.daemon import AoCDaemon
+from pysleigh.utilities.config import AoCConfig
+from pysleigh.utilities.daemon_client import AoCDaemonClient, get_socket_path
+
+daemon_app = typer.Typer()
+
+
+def _client(socket: str | None) -> AoCDaemonClient:
+    return AoCDaemonClient(socket or get_socket_path(AoCConfig()))
+
+
+@daemon_app.command("start")
+def daemon_start(
+    socket: str = typer.Option(
+        None, "--socket", help="Socket to listen on (default: [daemon].socket)"
+    ),
+):
+    """Keep a warm runner in the foreground for `pysleigh-client`."""
+    try:
+        daemon = AoCDaemon(socket_path=socket)
+        daemon.bind()
+    except Exception as e:
+        typer.secho(f"[Error] {e}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+
+    typer.secho(
+        f"pysleigh daemon listening on {daemon.socket_path}", fg=typer.colors.GREEN
+    )
+    typer.echo("Run `pysleigh-client run --year Y --day D`. Ctrl+C to stop.")
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        typer.echo("Stopped.")
+
+
+@daemon_app.command("status")
+def daemon_status(
+    socket: str = typer.Option(None, "--socket", help="Daemon socket"),
+):
+    try:
+        status = _client(socket).ping()
+    except Exception as e:
+        typer.secho(f"[Error] {e}", fg=typer.colors.RED)
+        return
+    if status is None:
+        typer.secho("No pysleigh daemon is running.", fg=typer.colors.YELLOW)
+        return
+    typer.secho(
+        f"pysleigh daemon {status['pid']} on {status['socket']}: up "
+        f"{status['uptime']:.0f}s, {status['requests']} request(s) served, "
+        f"{status['modules']} solution module(s) loaded",
+        fg=typer.colors.GREEN,
+    )
+
+
+@daemon_app.command("stop")
+def daemon_stop(
+    socket: str = typer.Option(None, "--socket", help="Daemon socket"),
+):
+    try:
+        _client(socket).request("shutdown")
+        typer.secho("pysleigh daemon stopped.", fg=typer.colors.GREEN)
+    except Exception as e:
+        typer.secho(f"[Error] {e}", fg=typer.colors.RED)
@@ -1,8 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import typer
 from pysleigh.modules.input import AoCInput
 from pysleigh.modules.article import AoCArticle
 from pysleigh.modules.answers import AoCAnswers
 from pysleigh.utilities.date import AoCDate
+from pysleigh.utilities.circuit import AoCCircuitOpenError
 
 fetch_app = typer.Typer()
 
@@ -17,7 +20,13 @@ def fetch_input(
         False, "--overwrite", help="Force re-download of the input file"
     ),
     show: bool = typer.Option(False, "--show", help="Print the puzzle input to stdout"),
+    jobs: int = typer.Option(
+        4, help="Concurrent downloads when fetching a whole year (--year only)."
+    ),
 ):
+    if year is not None and day is None:
+        _fetch_year_inputs(year, overwrite, jobs)
+        return
     try:
         if year is not None and day is not None:
             date = AoCDate(year, day)
@@ -25,8 +34,6 @@ def fetch_input(
             date = AoCDate(*AoCDate._compute_max_date())
         elif year is None:
             date = AoCDate(AoCDate._compute_max_date()[0], day)
-        elif day is None:
-            date = AoCDate(year, AoCDate._compute_max_date()[1])
 
         aoc_input = AoCInput(aoc_date=date)
         aoc_input.write_input(overwrite=overwrite)
@@ -38,6 +45,40 @@ def fetch_input(
         typer.secho(f"[Error] {e}", fg=typer.colors.RED)
 
 
+def _fetch_year_inputs(year: int, overwrite: bool, jobs: int):
+    def fetch_day(day: int) -> bool:
+        try:
+            aoc_input = AoCInput(aoc_date=AoCDate(year, day))
+            aoc_input.write_input(overwrite=overwrite)
+            return aoc_input.check_local()
+        except AoCCircuitOpenError:
+            raise
+        except Exception as e:
+            typer.secho(
+                f"[Error] Failed to fetch Day {day:02d}: {e}", fg=typer.colors.RED
+            )
+            return False
+
+    days = AoCDate.released_days(year)
+    try:
+        with ThreadPoolExecutor(max_workers=max(jobs, 1)) as pool:
+            fetched = list(pool.map(fetch_day, days))
+    except AoCCircuitOpenError as e:
+        typer.secho(f"[Error] Stopping early: {e}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+
+    missing = [day for day, ok in zip(days, fetched) if not ok]
+    typer.secho(
+        f"Inputs available for {len(days) - len(missing)}/{len(days)} days of {year}",
+        fg=typer.colors.GREEN if not missing else typer.colors.YELLOW,
+    )
+    if missing:
+        typer.secho(
+            "Missing: " + ", ".join(f"Day {day:02d}" for day in missing),
+            fg=typer.colors.YELLOW,
+        )
+
+
 @fetch_app.command("article")
 def fetch_article(
     year: int = typer.Option(
@@ -1,3 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
 import typer
 from pysleigh.utilities.date import AoCDate
 from pysleigh.modules.article import AoCArticle
@@ -5,6 +8,7 @@ from pysleigh.modules.input import AoCInput
 from pysleigh.modules.generate_solution import AoCSolutionGenerator
 from pysleigh.modules.answers import AoCAnswers
 from pysleigh.modules.generate_test import AoCTestGenerator
+from pysleigh.utilities.circuit import AoCCircuitOpenError
 
 prep_app = typer.Typer(
     help="Prep your workspace by fetching input, article, and generating solution."
@@ -20,12 +24,29 @@ def prep_solution(
     overwrite: bool = typer.Option(
         False, "--overwrite", help="Overwrite existing files"
     ),
+    jobs: int = typer.Option(4, help="Days to prep concurrently."),
 ):
     if day:
         _prep_day(year, day, overwrite)
     else:
-        for d in range(1, 26):
-            _prep_day(year, d, overwrite)
+        _prep_days(_prep_day, year, overwrite, jobs)
+
+
+def _prep_days(
+    prep: Callable[[int, int, bool], None], year: int, overwrite: bool, jobs: int
+):
+    """
+    Prep every released day of a year on a thread pool. Requests still go
+    through the shared session's rate limiter, so jobs only overlaps the
+    waiting, not the request rate.
+    """
+    days = AoCDate.released_days(year)
+    try:
+        with ThreadPoolExecutor(max_workers=max(jobs, 1)) as pool:
+            list(pool.map(lambda d: prep(year, d, overwrite), days))
+    except AoCCircuitOpenError as e:
+        typer.secho(f"[Error] Stopping early: {e}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
 
 
 def _prep_day(year: int, day: int, overwrite: bool):
@@ -43,6 +64,8 @@ def _prep_day(year: int, day: int, overwrite: bool):
         generator.write_solution(overwrite=overwrite)
 
         typer.secho(f"✅ Ready: {year}-Day{day:02d}", fg=typer.colors.GREEN)
+    except AoCCircuitOpenError:
+        raise
     except Exception as e:
         typer.secho(f"[Error] Failed to prep Day {day:02d}: {e}", fg=typer.colors.RED)
 
@@ -56,12 +79,12 @@ def prep_test(
     overwrite: bool = typer.Option(
         False, "--overwrite", help="Overwrite existing files"
     ),
+    jobs: int = typer.Option(4, help="Days to prep concurrently."),
 ):
     if day:
         _prep_test_day(year, day, overwrite)
     else:
-        for d in range(1, 26):
-            _prep_test_day(year, d, overwrite)
+        _prep_days(_prep_test_day, year, overwrite, jobs)
 
 
 def _prep_test_day(year: int, day: int, overwrite: bool):
@@ -78,6 +101,8 @@ def _prep_test_day(year: int, day: int, overwrite: bool):
         test_gen.write_test(overwrite=overwrite)
 
         typer.secho(f"✅ Test ready: {year}-Day{day:02d}", fg=typer.colors.GREEN)
+    except AoCCircuitOpenError:
+        raise
     except Exception as e:
         typer.secho(
             f"[Error] Failed to prep test for Day {day:02d}: {e}", fg=typer.colors.RED
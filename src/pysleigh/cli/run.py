@@ -1,7 +1,10 @@
 import typer
 from pysleigh.modules.run_solution import AoCRunner
 from pysleigh.modules.run_test import AoCTestRunner
+from pysleigh.modules.profiler import AoCProfiler
+from pysleigh.modules.watch import AoCWatchRunner
 from pysleigh.utilities.date import AoCDate
+from pysleigh.cli.common import echo_profile
 
 run_app = typer.Typer()
 
@@ -13,6 +16,34 @@ def run_solution(
     ),
     day: int = typer.Option(None, help="Day of the puzzle (default: latest available)"),
     test: bool = typer.Option(False, "--test", help="Also run tests after solution"),
+    profile: bool = typer.Option(
+        False, "--profile", help="Profile parse, part 1 and part 2 separately"
+    ),
+    profile_dir: str = typer.Option(
+        None, help="Directory for .prof and collapsed-stack files"
+    ),
+    top: int = typer.Option(15, help="Number of hotspots to print when profiling"),
+    timeout: float = typer.Option(
+        None, help="Kill the solution if the whole day takes longer (seconds)."
+    ),
+    part_timeout: float = typer.Option(
+        None, help="Kill the solution if parse or a part takes longer (seconds)."
+    ),
+    in_process: bool = typer.Option(
+        None,
+        "--in-process/--subprocess",
+        help="Run --test in this interpreter (default: [tests].in_process).",
+    ),
+    watch: bool = typer.Option(
+        False,
+        "--watch",
+        help="Rerun on every change to the solution, its helpers, the input "
+        "or (with --test) the tests. Runs in this interpreter; timeouts and "
+        "--profile do not apply.",
+    ),
+    debounce: float = typer.Option(
+        0.2, help="With --watch, wait this long for a burst of saves to settle."
+    ),
 ):
     try:
         if year is not None and day is not None:
@@ -24,10 +55,36 @@ def run_solution(
         elif day is None:
             date = AoCDate(year, AoCDate._compute_max_date()[1])
 
-        runner = AoCRunner(aoc_date=date)
+        if watch:
+            watcher = AoCWatchRunner(aoc_date=date, test=test, debounce=debounce)
+            typer.secho(
+                f"Watching {watcher.module_name}. Ctrl+C to stop.",
+                fg=typer.colors.CYAN,
+            )
+            try:
+                watcher.watch(echo_watch_result)
+            except KeyboardInterrupt:
+                typer.echo("Stopped watching.")
+            return
+
+        runner = AoCRunner(aoc_date=date, timeout=timeout, part_timeout=part_timeout)
         results = runner.run_solution()
 
-        if results:
+        if results.get("status") == "timeout":
+            typer.secho(
+                f"⏱ Timed out in {results.get('phase', 'setup')}.",
+                fg=typer.colors.RED,
+            )
+        elif results.get("status") == "error":
+            typer.secho(
+                f"[Error] Solution worker failed: {results.get('error', 'crashed')}",
+                fg=typer.colors.RED,
+            )
+        elif results:
+            typer.secho(
+                f"Parse: took {results['time_parse']:.6f}s",
+                fg=typer.colors.GREEN,
+            )
             typer.secho(
                 f"Part 1: {results['part1']} (took {results['time_part1']:.6f}s)",
                 fg=typer.colors.GREEN,
@@ -36,9 +93,14 @@ def run_solution(
                 f"Part 2: {results['part2']} (took {results['time_part2']:.6f}s)",
                 fg=typer.colors.GREEN,
             )
+            typer.secho(f"Total: {results['time_total']:.6f}s", fg=typer.colors.GREEN)
+
+        if profile:
+            profiler = AoCProfiler(aoc_date=date, output_dir=profile_dir, top=top)
+            echo_profile(profiler.profile())
 
         if test:
-            passed = runner.run_tests()
+            passed = runner.run_tests(in_process=in_process)
             if passed:
                 typer.secho("✅ Tests passed.", fg=typer.colors.BLUE)
             else:
@@ -48,21 +110,83 @@ def run_solution(
         typer.secho(f"[Error] {e}", fg=typer.colors.RED)
 
 
+def _format_delta(stats: dict) -> str:
+    if stats.get("delta") is None:
+        return ""
+    text = f", {stats['delta']:+.6f}s"
+    if stats.get("previous"):
+        text += f" / {stats['delta'] / stats['previous']:+.0%}"
+    return text
+
+
+def echo_watch_result(result: dict):
+    if result["changed"]:
+        typer.secho(f"\n↻ {', '.join(result['changed'])}", fg=typer.colors.CYAN)
+    if result["reloaded"]:
+        typer.echo(f"Reloaded {', '.join(result['reloaded'])}")
+    if result["error"]:
+        typer.secho(result["error"].rstrip(), fg=typer.colors.RED)
+        return
+
+    phases = result["phases"]
+    if "parse" in phases:
+        typer.secho(
+            f"Parse: took {phases['parse']['time']:.6f}s"
+            f"{_format_delta(phases['parse'])}",
+            fg=typer.colors.GREEN,
+        )
+    for phase, label in (("part1", "Part 1"), ("part2", "Part 2")):
+        stats = phases.get(phase)
+        if not stats:
+            continue
+        if stats["rerun"]:
+            typer.secho(
+                f"{label}: {stats['answer']} (took {stats['time']:.6f}s"
+                f"{_format_delta(stats)})",
+                fg=typer.colors.GREEN,
+            )
+        else:
+            typer.echo(f"{label}: {stats['answer']} (unchanged)")
+    if result["changed"] and not phases and result["tests_passed"] is None:
+        typer.echo("No change to what the solution computes.")
+
+    if result["tests_passed"] is not None:
+        if result["tests_passed"]:
+            typer.secho("✅ Tests passed.", fg=typer.colors.BLUE)
+        else:
+            typer.secho("❌ Some tests failed.", fg=typer.colors.RED)
+
+
 @run_app.command("test")
 def run_test(
     year: int = typer.Option(None, help="Year of the puzzle"),
     day: int = typer.Option(None, help="Day of the puzzle"),
+    in_process: bool = typer.Option(
+        None,
+        "--in-process/--subprocess",
+        help="Run pytest in this interpreter instead of spawning it "
+        "(default: [tests].in_process).",
+    ),
+    jobs: int = typer.Option(
+        None, help="Shard a year's or all test files across N pytest processes."
+    ),
+    changed: bool = typer.Option(
+        False,
+        "--changed",
+        help="Only rerun tests whose solution, helpers, input or answers changed "
+        "since they last passed.",
+    ),
 ):
     try:
         if year and day:
             aoc_date = AoCDate(year, day)
-            runner = AoCTestRunner(aoc_date)
+            runner = AoCTestRunner(aoc_date, in_process=in_process)
             passed = runner.run_specific_test()
         elif year:
-            runner = AoCTestRunner()
+            runner = AoCTestRunner(in_process=in_process, jobs=jobs, changed=changed)
             passed = runner.run_year_tests(year)
         else:
-            runner = AoCTestRunner()
+            runner = AoCTestRunner(in_process=in_process, jobs=jobs, changed=changed)
             passed = runner.run_all_tests()
 
         if passed:
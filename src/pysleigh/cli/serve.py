@@ -0,0 +1,35 @@
+import typer
+from pysleigh.modules.fixtures import AoCFixtureServer
+from pysleigh.utilities.session import AoCSession
+
+
+def serve_fixtures(
+    path: str = typer.Option(
+        None, "--path", help="Fixture directory (defaults to [fixtures].path)"
+    ),
+    host: str = typer.Option("127.0.0.1", "--host", help="Address to bind"),
+    port: int = typer.Option(8000, "--port", help="Port to listen on"),
+    record: bool = typer.Option(
+        False, "--record", help="Fetch and save fixtures missing locally"
+    ),
+    upstream: str = typer.Option(
+        AoCSession.DEFAULT_BASE_URL, "--upstream", help="Site to record from"
+    ),
+):
+    """Serve recorded pages and inputs as a local stand-in for the AoC site."""
+    try:
+        server = AoCFixtureServer(
+            path=path, host=host, port=port, upstream=upstream if record else None
+        )
+    except Exception as e:
+        typer.secho(f"[Error] {e}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+
+    typer.secho(
+        f"Serving fixtures from {server.root} at {server.url}", fg=typer.colors.GREEN
+    )
+    typer.echo(f'Set [session] base_url = "{server.url}" to use it. Ctrl+C to stop.')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        typer.echo("Stopped.")
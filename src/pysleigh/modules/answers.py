@@ -5,7 +5,9 @@ from bs4 import BeautifulSoup
 from pysleigh.utilities.config import AoCConfig
 from pysleigh.utilities.logger import AoCLogger
 from pysleigh.utilities.date import AoCDate
+from pysleigh.modules.page import AoCPuzzlePage
 from pysleigh.utilities.session import AoCSession
+from pysleigh.utilities.async_session import AoCAsyncSession
 
 
 class AoCAnswers:
@@ -24,7 +26,8 @@ class AoCAnswers:
     def _format_url(self) -> str:
         year = self.aoc_date.year
         day = self.aoc_date.day
-        return f"https://adventofcode.com/{year}/day/{day}"
+        base_url = AoCSession.get_base_url(self.config)
+        return f"{base_url}/{year}/day/{day}"
 
     def get_answers_path(self) -> Path:
         answer_cfg = self.config.config.get("answers", {})
@@ -42,18 +45,35 @@ class AoCAnswers:
             self.logger.info(f"Local answer file not found at {self.answers_path}")
             return False
 
-    def fetch_answers(self) -> dict:
-        session = AoCSession(self.config)
-        response = session.get(self.url)
-        if response.status_code != 200:
-            self.logger.warning(f"Failed to fetch answers: {response.status_code}")
+    def fetch_answers(self, refresh: bool = False) -> dict:
+        page = AoCPuzzlePage(self.aoc_date, self.config)
+        html = page.get_html(refresh=refresh, complete=self.is_complete)
+        return self._answers_from_html(html, page)
+
+    async def fetch_answers_async(
+        self, refresh: bool = False, session: AoCAsyncSession | None = None
+    ) -> dict:
+        page = AoCPuzzlePage(self.aoc_date, self.config)
+        html = await page.get_html_async(
+            refresh=refresh, complete=self.is_complete, session=session
+        )
+        return self._answers_from_html(html, page)
+
+    def _answers_from_html(self, html: str, page: AoCPuzzlePage) -> dict:
+        if not html:
+            self.logger.warning(f"Failed to fetch answers: {page.status_code}")
             return {}
 
         self.logger.info(
             f"Fetched HTML for {self.aoc_date.year} Day {self.aoc_date.day:02d}"
         )
-        html = response.text
+        return self.extract_answers(html)
+
+    def is_complete(self, html: str) -> bool:
+        answers = self.extract_answers(html)
+        return answers["part1"] is not None and answers["part2"] is not None
 
+    def extract_answers(self, html: str) -> dict:
         answers = re.findall(
             r"<p>Your puzzle answer was <code>(.*?)</code>\.</p>", html
         )
@@ -91,6 +111,13 @@ class AoCAnswers:
             return {}
 
     def write_answers(self, answers: dict, overwrite: bool = False) -> None:
+        if answers.get("part1") is None or answers.get("part2") is None:
+            # A missing answer written now would never be fetched again
+            self.logger.warning(
+                f"Answers for {self.aoc_date.year} Day {self.aoc_date.day:02d} "
+                "are incomplete. Not writing them."
+            )
+            return
         if self.check_local() and not overwrite:
             self.logger.info(
                 "Answer file exists. Skipping write (use overwrite=True to force)."
@@ -6,7 +6,9 @@ from bs4 import BeautifulSoup
 from pysleigh.utilities.config import AoCConfig
 from pysleigh.utilities.logger import AoCLogger
 from pysleigh.utilities.date import AoCDate
+from pysleigh.modules.page import AoCPuzzlePage
 from pysleigh.utilities.session import AoCSession
+from pysleigh.utilities.async_session import AoCAsyncSession
 
 
 class AoCArticle:
@@ -25,7 +27,8 @@ class AoCArticle:
     def _format_url(self) -> str:
         year = self.aoc_date.year
         day = self.aoc_date.day
-        return f"https://adventofcode.com/{year}/day/{day}"
+        base_url = AoCSession.get_base_url(self.config)
+        return f"{base_url}/{year}/day/{day}"
 
     def get_article_path(self) -> Path:
         article_cfg = self.config.config.get("articles", {})
@@ -43,20 +46,36 @@ class AoCArticle:
             self.logger.info(f"Local article file not found at {self.article_path}")
             return False
 
-    def fetch_article(self) -> str:
-        session = AoCSession(self.config)
-        response = session.get(self.url)
-        if response.status_code == 200:
+    def fetch_article(self, refresh: bool = False) -> str:
+        page = AoCPuzzlePage(self.aoc_date, self.config)
+        html = page.get_html(refresh=refresh, complete=self.is_complete)
+        return self._article_from_html(html, page)
+
+    async def fetch_article_async(
+        self, refresh: bool = False, session: AoCAsyncSession | None = None
+    ) -> str:
+        page = AoCPuzzlePage(self.aoc_date, self.config)
+        html = await page.get_html_async(
+            refresh=refresh, complete=self.is_complete, session=session
+        )
+        return self._article_from_html(html, page)
+
+    def _article_from_html(self, html: str, page: AoCPuzzlePage) -> str:
+        if html:
             self.logger.info(
                 f"Fetched article for {self.aoc_date.year} Day {self.aoc_date.day:02d}"
             )
-            html = response.text
             article_content = self.format_article(html)
             return article_content
         else:
-            self.logger.warning(f"Failed to fetch article: {response.status_code}")
+            self.logger.warning(f"Failed to fetch article: {page.status_code}")
             return ""
 
+    @staticmethod
+    def is_complete(html: str) -> bool:
+        # Part two only appears once part one is solved
+        return html.count("<article") >= 2
+
     def format_article(self, html: str) -> str:
         soup = BeautifulSoup(html, "html.parser")
         title = self.__extract_title(soup)
@@ -108,8 +127,14 @@ class AoCArticle:
             else:
                 self.logger.info(f"Overwriting existing article at {self.article_path}")
 
-        article_content = self.fetch_article()
-        if article_content:
+        article_content = self.fetch_article(refresh=overwrite)
+        if (
+            article_content
+            and self.article_path.exists()
+            and article_content == self.read_local()
+        ):
+            self.logger.info(f"Article at {self.article_path} is unchanged.")
+        elif article_content:
             self.article_path.parent.mkdir(parents=True, exist_ok=True)
             with self.article_path.open("w") as file:
                 file.write(article_content)
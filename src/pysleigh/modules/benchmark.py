@@ -1,27 +1,65 @@
+import contextlib
 import sys
 import time
-from statistics import mean
+import tracemalloc
+from math import sqrt
+from statistics import mean, median, quantiles, stdev
 from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
 import importlib
 
 from pysleigh.utilities.config import AoCConfig
 from pysleigh.utilities.date import AoCDate
 from pysleigh.utilities.logger import AoCLogger
+from pysleigh.utilities.process import AoCProcessPool
 from pysleigh.modules.answers import AoCAnswers
+from pysleigh.modules.input import AoCInput
+from pysleigh.modules.history import AoCBenchmarkHistory
+from pysleigh.modules.verification import AoCVerificationCache
 
 
 class AoCBenchmark:
     logger = AoCLogger().get_logger()
+    DEFAULT_MAX_RUNS = 1000
+    OUTLIER_THRESHOLD = 3.5
+    PHASES = ("parse", "part1", "part2")
+    MEMORY_TOP = 10
 
     def __init__(
         self,
         aoc_date: AoCDate | None = None,
         config: AoCConfig | None = None,
         runs: int = 5,
+        warmup: int = 1,
+        max_runs: int | None = None,
+        target_rse: float | None = None,
+        time_budget: float | None = None,
+        jobs: int | None = None,
+        timeout: float | None = None,
+        pin_cpus: bool = False,
+        record: bool = False,
+        memory: bool = False,
+        part_timeout: float | None = None,
+        reverify: bool = False,
     ):
         self.aoc_date = aoc_date
         self.config = config or AoCConfig()
-        self.runs = runs
+        self.runs = max(runs, 1)
+        self.warmup = max(warmup, 0)
+        self.target_rse = target_rse
+        self.time_budget = time_budget
+        self.max_runs = max(max_runs or self.DEFAULT_MAX_RUNS, self.runs)
+        self.jobs = jobs
+        timeouts_cfg = self.config.config.get("timeouts", {})
+        self.timeout = timeout if timeout is not None else timeouts_cfg.get("day")
+        self.part_timeout = (
+            part_timeout if part_timeout is not None else timeouts_cfg.get("part")
+        )
+        self.pin_cpus = pin_cpus
+        self.history = AoCBenchmarkHistory(self.config) if record else None
+        self.memory = memory
+        self.reverify = reverify
+        self.verification = AoCVerificationCache(self.config)
 
         # Ensure AoC solutions are in sys.path
         sol_path_str = self.config.config.get("solutions", {}).get("path", "")
@@ -39,78 +77,355 @@ class AoCBenchmark:
         fmt = input_cfg.get("format", "year_{year}/input_{year}_day_{day:02d}.txt")
         return str(base_path.expanduser().joinpath(fmt.format(year=year, day=day)))
 
+    @contextlib.contextmanager
+    def _working_input(self, year: int, day: int) -> Iterator[str]:
+        """The input path for one measurement; see AoCInput.working_copy."""
+        if self.config.config.get("inputs", {}).get("store"):
+            with AoCInput(AoCDate(year, day), self.config).working_copy() as path:
+                yield str(path)
+        else:
+            yield self._get_input_path(year, day)
+
+    @property
+    def adaptive(self) -> bool:
+        return self.target_rse is not None or self.time_budget is not None
+
+    @classmethod
+    def summarize(cls, samples: List[float]) -> dict:
+        """
+        Summarize timing samples, rejecting outliers by modified z-score.
+
+        Samples whose distance from the median exceeds OUTLIER_THRESHOLD
+        scaled MADs are dropped before the mean, stddev and RSE are computed.
+
+        Args:
+            samples (List[float]): Raw timings in seconds.
+
+        Returns:
+            dict: mean, min, median, p95, stddev, mad, rse, samples and outliers.
+        """
+        med = median(samples)
+        mad = median(abs(s - med) for s in samples)
+        if mad > 0:
+            kept = [
+                s
+                for s in samples
+                if 0.6745 * abs(s - med) / mad <= cls.OUTLIER_THRESHOLD
+            ]
+        else:
+            kept = list(samples)
+
+        avg = mean(kept)
+        spread = stdev(kept) if len(kept) > 1 else 0.0
+        p95 = (
+            quantiles(kept, n=20, method="inclusive")[18] if len(kept) > 1 else kept[0]
+        )
+        rse = spread / sqrt(len(kept)) / avg if avg > 0 else 0.0
+
+        return {
+            "mean": avg,
+            "min": min(kept),
+            "median": median(kept),
+            "p95": p95,
+            "stddev": spread,
+            "mad": mad,
+            "rse": rse,
+            "samples": len(samples),
+            "outliers": len(samples) - len(kept),
+        }
+
+    def _should_continue(self, times: List[List[float]], started: float) -> bool:
+        count = len(times[0])
+        if count < self.runs:
+            return True
+        if not self.adaptive or count >= self.max_runs:
+            return False
+        if (
+            self.time_budget is not None
+            and time.perf_counter() - started >= self.time_budget
+        ):
+            return False
+        if self.target_rse is None:
+            return True
+        return any(self.summarize(t)["rse"] > self.target_rse for t in times)
+
+    @property
+    def isolated(self) -> bool:
+        # Time budgets can only be enforced on a killable child process
+        return bool(self.timeout or self.part_timeout)
+
     def benchmark_day(self, year: int, day: int) -> dict:
+        if self.isolated and not AoCProcessPool.in_worker():
+            result = self._measure_in_workers([(year, day)])[0]
+        else:
+            result = self._measure_day(year, day)
+        if self.history and result:
+            self.history.append([result])
+        return result
+
+    def _measure_day(self, year: int, day: int) -> dict:
+        with self._working_input(year, day) as input_path:
+            return self._measure_day_with(year, day, input_path)
+
+    def _measure_day_with(self, year: int, day: int, input_path: str) -> dict:
         module_name = self._get_module_name(year, day)
-        input_path = self._get_input_path(year, day)
         aoc_date = AoCDate(year, day)
 
         try:
             mod = importlib.import_module(module_name)
-            times_part1 = []
-            times_part2 = []
+            times: Dict[str, List[float]] = {phase: [] for phase in self.PHASES}
 
-            # Always instantiate fresh solutions
             expected = AoCAnswers(aoc_date, self.config).get_or_fetch()
-            first_solution = mod.Solution(input_path)
-
-            actual1 = str(first_solution.part1())
-            actual2 = str(first_solution.part2())
-
-            if actual1 != str(expected.get("part1")) or actual2 != str(
-                expected.get("part2")
-            ):
+            key = self.verification.fingerprint(
+                getattr(mod, "__file__", None), input_path, expected
+            )
+            verified_cached = not self.reverify and self.verification.is_verified(key)
+            if verified_cached:
+                self.logger.info(
+                    f"{year}-Day{day:02d} unchanged since last verified. "
+                    "Skipping verification."
+                )
+            elif not self._verify(mod, input_path, expected):
                 self.logger.error(
                     f"Mismatch on {year}-Day{day:02d}. Skipping benchmark."
                 )
                 return {}
+            else:
+                self.verification.record(key, year, day)
 
-            # Benchmark 1st run
-            t1 = time.perf_counter()
-            first_solution.part1()
-            times_part1.append(time.perf_counter() - t1)
-
-            t2 = time.perf_counter()
-            first_solution.part2()
-            times_part2.append(time.perf_counter() - t2)
+            for _ in range(self.warmup):
+                AoCProcessPool.report_phase("parse")
+                solution = mod.Solution(input_path)
+                AoCProcessPool.report_phase("part1")
+                solution.part1()
+                AoCProcessPool.report_phase("part2")
+                solution.part2()
 
-            for _ in range(self.runs - 1):
+            started = time.perf_counter()
+            while self._should_continue(list(times.values()), started):
+                AoCProcessPool.report_phase("parse")
+                t0 = time.perf_counter()
                 solution = mod.Solution(input_path)
+                t0_done = time.perf_counter()
+                times["parse"].append(t0_done - t0)
 
+                AoCProcessPool.report_phase("part1")
                 t1 = time.perf_counter()
                 solution.part1()
                 t1_done = time.perf_counter()
-                times_part1.append(t1_done - t1)
+                times["part1"].append(t1_done - t1)
 
+                AoCProcessPool.report_phase("part2")
                 t2 = time.perf_counter()
                 solution.part2()
                 t2_done = time.perf_counter()
-                times_part2.append(t2_done - t2)
+                times["part2"].append(t2_done - t2)
 
-            avg1 = mean(times_part1)
-            avg2 = mean(times_part2)
+            stats = {phase: self.summarize(times[phase]) for phase in self.PHASES}
+            stats["total"] = self.summarize([sum(run) for run in zip(*times.values())])
+            runs = len(times["part1"])
 
             self.logger.info(
-                f"{year}-Day{day:02d} Benchmark Passed over {self.runs} runs: Part1 {avg1:.6f}s, Part2 {avg2:.6f}s"
+                f"{year}-Day{day:02d} Benchmark Passed over {runs} runs: "
+                f"Parse median {stats['parse']['median']:.6f}s, "
+                f"Part1 median {stats['part1']['median']:.6f}s, "
+                f"Part2 median {stats['part2']['median']:.6f}s, "
+                f"Total median {stats['total']['median']:.6f}s"
             )
-            return {
+            result = {
                 "year": year,
                 "day": day,
-                "avg_part1": round(avg1, 6),
-                "avg_part2": round(avg2, 6),
-                "runs": self.runs,
+                "avg_parse": round(stats["parse"]["mean"], 6),
+                "avg_part1": round(stats["part1"]["mean"], 6),
+                "avg_part2": round(stats["part2"]["mean"], 6),
+                "avg_total": round(stats["total"]["mean"], 6),
+                "runs": runs,
+                "warmup": self.warmup,
+                "verification": "cached" if verified_cached else "run",
+                **stats,
             }
+            if self.memory:
+                # Profiling runs in its own pool, which times each part itself
+                AoCProcessPool.report_phase("memory")
+                result["memory"] = self._profile_memory(year, day)
+            return result
 
         except Exception as e:
             self.logger.error(f"Benchmark failed for {year}-Day{day:02d}: {e}")
             return {}
 
-    def benchmark_year(self, year: int):
-        for day in range(1, 26):
-            self.benchmark_day(year, day)
+    @staticmethod
+    def _verify(mod, input_path: str, expected: dict) -> bool:
+        # Verify on a throwaway instance so its warm state never leaks into
+        # the timed samples.
+        AoCProcessPool.report_phase("parse")
+        check = mod.Solution(input_path)
+        AoCProcessPool.report_phase("part1")
+        actual1 = str(check.part1())
+        AoCProcessPool.report_phase("part2")
+        actual2 = str(check.part2())
+        return actual1 == str(expected.get("part1")) and actual2 == str(
+            expected.get("part2")
+        )
+
+    def _profile_memory(self, year: int, day: int) -> dict:
+        # A fresh process keeps the timing runs' heap out of the RSS figures
+        pool = AoCProcessPool(
+            jobs=1, timeout=self.timeout, phase_timeout=self.part_timeout
+        )
+        memory = pool.map(self._measure_memory, [{"year": year, "day": day}])[0]
+        if memory.get("status"):
+            self.logger.error(
+                f"Memory profiling {memory['status']} for {year}-Day{day:02d}"
+            )
+        return memory
+
+    @staticmethod
+    def _reset_peak_rss() -> bool:
+        # Linux lets a process reset its own VmHWM high-water mark
+        try:
+            Path("/proc/self/clear_refs").write_text("5")
+            return True
+        except OSError:
+            return False
+
+    @staticmethod
+    def _peak_rss() -> int | None:
+        status = Path("/proc/self/status")
+        if status.exists():
+            for line in status.read_text().splitlines():
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+        try:
+            import resource
+        except ImportError:
+            return None
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+    def _run_phase(self, mod, input_path: str, phase: str, solution):
+        if phase == "parse":
+            return mod.Solution(input_path)
+        getattr(solution, phase)()
+        return solution
+
+    def _measure_memory(self, year: int, day: int) -> dict:
+        """
+        Measure peak RSS and top tracemalloc allocation sites per phase.
+
+        Runs two passes on fresh Solution instances: one without tracing for
+        RSS, so tracemalloc's own overhead does not inflate it, and one traced
+        pass that diffs snapshots around each phase.
+        """
+        with self._working_input(year, day) as input_path:
+            return self._measure_memory_with(year, day, input_path)
+
+    @staticmethod
+    def _allocation_filters(mod) -> List[tracemalloc.Filter]:
+        """Keep only allocations made from the solutions tree the module lives in."""
+        # year_YYYY/solution_YYYY_day_DD.py -> solutions root
+        root = Path(mod.__file__).parent.parent
+        roots = {str(root), str(root.resolve())}
+        return [tracemalloc.Filter(True, str(Path(r) / "*")) for r in sorted(roots)]
+
+    def _measure_memory_with(self, year: int, day: int, input_path: str) -> dict:
+        mod = importlib.import_module(self._get_module_name(year, day))
+        memory: Dict[str, dict] = {phase: {} for phase in self.PHASES}
+
+        scoped = True
+        solution = None
+        for phase in self.PHASES:
+            scoped = self._reset_peak_rss() and scoped
+            AoCProcessPool.report_phase(phase)
+            solution = self._run_phase(mod, input_path, phase, solution)
+            memory[phase]["peak_rss"] = self._peak_rss()
+
+        ignore = self._allocation_filters(mod)
+        tracemalloc.start()
+        solution = None
+        try:
+            # Prime the filter machinery so its caches are not reported
+            tracemalloc.take_snapshot().filter_traces(ignore).compare_to(
+                tracemalloc.take_snapshot().filter_traces(ignore), "lineno"
+            )
+            for phase in self.PHASES:
+                AoCProcessPool.report_phase(phase)
+                tracemalloc.reset_peak()
+                current, _ = tracemalloc.get_traced_memory()
+                before = tracemalloc.take_snapshot().filter_traces(ignore)
+                solution = self._run_phase(mod, input_path, phase, solution)
+                _, peak = tracemalloc.get_traced_memory()
+                after = tracemalloc.take_snapshot().filter_traces(ignore)
+
+                memory[phase]["peak_traced"] = peak - current
+                memory[phase]["top"] = [
+                    {
+                        "file": diff.traceback[0].filename,
+                        "line": diff.traceback[0].lineno,
+                        "size": diff.size_diff,
+                        "count": diff.count_diff,
+                    }
+                    for diff in after.compare_to(before, "lineno")[: self.MEMORY_TOP]
+                    if diff.size_diff > 0
+                ]
+        finally:
+            tracemalloc.stop()
+
+        # Without a resettable high-water mark, peaks are cumulative per process
+        memory["peak_rss_scope"] = "phase" if scoped else "process"
+        return memory
+
+    def benchmark_days(self, days: List[Tuple[int, int]]) -> List[dict]:
+        """
+        Benchmark several days, in isolated worker processes when jobs or a
+        timeout is set.
+
+        Args:
+            days (List[Tuple[int, int]]): (year, day) pairs to benchmark.
+
+        Returns:
+            List[dict]: One benchmark_day result per pair, in the same order.
+        """
+        if not (self.jobs or self.isolated):
+            results = [self._measure_day(year, day) for year, day in days]
+        else:
+            results = self._measure_in_workers(days)
+
+        # Keep failed days visible in sweep reports
+        results = [
+            result or {"year": year, "day": day, "status": "failed"}
+            for result, (year, day) in zip(results, days)
+        ]
+        if self.history:
+            self.history.append(results)
+        return results
+
+    def _measure_in_workers(self, days: List[Tuple[int, int]]) -> List[dict]:
+        self.logger.info(
+            f"Benchmarking {len(days)} days with {self.jobs or 1} worker(s)"
+            + (f", {self.timeout}s timeout per day" if self.timeout else "")
+        )
+        pool = AoCProcessPool(
+            jobs=self.jobs or 1,
+            timeout=self.timeout,
+            pin_cpus=self.pin_cpus,
+            phase_timeout=self.part_timeout,
+            untimed_phases=("memory",),
+        )
+        tasks = [{"year": year, "day": day} for year, day in days]
+        return pool.map(self._measure_day, tasks)
+
+    def benchmark_year(self, year: int) -> List[dict]:
+        return self.benchmark_days([(year, day) for day in range(1, 26)])
 
-    def benchmark_all(self):
-        for year in range(2015, AoCDate._compute_max_date()[0] + 1):
-            self.benchmark_year(year)
+    def benchmark_all(self) -> List[dict]:
+        return self.benchmark_days(
+            [
+                (year, day)
+                for year in range(2015, AoCDate._compute_max_date()[0] + 1)
+                for day in range(1, 26)
+            ]
+        )
 
     def benchmark(self) -> dict:
         if self.aoc_date:
@@ -0,0 +1,209 @@
+import contextlib
+import io
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from pysleigh.utilities.config import AoCConfig
+from pysleigh.utilities.daemon_client import get_socket_path
+from pysleigh.utilities.date import AoCDate
+from pysleigh.utilities.logger import AoCLogger
+from pysleigh.utilities.reloader import AoCModuleReloader
+from pysleigh.modules.benchmark import AoCBenchmark
+from pysleigh.modules.run_solution import AoCRunner
+from pysleigh.modules.run_test import AoCTestRunner
+
+
+class AoCDaemon:
+    """
+    Warm solution runner that serves requests over a local Unix socket.
+
+    The interpreter, config and pysleigh's own imports are paid for once.
+    Runners are kept per day, so input paths are resolved once rather than
+    on every run. Before each request,
+    solution modules whose files changed since they were imported are
+    dropped, together with the solution modules that use them, and get
+    imported fresh; everything else stays loaded.
+
+    Requests are handled one at a time, since runs share sys.modules and
+    the captured stdout. See AoCDaemonClient for the protocol.
+    """
+
+    logger = AoCLogger().get_logger()
+    COMMANDS = ("ping", "run", "test", "benchmark", "shutdown")
+    POLL_INTERVAL = 0.5
+
+    def __init__(
+        self, config: AoCConfig | None = None, socket_path: str | Path | None = None
+    ):
+        self.config = config or AoCConfig()
+        self.socket_path = (
+            Path(socket_path).expanduser()
+            if socket_path
+            else get_socket_path(self.config)
+        )
+        sol_path = self.config.config.get("solutions", {}).get("path", "")
+        self.reloader = AoCModuleReloader(sol_path or None)
+        self.started_at = time.time()
+        self.requests = 0
+        self._runners: Dict[Tuple[int, int], AoCRunner] = {}
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.server: Optional[socketserver.UnixStreamServer] = None
+
+    def refresh(self) -> List[str]:
+        """
+        Drop changed solution modules and their dependents from sys.modules.
+
+        Returns:
+            List[str]: The modules dropped, to be imported again on next use.
+        """
+        return self.reloader.evict(self.reloader.affected(self.reloader.changed()))
+
+    def _date(self, request: dict) -> AoCDate:
+        max_year, max_day = AoCDate._compute_max_date()
+        return AoCDate(request.get("year", max_year), request.get("day", max_day))
+
+    def _runner(self, aoc_date: AoCDate) -> AoCRunner:
+        key = (aoc_date.year, aoc_date.day)
+        if key not in self._runners:
+            self._runners[key] = AoCRunner(aoc_date, self.config)
+        return self._runners[key]
+
+    def _handle_ping(self, request: dict) -> dict:
+        return {
+            "pid": os.getpid(),
+            "uptime": time.time() - self.started_at,
+            "requests": self.requests,
+            "modules": len(self.reloader.loaded()),
+            "socket": str(self.socket_path),
+        }
+
+    def _handle_run(self, request: dict) -> dict:
+        runner = self._runner(self._date(request))
+        result = runner.run_solution()
+        if result and request.get("test"):
+            result["tests_passed"] = runner.run_tests(in_process=True)
+        return result
+
+    def _handle_test(self, request: dict) -> bool:
+        return AoCTestRunner(
+            self._date(request), self.config, in_process=True
+        ).run_specific_test()
+
+    def _handle_benchmark(self, request: dict) -> dict:
+        aoc_date = self._date(request)
+        benchmark = AoCBenchmark(
+            aoc_date,
+            self.config,
+            runs=request.get("runs", 5),
+            warmup=request.get("warmup", 1),
+        )
+        return benchmark.benchmark_day(aoc_date.year, aoc_date.day)
+
+    def _handle_shutdown(self, request: dict) -> dict:
+        self._stopping.set()
+        return {"pid": os.getpid()}
+
+    def handle(self, request: dict) -> dict:
+        """Serve one decoded request and return the reply to send back."""
+        command = request.get("command")
+        if command not in self.COMMANDS:
+            return {"ok": False, "error": f"Unknown command: {command}"}
+
+        self.requests += 1
+        reloaded = self.refresh() if command in ("run", "test", "benchmark") else []
+        output = io.StringIO()
+        started = time.perf_counter()
+        try:
+            with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+                result = getattr(self, f"_handle_{command}")(request)
+        except Exception as e:
+            self.logger.error(f"Daemon request {command} failed: {e}")
+            return {"ok": False, "error": str(e), "output": output.getvalue()}
+        finally:
+            self.reloader.track()
+        return {
+            "ok": True,
+            "result": result,
+            "output": output.getvalue(),
+            "reloaded": reloaded,
+            "elapsed": time.perf_counter() - started,
+        }
+
+    def _make_handler(self):
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                line = self.rfile.readline()
+                try:
+                    request = json.loads(line)
+                except json.JSONDecodeError:
+                    reply = {"ok": False, "error": "Malformed request"}
+                else:
+                    reply = daemon.handle(request)
+                self.wfile.write(json.dumps(reply, default=str).encode() + b"\n")
+
+        return Handler
+
+    def bind(self) -> None:
+        """
+        Listen on the socket, replacing one left behind by a dead daemon.
+
+        Raises:
+            RuntimeError: If another daemon is already listening on it.
+        """
+        if self.socket_path.exists():
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                try:
+                    probe.connect(str(self.socket_path))
+                except OSError:
+                    self.logger.info(f"Removing stale socket {self.socket_path}")
+                    self.socket_path.unlink()
+                else:
+                    raise RuntimeError(
+                        f"A daemon is already listening on {self.socket_path}"
+                    )
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        # Anyone who can connect can run code as this user
+        previous_umask = os.umask(0o177)
+        try:
+            self.server = socketserver.UnixStreamServer(
+                str(self.socket_path), self._make_handler()
+            )
+        finally:
+            os.umask(previous_umask)
+        self.server.timeout = self.POLL_INTERVAL
+
+    def serve_forever(self) -> None:
+        """Serve until a shutdown request or stop(); removes the socket after."""
+        if self.server is None:
+            self.bind()
+        self.logger.info(f"pysleigh daemon listening on {self.socket_path}")
+        try:
+            while not self._stopping.is_set():
+                self.server.handle_request()
+        finally:
+            self.server.server_close()
+            with contextlib.suppress(FileNotFoundError):
+                self.socket_path.unlink()
+            self.logger.info("pysleigh daemon stopped")
+
+    def start(self) -> "AoCDaemon":
+        """Serve in a background thread (for tests and embedding)."""
+        self.bind()
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,147 @@
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional
+
+from pysleigh.utilities.config import AoCConfig
+from pysleigh.utilities.logger import AoCLogger
+from pysleigh.utilities.session import AoCSession
+
+
+class AoCFixtureServer:
+    """
+    Local HTTP stand-in for the Advent of Code site.
+
+    Files under the fixture directory mirror the site's URL paths; a path
+    that is a directory serves its index.html:
+
+        2022/day/1/index.html   GET  /2022/day/1
+        2022/day/1/input        GET  /2022/day/1/input
+        2022/day/1/answer       POST /2022/day/1/answer
+
+    Responses carry an ETag, so conditional requests get a 304 just like the
+    real site. With `upstream` set, missing GETs are fetched from it once
+    and recorded into the fixture directory.
+    """
+
+    logger = AoCLogger().get_logger()
+    DEFAULT_PATH = Path("~/Workspace/advent-of-code/fixtures")
+
+    def __init__(
+        self,
+        config: AoCConfig | None = None,
+        path: str | Path | None = None,
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        upstream: Optional[str] = None,
+    ):
+        self.config = config or AoCConfig()
+        self.root = Path(path).expanduser() if path else self.get_fixtures_path()
+        self.upstream = upstream.rstrip("/") if upstream else None
+        self.httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self.httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    def get_fixtures_path(self) -> Path:
+        fixtures_cfg = self.config.config.get("fixtures", {})
+        return Path(fixtures_cfg.get("path", str(self.DEFAULT_PATH))).expanduser()
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def resolve(self, url_path: str) -> Optional[Path]:
+        """Map a request path to its fixture file, or None if there is none."""
+        relative = url_path.split("?", 1)[0].strip("/")
+        root = self.root.resolve()
+        target = root.joinpath(relative).resolve()
+        if target != root and root not in target.parents:
+            return None
+        if target.is_dir():
+            target = target / "index.html"
+        return target if target.is_file() else None
+
+    def record(self, url_path: str) -> Optional[Path]:
+        """Fetch a missing fixture from upstream and save it."""
+        relative = url_path.split("?", 1)[0].strip("/")
+        response = AoCSession.shared(self.config).get(f"{self.upstream}/{relative}")
+        if response.status_code != 200:
+            self.logger.warning(
+                f"Not recording /{relative}: upstream returned {response.status_code}"
+            )
+            return None
+        target = self.root.joinpath(relative)
+        if not relative.endswith("/input"):
+            target = target / "index.html"
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(response.content)
+        self.logger.info(f"Recorded /{relative} to {target}")
+        return target
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                fixture = server.resolve(self.path)
+                if fixture is None and server.upstream:
+                    try:
+                        fixture = server.record(self.path)
+                    except Exception as e:
+                        server.logger.error(f"Recording {self.path} failed: {e}")
+                        self.send_error(502, "Upstream request failed")
+                        return
+                self._reply(fixture)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                self.rfile.read(length)
+                self._reply(server.resolve(self.path))
+
+            def _reply(self, fixture: Optional[Path]):
+                if fixture is None:
+                    self.send_error(404, "No fixture recorded for this path")
+                    return
+                body = fixture.read_bytes()
+                etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+                content_type = (
+                    "text/html" if fixture.suffix == ".html" else "text/plain"
+                )
+                self.send_response(200)
+                self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("ETag", etag)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                server.logger.debug(f"Fixture server: {format % args}")
+
+        return Handler
+
+    def start(self) -> "AoCFixtureServer":
+        """Serve in a background thread (for tests and embedding)."""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        self.logger.info(f"Serving fixtures from {self.root} at {self.url}")
+        try:
+            self.httpd.serve_forever()
+        finally:
+            self.httpd.server_close()
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
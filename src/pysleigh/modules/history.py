@@ -0,0 +1,203 @@
+import json
+import platform
+import subprocess
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from pysleigh.utilities.config import AoCConfig
+from pysleigh.utilities.logger import AoCLogger
+
+
+class AoCBenchmarkHistory:
+    logger = AoCLogger().get_logger()
+    DEFAULT_ANSWERS_PATH = Path("~/Workspace/advent-of-code/answers")
+    HISTORY_FILE = "benchmark_history.jsonl"
+
+    def __init__(self, config: AoCConfig | None = None):
+        self.config = config or AoCConfig()
+        self.history_path = self.get_history_path()
+        self.python = self.get_python_version()
+
+    def get_history_path(self) -> Path:
+        bench_cfg = self.config.config.get("benchmark", {})
+        if bench_cfg.get("history_path"):
+            return Path(bench_cfg["history_path"]).expanduser()
+
+        # Default: next to the answers directory
+        answers_cfg = self.config.config.get("answers", {})
+        answers_path = Path(
+            answers_cfg.get("path", str(self.DEFAULT_ANSWERS_PATH))
+        ).expanduser()
+        return answers_path.parent / self.HISTORY_FILE
+
+    @staticmethod
+    def get_python_version() -> str:
+        return f"{platform.python_implementation()} {platform.python_version()}"
+
+    def get_revision(self) -> str:
+        """
+        Return the git revision of the solutions tree, suffixed with "-dirty"
+        when it has uncommitted changes, or "unknown" outside a git checkout.
+        """
+        sol_path = Path(
+            self.config.config.get("solutions", {}).get("path", ".")
+        ).expanduser()
+        try:
+            rev = subprocess.run(
+                ["git", "-C", str(sol_path), "rev-parse", "--short", "HEAD"],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+            dirty = subprocess.run(
+                ["git", "-C", str(sol_path), "status", "--porcelain", "--", "."],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            self.logger.warning(f"Could not determine git revision of {sol_path}")
+            return "unknown"
+        return f"{rev}-dirty" if dirty else rev
+
+    def append(self, results: List[dict], revision: Optional[str] = None) -> int:
+        """
+        Append successful benchmark results to the history file.
+
+        Args:
+            results (List[dict]): Results from AoCBenchmark.benchmark_day.
+            revision (str, optional): Revision to record. Defaults to the
+                current revision of the solutions tree.
+
+        Returns:
+            int: The number of records written.
+        """
+        records = [r for r in results if r.get("runs")]
+        if not records:
+            return 0
+
+        revision = revision or self.get_revision()
+        timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+        self.history_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.history_path.open("a") as file:
+            for result in records:
+                entry = {
+                    "timestamp": timestamp,
+                    "revision": revision,
+                    "python": self.python,
+                    **result,
+                }
+                file.write(json.dumps(entry) + "\n")
+
+        self.logger.info(
+            f"Recorded {len(records)} benchmark result(s) for {revision} "
+            f"in {self.history_path}"
+        )
+        return len(records)
+
+    def read(self) -> List[dict]:
+        if not self.history_path.exists():
+            self.logger.warning(f"No benchmark history at {self.history_path}")
+            return []
+
+        entries = []
+        for line_no, line in enumerate(self.history_path.read_text().splitlines(), 1):
+            if not line.strip():
+                continue
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                self.logger.warning(
+                    f"Skipping malformed history line {line_no} in {self.history_path}"
+                )
+        return entries
+
+    def revisions(self, python: Optional[str] = None) -> List[str]:
+        """Return recorded revisions in the order they first appeared."""
+        seen: List[str] = []
+        for entry in self.read():
+            if python and entry.get("python") != python:
+                continue
+            if entry["revision"] not in seen:
+                seen.append(entry["revision"])
+        return seen
+
+    def _latest_by_day(
+        self, entries: List[dict], revision: str
+    ) -> Dict[Tuple[int, int], dict]:
+        latest: Dict[Tuple[int, int], dict] = {}
+        for entry in entries:
+            if entry["revision"] == revision:
+                latest[(entry["year"], entry["day"])] = entry
+        return latest
+
+    def compare(
+        self,
+        baseline: Optional[str] = None,
+        candidate: Optional[str] = None,
+        threshold: float = 0.05,
+        year: Optional[int] = None,
+        python: Optional[str] = None,
+    ) -> List[dict]:
+        """
+        Compare median total times between two recorded revisions.
+
+        Args:
+            baseline (str, optional): Baseline revision. Defaults to the
+                revision recorded before the candidate.
+            candidate (str, optional): Candidate revision. Defaults to the
+                most recently recorded revision.
+            threshold (float): Relative slowdown above which a day is flagged.
+            year (int, optional): Restrict the comparison to one year.
+            python (str, optional): Interpreter to compare. Defaults to the
+                current one.
+
+        Returns:
+            List[dict]: One row per day present in both revisions, with
+            baseline and candidate medians, their ratio and a regressed flag.
+        """
+        python = python or self.python
+        revisions = self.revisions(python)
+        candidate = candidate or (revisions[-1] if revisions else None)
+        if baseline is None and candidate in revisions:
+            index = revisions.index(candidate)
+            baseline = revisions[index - 1] if index > 0 else None
+
+        if not baseline or not candidate:
+            self.logger.warning("Need two recorded revisions to compare.")
+            return []
+
+        entries = [
+            e
+            for e in self.read()
+            if e.get("python") == python and (year is None or e["year"] == year)
+        ]
+        base = self._latest_by_day(entries, baseline)
+        cand = self._latest_by_day(entries, candidate)
+
+        rows = []
+        for key in sorted(base.keys() & cand.keys()):
+            base_median = base[key]["total"]["median"]
+            cand_median = cand[key]["total"]["median"]
+            ratio = cand_median / base_median if base_median > 0 else 1.0
+            rows.append(
+                {
+                    "year": key[0],
+                    "day": key[1],
+                    "baseline": baseline,
+                    "candidate": candidate,
+                    "baseline_median": base_median,
+                    "candidate_median": cand_median,
+                    "ratio": ratio,
+                    "regressed": ratio - 1 > threshold,
+                }
+            )
+
+        regressions = sum(r["regressed"] for r in rows)
+        self.logger.info(
+            f"Compared {len(rows)} day(s) {baseline} -> {candidate}: "
+            f"{regressions} regression(s) over {threshold:.0%}"
+        )
+        return rows
@@ -1,15 +1,225 @@
+import contextlib
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
 from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional
 from pysleigh.utilities.config import AoCConfig
 from pysleigh.utilities.logger import AoCLogger
 from pysleigh.utilities.date import AoCDate
 from pysleigh.utilities.session import AoCSession
+from pysleigh.utilities.async_session import AoCAsyncSession
+from pysleigh.utilities.reader import AoCInputReader
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+def _import_zstd():
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            "zstd compression needs zstandard. Install it with "
+            '`pip install pysleigh[zstd]` or set [inputs] compression = "gzip".'
+        ) from e
+    return zstandard
+
+
+class AoCInputStore:
+    """
+    Content-addressed, compressed store for puzzle inputs.
+
+    Blobs are named by the SHA-256 of the raw input, so identical inputs
+    (across accounts or re-downloads) are stored once. index.json maps
+    "account/year/day" to a blob; the codec is part of the blob name, so
+    blobs written with either codec stay readable.
+    """
+
+    logger = AoCLogger().get_logger()
+    CODECS = {"zstd": ".zst", "gzip": ".gz"}
+    _lock = threading.Lock()
+
+    def __init__(self, config: AoCConfig | None = None):
+        self.config = config or AoCConfig()
+        input_cfg = self.config.config.get("inputs", {})
+        base_path = Path(input_cfg.get("path", str(AoCInput.DEFAULT_PATH)))
+        self.root = Path(
+            input_cfg.get("store_path", str(base_path / ".store"))
+        ).expanduser()
+        self.codec = self.get_codec(input_cfg.get("compression", "auto"))
+        self.index_path = self.root / "index.json"
+
+    @staticmethod
+    def get_codec(name: str) -> str:
+        if name == "auto":
+            try:
+                _import_zstd()
+                return "zstd"
+            except ImportError:
+                return "gzip"
+        if name not in AoCInputStore.CODECS:
+            raise ValueError(f"Unknown input compression: {name!r}")
+        if name == "zstd":
+            _import_zstd()
+        return name
+
+    @staticmethod
+    def get_account(config: AoCConfig) -> str:
+        """`[inputs].account`, or a short hash of the session cookie."""
+        account = config.config.get("inputs", {}).get("account")
+        if account:
+            return account
+        return AoCSession.get_account(config)
+
+    @staticmethod
+    def _key(account: str, year: int, day: int) -> str:
+        return f"{account}/{year}/{day:02d}"
+
+    def _blob_path(self, digest: str, codec: str) -> Path:
+        return self.root / "blobs" / digest[:2] / f"{digest}{self.CODECS[codec]}"
+
+    @staticmethod
+    def _open(path: Path, mode: str, codec: str):
+        if codec == "zstd":
+            return _import_zstd().open(path, mode)
+        return gzip.open(path, mode)
+
+    @classmethod
+    def _codec_of(cls, blob: Path) -> str:
+        return "zstd" if blob.suffix == cls.CODECS["zstd"] else "gzip"
+
+    def read_index(self) -> Dict[str, dict]:
+        try:
+            return json.loads(self.index_path.read_text())
+        except FileNotFoundError:
+            return {}
+        except json.JSONDecodeError:
+            self.logger.warning(f"Ignoring corrupt input index at {self.index_path}")
+            return {}
+
+    @contextlib.contextmanager
+    def _index_lock(self) -> Iterator[None]:
+        """
+        Hold the index for a read-modify-write, against other threads and,
+        through a lockfile next to index.json, other processes.
+        """
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            self.root.mkdir(parents=True, exist_ok=True)
+            with open(self.index_path.with_suffix(".json.lock"), "a") as lockfile:
+                fcntl.flock(lockfile, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lockfile, fcntl.LOCK_UN)
+
+    def _write_index(self, index: Dict[str, dict]) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.index_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(index, indent=1, sort_keys=True))
+        os.replace(tmp, self.index_path)
+
+    def lookup(self, account: str, year: int, day: int) -> Optional[Path]:
+        """Return the blob holding this input, or None if it is not stored."""
+        entry = self.read_index().get(self._key(account, year, day))
+        if not entry:
+            return None
+        blob = self._blob_path(entry["sha256"], entry["codec"])
+        return blob if blob.exists() else None
+
+    def add_file(
+        self, account: str, year: int, day: int, path: Path, digest: str | None = None
+    ) -> str:
+        """
+        Compress a plain input file into the store and index it.
+
+        Returns:
+            str: The SHA-256 of the input.
+        """
+        if digest is None:
+            digest = hashlib.sha256(path.read_bytes()).hexdigest()
+
+        existing = next(
+            (
+                self._blob_path(digest, codec)
+                for codec in self.CODECS
+                if self._blob_path(digest, codec).exists()
+            ),
+            None,
+        )
+        if existing is None:
+            blob = self._blob_path(digest, self.codec)
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            tmp = blob.with_name(f".{blob.name}.{os.getpid()}.part")
+            try:
+                with path.open("rb") as src, self._open(tmp, "wb", self.codec) as dst:
+                    shutil.copyfileobj(src, dst)
+                os.replace(tmp, blob)
+            finally:
+                tmp.unlink(missing_ok=True)
+            codec = self.codec
+        else:
+            self.logger.debug(f"Input {digest[:12]} already stored; deduplicated")
+            codec = self._codec_of(existing)
+
+        with self._index_lock():
+            index = self.read_index()
+            index[self._key(account, year, day)] = {
+                "sha256": digest,
+                "codec": codec,
+                "size": path.stat().st_size,
+            }
+            self._write_index(index)
+        return digest
+
+    def read(self, account: str, year: int, day: int) -> Optional[bytes]:
+        """Return the decompressed input, or None if missing or corrupt."""
+        blob = self.lookup(account, year, day)
+        if blob is None:
+            return None
+        try:
+            with self._open(blob, "rb", self._codec_of(blob)) as file:
+                data = file.read()
+        except (OSError, EOFError) as e:
+            self.logger.error(f"Corrupt input blob {blob}: {e}")
+            return None
+        if hashlib.sha256(data).hexdigest() != blob.name.split(".")[0]:
+            self.logger.error(f"Checksum mismatch for input blob {blob}")
+            return None
+        return data
+
+    def stats(self) -> dict:
+        """Stored inputs, unique blobs, and raw vs compressed bytes."""
+        index = self.read_index()
+        blobs = {
+            self._blob_path(entry["sha256"], entry["codec"]): entry["size"]
+            for entry in index.values()
+        }
+        return {
+            "inputs": len(index),
+            "blobs": len(blobs),
+            "raw_bytes": sum(entry["size"] for entry in index.values()),
+            "stored_bytes": sum(blob.stat().st_size for blob in blobs if blob.exists()),
+        }
 
 
 class AoCInput:
     logger = AoCLogger().get_logger()
-    BASE_URL = "https://adventofcode.com"
     DEFAULT_DATE = AoCDate._compute_max_date()
     DEFAULT_PATH = Path("~/Workspace/advent-of-code/inputs")
+    CHUNK_SIZE = 64 * 1024
+    # Working copies left behind by killed runs are removed after this long
+    STALE_WORKING_COPY = 24 * 3600
 
     def __init__(
         self, aoc_date: AoCDate | None = None, config: AoCConfig | None = None
@@ -19,19 +229,67 @@ class AoCInput:
         self.input_path = self.get_input_path()
         self.url = self._format_url()
 
+        input_cfg = self.config.config.get("inputs", {})
+        self.store = AoCInputStore(self.config) if input_cfg.get("store") else None
+        self.account = AoCInputStore.get_account(self.config) if self.store else None
+        # With a store, the plain file is only a working copy for solutions
+        self.keep_plain = self.store is None or input_cfg.get("materialize", True)
+
     def _format_url(self) -> str:
         year = self.aoc_date.year
         day = self.aoc_date.day
-        return f"{self.BASE_URL}/{year}/day/{day}/input"
+        base_url = AoCSession.get_base_url(self.config)
+        return f"{base_url}/{year}/day/{day}/input"
 
     def check_local(self) -> bool:
+        year, day = self.aoc_date.year, self.aoc_date.day
+        if self.store is not None and self.store.lookup(self.account, year, day):
+            self.logger.info(f"Input for {year} Day {day:02d} found in the store")
+            return True
         if self.input_path.exists():
+            if self.verify_local() is False:
+                self.logger.warning(
+                    f"Local input at {self.input_path} fails its checksum; "
+                    "treating it as missing"
+                )
+                return False
             self.logger.info(f"Local input file found at {self.input_path}")
+            if self.store is not None:
+                self.logger.info(f"Adding {self.input_path} to the input store")
+                self.store.add_file(self.account, year, day, self.input_path)
+                if not self.keep_plain:
+                    self.input_path.unlink()
+                    self.checksum_path.unlink(missing_ok=True)
+                    self.logger.info(f"Removed {self.input_path}; it is in the store")
             return True
         else:
             self.logger.info(f"Local input file not found at {self.input_path}")
             return False
 
+    @property
+    def checksum_path(self) -> Path:
+        return self.input_path.with_name(self.input_path.name + ".sha256")
+
+    def verify_local(self, data: Optional[bytes] = None) -> Optional[bool]:
+        """
+        Check the input against the SHA-256 recorded when it was downloaded.
+
+        Returns:
+            Optional[bool]: True if it matches, False if the file is corrupt
+            or truncated, None if no checksum was recorded (e.g. a file
+            written by hand).
+        """
+        try:
+            recorded = self.checksum_path.read_text().split()[0]
+        except (FileNotFoundError, IndexError):
+            return None
+        if data is None:
+            try:
+                data = self.input_path.read_bytes()
+            except FileNotFoundError:
+                return False
+        return hashlib.sha256(data).hexdigest() == recorded
+
     def get_input_path(self) -> Path:
         input_cfg = self.config.config.get("inputs", {})
         base_path = input_cfg.get("path", str(self.DEFAULT_PATH))
@@ -41,8 +299,16 @@ class AoCInput:
         return full_path
 
     def fetch_input(self) -> str:
-        session = AoCSession(self.config)
+        session = AoCSession.shared(self.config)
         response = session.get(self.url)
+        return self._input_from_response(response)
+
+    async def fetch_input_async(self, session: AoCAsyncSession | None = None) -> str:
+        async with AoCAsyncSession.using(session, self.config) as client:
+            response = await client.get(self.url)
+        return self._input_from_response(response)
+
+    def _input_from_response(self, response) -> str:
         if response.status_code == 200:
             self.logger.info(
                 f"Fetched input for {self.aoc_date.year} Day {self.aoc_date.day:02d}"
@@ -53,12 +319,173 @@ class AoCInput:
             return ""
 
     def read_local(self) -> str:
+        if self.store is not None:
+            data = self.store.read(self.account, self.aoc_date.year, self.aoc_date.day)
+            if data is not None:
+                return data.decode()
         try:
-            with self.input_path.open("r") as file:
-                return file.read()
+            data = self.input_path.read_bytes()
         except FileNotFoundError:
             self.logger.error(f"File not found: {self.input_path}")
             return ""
+        if self.verify_local(data) is False:
+            self.logger.error(
+                f"Checksum mismatch for {self.input_path}; refetch it with overwrite"
+            )
+            return ""
+        return data.decode()
+
+    def download(self) -> bool:
+        """
+        Stream the input to disk without holding it in memory.
+
+        Chunks go to a temporary file next to the input while being hashed;
+        only a complete download is renamed into place, followed by its
+        `.sha256` sidecar, so an interrupted fetch never leaves a truncated
+        input behind.
+
+        Returns:
+            bool: Whether the input was written.
+        """
+        session = AoCSession.shared(self.config)
+        response = session.get(self.url, stream=True)
+        try:
+            if response.status_code != 200:
+                self.logger.warning(f"Failed to fetch input: {response.status_code}")
+                return False
+            expected_size = None
+            if not response.headers.get("Content-Encoding"):
+                expected_size = response.headers.get("Content-Length")
+            return self._store(
+                response.iter_content(self.CHUNK_SIZE),
+                int(expected_size) if expected_size else None,
+            )
+        finally:
+            response.close()
+
+    def _store(self, chunks: Iterable[bytes], expected_size: Optional[int]) -> bool:
+        # Stage next to the destination so the final rename stays atomic
+        staging = self.input_path.parent if self.keep_plain else self.store.root
+        staging.mkdir(parents=True, exist_ok=True)
+        tmp = staging / f".{self.input_path.name}.{os.getpid()}.part"
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            with tmp.open("wb") as file:
+                for chunk in chunks:
+                    file.write(chunk)
+                    digest.update(chunk)
+                    size += len(chunk)
+            if expected_size is not None and size != expected_size:
+                self.logger.error(
+                    f"Input download truncated: got {size} of {expected_size} bytes"
+                )
+                return False
+            if size == 0:
+                self.logger.warning("Fetched an empty input; not writing it")
+                return False
+            if self.store is not None:
+                self.store.add_file(
+                    self.account,
+                    self.aoc_date.year,
+                    self.aoc_date.day,
+                    tmp,
+                    digest.hexdigest(),
+                )
+            if self.keep_plain:
+                self._commit(tmp, digest.hexdigest())
+        finally:
+            tmp.unlink(missing_ok=True)
+
+        self.logger.info(
+            f"Fetched input for {self.aoc_date.year} Day {self.aoc_date.day:02d} "
+            f"({size} bytes)"
+        )
+        return True
+
+    def _commit(self, tmp: Path, digest: str) -> None:
+        os.replace(tmp, self.input_path)
+        checksum_tmp = self.checksum_path.with_name(
+            f".{self.checksum_path.name}.{os.getpid()}.part"
+        )
+        checksum_tmp.write_text(f"{digest}  {self.input_path.name}\n")
+        os.replace(checksum_tmp, self.checksum_path)
+
+    def materialize(self) -> Path:
+        """
+        Make sure the plain input file exists, restoring it from the store if
+        needed. Solutions read their input from this path.
+
+        Returns:
+            Path: The input path.
+        """
+        if self.store is None or (
+            self.input_path.exists() and self.verify_local() is not False
+        ):
+            return self.input_path
+        data = self.store.read(self.account, self.aoc_date.year, self.aoc_date.day)
+        if data is None:
+            return self.input_path
+        self.input_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.input_path.with_name(f".{self.input_path.name}.{os.getpid()}.part")
+        try:
+            tmp.write_bytes(data)
+            self._commit(tmp, hashlib.sha256(data).hexdigest())
+        finally:
+            tmp.unlink(missing_ok=True)
+        self.logger.info(f"Restored {self.input_path} from the input store")
+        return self.input_path
+
+    @contextlib.contextmanager
+    def working_copy(self) -> Iterator[Path]:
+        """
+        Yield a plain file holding the input, for a solution to read.
+
+        This is the input path (restored from the store if needed), unless
+        the store is kept without plain files (`[inputs].materialize =
+        false`). Then the input goes to a temporary file under the store,
+        removed on exit, so no plain copy outlives the run.
+        """
+        if self.keep_plain:
+            yield self.materialize()
+            return
+        year, day = self.aoc_date.year, self.aoc_date.day
+        if self.store.lookup(self.account, year, day) is None:
+            # Adopts a plain file left from before the store
+            self.check_local()
+        data = self.store.read(self.account, year, day)
+        if data is None:
+            yield self.input_path
+            return
+
+        work_dir = self.store.root / "work"
+        work_dir.mkdir(parents=True, exist_ok=True)
+        self._remove_stale_copies(work_dir)
+        fd, name = tempfile.mkstemp(
+            dir=work_dir, prefix=f"{year}_{day:02d}_", suffix=self.input_path.suffix
+        )
+        path = Path(name)
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            yield path
+        finally:
+            # Windows cannot remove a file that is still open
+            with contextlib.suppress(OSError):
+                path.unlink()
+
+    def _remove_stale_copies(self, work_dir: Path) -> None:
+        cutoff = time.time() - self.STALE_WORKING_COPY
+        for path in work_dir.iterdir():
+            with contextlib.suppress(OSError):
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+
+    def reader(self) -> AoCInputReader:
+        """Open the input memory-mapped, without decoding it into a str."""
+        with self.working_copy() as path:
+            # The mapping stays valid after a working copy is removed
+            return AoCInputReader(path)
 
     def write_input(self, overwrite: bool = False) -> None:
         if self.check_local():
@@ -70,12 +497,11 @@ class AoCInput:
             else:
                 self.logger.info("Overwriting existing input file.")
 
-        self.input_path.parent.mkdir(parents=True, exist_ok=True)
-        input_data = self.fetch_input()
-        if input_data:
-            with self.input_path.open("w") as file:
-                file.write(input_data)
-            self.logger.info(f"Input written to {self.input_path}")
+        if self.download():
+            if self.keep_plain:
+                self.logger.info(f"Input written to {self.input_path}")
+            else:
+                self.logger.info(f"Input added to the store at {self.store.root}")
 
     def get_or_fetch(self) -> str:
         if self.check_local():
@@ -0,0 +1,169 @@
+import contextlib
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from pysleigh.modules.answers import AoCAnswers
+from pysleigh.modules.input import AoCInput
+from pysleigh.utilities.config import AoCConfig
+from pysleigh.utilities.date import AoCDate
+from pysleigh.utilities.logger import AoCLogger
+
+RUNNER = Path(__file__).with_name("matrix_runner.py")
+
+
+class AoCBenchmarkMatrix:
+    logger = AoCLogger().get_logger()
+
+    def __init__(
+        self,
+        config: AoCConfig | None = None,
+        interpreters: Optional[List[str]] = None,
+        runs: int = 5,
+        warmup: int = 1,
+        timeout: float | None = None,
+    ):
+        self.config = config or AoCConfig()
+        self.interpreters = interpreters or self.get_interpreters()
+        self.runs = runs
+        self.warmup = warmup
+        timeouts_cfg = self.config.config.get("timeouts", {})
+        self.timeout = timeout if timeout is not None else timeouts_cfg.get("day")
+
+        sol_cfg = self.config.config.get("solutions", {})
+        self.solutions_path = Path(sol_cfg.get("path", "")).expanduser()
+        self.solutions_format = sol_cfg.get(
+            "format", "year_{year}/solution_{year}_day_{day:02d}.py"
+        )
+
+    def get_interpreters(self) -> List[str]:
+        bench_cfg = self.config.config.get("benchmark", {})
+        return bench_cfg.get("interpreters") or [sys.executable]
+
+    def _get_input_path(self, year: int, day: int) -> str:
+        input_cfg = self.config.config.get("inputs", {})
+        base_path = Path(input_cfg.get("path", "input/")).expanduser()
+        fmt = input_cfg.get("format", "year_{year}/input_{year}_day_{day:02d}.txt")
+        return str(base_path.joinpath(fmt.format(year=year, day=day)))
+
+    @contextlib.contextmanager
+    def _working_input(self, year: int, day: int) -> Iterator[str]:
+        """The input path for one comparison; see AoCInput.working_copy."""
+        if self.config.config.get("inputs", {}).get("store"):
+            with AoCInput(AoCDate(year, day), self.config).working_copy() as path:
+                yield str(path)
+        else:
+            yield self._get_input_path(year, day)
+
+    def _has_solution(self, year: int, day: int) -> bool:
+        return self.solutions_path.joinpath(
+            self.solutions_format.format(year=year, day=day)
+        ).exists()
+
+    def _spec(self, year: int, day: int, expected: dict, input_path: str) -> dict:
+        return {
+            "solutions_path": str(self.solutions_path),
+            "module": f"year_{year}.solution_{year}_day_{day:02d}",
+            "input_path": input_path,
+            "runs": self.runs,
+            "warmup": self.warmup,
+            "expected": {
+                "part1": expected.get("part1"),
+                "part2": expected.get("part2"),
+            },
+        }
+
+    def run_interpreter(self, interpreter: str, spec: dict) -> dict:
+        """
+        Benchmark one day under one interpreter in a fresh subprocess.
+
+        Returns:
+            dict: The runner's result, with "status" set to "ok", "mismatch",
+            "timeout", "missing" (interpreter not found) or "error".
+        """
+        try:
+            proc = subprocess.run(
+                [interpreter, str(RUNNER), json.dumps(spec)],
+                capture_output=True,
+                text=True,
+                timeout=self.timeout,
+            )
+        except FileNotFoundError:
+            self.logger.error(f"Interpreter not found: {interpreter}")
+            return {"status": "missing"}
+        except subprocess.TimeoutExpired:
+            self.logger.error(
+                f"{spec['module']} exceeded {self.timeout}s under {interpreter}"
+            )
+            return {"status": "timeout"}
+
+        try:
+            return json.loads(proc.stdout.strip().splitlines()[-1])
+        except (IndexError, json.JSONDecodeError):
+            self.logger.error(
+                f"No result from {interpreter} (exit code {proc.returncode}): "
+                f"{proc.stderr.strip()[-500:]}"
+            )
+            return {"status": "error", "error": proc.stderr.strip()[-500:]}
+
+    def compare_day(self, year: int, day: int) -> dict:
+        """
+        Benchmark a day under every interpreter.
+
+        Speedups are relative to the first interpreter: the ratio of its
+        median total time to each interpreter's, so values above 1 are faster.
+        """
+        results: Dict[str, dict] = {}
+        try:
+            expected = AoCAnswers(AoCDate(year, day), self.config).get_or_fetch()
+        except Exception as e:
+            self.logger.error(f"No answers to verify {year}-Day{day:02d}: {e}")
+            expected = None
+
+        with self._working_input(year, day) as input_path:
+            for interpreter in self.interpreters:
+                if expected is None:
+                    results[interpreter] = {"status": "failed"}
+                    continue
+                self.logger.info(
+                    f"Benchmarking {year}-Day{day:02d} under {interpreter}"
+                )
+                results[interpreter] = self.run_interpreter(
+                    interpreter, self._spec(year, day, expected, input_path)
+                )
+
+        baseline = results[self.interpreters[0]]
+        speedup: Dict[str, Optional[float]] = {}
+        for interpreter, result in results.items():
+            if baseline.get("status") == "ok" and result.get("status") == "ok":
+                speedup[interpreter] = (
+                    baseline["total"]["median"] / result["total"]["median"]
+                    if result["total"]["median"] > 0
+                    else None
+                )
+            else:
+                speedup[interpreter] = None
+
+        return {"year": year, "day": day, "results": results, "speedup": speedup}
+
+    def compare_days(self, days: List[Tuple[int, int]]) -> List[dict]:
+        present = [(year, day) for year, day in days if self._has_solution(year, day)]
+        if len(present) < len(days):
+            self.logger.info(
+                f"Skipping {len(days) - len(present)} day(s) without a solution"
+            )
+        return [self.compare_day(year, day) for year, day in present]
+
+    def compare_year(self, year: int) -> List[dict]:
+        return self.compare_days([(year, day) for day in range(1, 26)])
+
+    def compare_all(self) -> List[dict]:
+        return self.compare_days(
+            [
+                (year, day)
+                for year in range(2015, AoCDate._compute_max_date()[0] + 1)
+                for day in range(1, 26)
+            ]
+        )
@@ -0,0 +1,84 @@
+"""
+Standalone benchmark runner executed by AoCBenchmarkMatrix under each
+configured interpreter.
+
+It only uses the standard library and avoids newer syntax, so it runs on
+interpreters that do not have pysleigh (or its dependencies) installed.
+Usage: <python> matrix_runner.py '<json spec>'; prints one JSON result.
+"""
+
+import contextlib
+import importlib
+import json
+import platform
+import statistics
+import sys
+import sysconfig
+import time
+
+PHASES = ("parse", "part1", "part2")
+
+
+def interpreter_info():
+    free_threaded = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+    return {
+        "implementation": platform.python_implementation(),
+        "version": platform.python_version(),
+        "free_threaded": free_threaded,
+        "executable": sys.executable,
+    }
+
+
+def run_once(mod, input_path):
+    t0 = time.perf_counter()
+    solution = mod.Solution(input_path)
+    t1 = time.perf_counter()
+    part1 = solution.part1()
+    t2 = time.perf_counter()
+    part2 = solution.part2()
+    t3 = time.perf_counter()
+    return (part1, part2), {"parse": t1 - t0, "part1": t2 - t1, "part2": t3 - t2}
+
+
+def measure(spec):
+    sys.path.insert(0, spec["solutions_path"])
+    mod = importlib.import_module(spec["module"])
+
+    answers, _ = run_once(mod, spec["input_path"])
+    expected = spec.get("expected") or {}
+    if [str(a) for a in answers] != [
+        str(expected.get("part1")),
+        str(expected.get("part2")),
+    ]:
+        return {"status": "mismatch", "answers": [str(a) for a in answers]}
+
+    for _ in range(spec["warmup"]):
+        run_once(mod, spec["input_path"])
+
+    samples = {phase: [] for phase in PHASES + ("total",)}
+    for _ in range(spec["runs"]):
+        _, timings = run_once(mod, spec["input_path"])
+        for phase in PHASES:
+            samples[phase].append(timings[phase])
+        samples["total"].append(sum(timings.values()))
+
+    result = {"status": "ok", "runs": spec["runs"]}
+    for phase, values in samples.items():
+        result[phase] = {"median": statistics.median(values), "min": min(values)}
+    return result
+
+
+def main():
+    spec = json.loads(sys.argv[1])
+    # Keep solution prints off stdout, which carries the JSON result
+    with contextlib.redirect_stdout(sys.stderr):
+        try:
+            result = measure(spec)
+        except Exception as e:
+            result = {"status": "error", "error": "%s: %s" % (type(e).__name__, e)}
+    result["interpreter"] = interpreter_info()
+    print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+import gzip
+import json
+import os
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+from pysleigh.utilities.config import AoCConfig
+from pysleigh.utilities.date import AoCDate
+from pysleigh.utilities.logger import AoCLogger
+from pysleigh.utilities.session import AoCSession
+from pysleigh.utilities.async_session import AoCAsyncSession
+
+
+class AoCPuzzlePage:
+    """
+    Local cache of a day's puzzle page, shared by AoCArticle and AoCAnswers.
+
+    Each page is stored gzip-compressed as JSON alongside its URL and fetch
+    time, so article formatting and answer extraction read one download.
+    Pages show the logged-in account's answers, so they are cached per
+    account (a hash of the session cookie).
+    """
+
+    logger = AoCLogger().get_logger()
+    DEFAULT_PATH = Path("~/.cache/pysleigh")
+    DEFAULT_MAX_AGE = 900
+
+    def __init__(
+        self, aoc_date: AoCDate | None = None, config: AoCConfig | None = None
+    ):
+        self.aoc_date = aoc_date or AoCDate(*AoCDate._compute_max_date())
+        self.config = config or AoCConfig()
+        self.url = self._format_url()
+        self.account = AoCSession.get_account(self.config)
+        self.page_path = self.get_page_path()
+        cache_cfg = self.config.config.get("cache", {})
+        self.max_age = float(cache_cfg.get("page_max_age", self.DEFAULT_MAX_AGE))
+        self.status_code: Optional[int] = None
+
+    def _format_url(self) -> str:
+        year = self.aoc_date.year
+        day = self.aoc_date.day
+        base_url = AoCSession.get_base_url(self.config)
+        return f"{base_url}/{year}/day/{day}"
+
+    def get_page_path(self) -> Path:
+        cache_cfg = self.config.config.get("cache", {})
+        base_path = Path(cache_cfg.get("path", str(self.DEFAULT_PATH))).expanduser()
+        return base_path.joinpath(
+            "pages",
+            self.account,
+            str(self.aoc_date.year),
+            f"day_{self.aoc_date.day:02d}.json.gz",
+        )
+
+    def read_cached(self) -> dict:
+        try:
+            with gzip.open(self.page_path, "rt", encoding="utf-8") as file:
+                record = json.load(file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, EOFError, json.JSONDecodeError):
+            self.logger.warning(f"Ignoring corrupt page cache at {self.page_path}")
+            return {}
+        if record.get("url") != self.url:
+            # Cached from another base_url (e.g. a fixture server)
+            self.logger.debug(f"Ignoring page cached from {record.get('url')}")
+            return {}
+        if record.get("account") != self.account:
+            self.logger.debug("Ignoring page cached for another account")
+            return {}
+        return record
+
+    def write_cached(self, html: str) -> None:
+        record = {
+            "url": self.url,
+            "account": self.account,
+            "fetched_at": time.time(),
+            "html": html,
+        }
+        self.page_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.page_path.with_suffix(f".{os.getpid()}.tmp")
+        with gzip.open(tmp, "wt", encoding="utf-8") as file:
+            json.dump(record, file)
+        os.replace(tmp, self.page_path)
+        self.logger.debug(f"Cached puzzle page at {self.page_path}")
+
+    def invalidate(self) -> None:
+        """Drop the cached page, e.g. after a submit unlocked more of it."""
+        self.page_path.unlink(missing_ok=True)
+        self.logger.debug(f"Invalidated cached page at {self.page_path}")
+
+    def fetch(self, cached: Optional[dict] = None) -> str:
+        """
+        Download the page. With a cached copy the request is conditional, and
+        a 304 reuses the cached HTML instead of transferring it again.
+        """
+        session = AoCSession.shared(self.config)
+        response = session.get(self.url, conditional=bool(cached))
+        return self._html_from_response(response, cached)
+
+    async def fetch_async(
+        self, cached: Optional[dict] = None, session: AoCAsyncSession | None = None
+    ) -> str:
+        async with AoCAsyncSession.using(session, self.config) as client:
+            response = await client.get(self.url, conditional=bool(cached))
+        return self._html_from_response(response, cached)
+
+    def _html_from_response(self, response, cached: Optional[dict]) -> str:
+        self.status_code = response.status_code
+        if response.status_code == 304 and cached:
+            self.logger.info(
+                f"Page for {self.aoc_date.year} Day {self.aoc_date.day:02d} "
+                "not modified"
+            )
+            self.write_cached(cached["html"])
+            return cached["html"]
+        if response.status_code != 200:
+            return ""
+        self.write_cached(response.text)
+        return response.text
+
+    def get_html(
+        self, refresh: bool = False, complete: Callable[[str], bool] | None = None
+    ) -> str:
+        """
+        Return the puzzle page HTML, downloading it at most once.
+
+        A cached page is reused while it is younger than max_age, or forever
+        once `complete` says it already holds everything the caller needs
+        (e.g. both answers). Puzzle pages grow as parts unlock, so an
+        incomplete, stale page is fetched again.
+
+        Args:
+            refresh (bool): Revalidate the page with the server even if the
+                cached copy is fresh.
+            complete (Callable[[str], bool], optional): Whether a cached page
+                is final for the caller.
+
+        Returns:
+            str: The HTML, or "" if the download failed (see status_code).
+        """
+        record = self.read_cached()
+        if self._usable(record, refresh, complete):
+            return record["html"]
+        return self.fetch(record)
+
+    async def get_html_async(
+        self,
+        refresh: bool = False,
+        complete: Callable[[str], bool] | None = None,
+        session: AoCAsyncSession | None = None,
+    ) -> str:
+        """Async variant of get_html()."""
+        record = self.read_cached()
+        if self._usable(record, refresh, complete):
+            return record["html"]
+        return await self.fetch_async(record, session)
+
+    def _usable(
+        self, record: dict, refresh: bool, complete: Callable[[str], bool] | None
+    ) -> bool:
+        if not record or refresh:
+            return False
+        age = time.time() - record.get("fetched_at", 0)
+        if age <= self.max_age or (complete and complete(record["html"])):
+            self.logger.info(
+                f"Using cached page for {self.aoc_date.year} "
+                f"Day {self.aoc_date.day:02d} ({age:.0f}s old)"
+            )
+            self.status_code = 200
+            return True
+        return False
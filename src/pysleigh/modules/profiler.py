@@ -0,0 +1,208 @@
+import contextlib
+import cProfile
+import importlib
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Iterator, List
+
+from pysleigh.utilities.config import AoCConfig
+from pysleigh.utilities.date import AoCDate
+from pysleigh.utilities.logger import AoCLogger
+from pysleigh.modules.input import AoCInput
+
+
+class AoCProfiler:
+    logger = AoCLogger().get_logger()
+    DEFAULT_PATH = Path("~/Workspace/advent-of-code/profiles")
+    PHASES = ("parse", "part1", "part2")
+
+    def __init__(
+        self,
+        aoc_date: AoCDate | None = None,
+        config: AoCConfig | None = None,
+        output_dir: str | None = None,
+        top: int = 15,
+        sample_interval: float = 0.001,
+    ):
+        self.aoc_date = aoc_date or AoCDate(*AoCDate._compute_max_date())
+        self.config = config or AoCConfig()
+        self.output_dir = (
+            Path(output_dir).expanduser() if output_dir else self.get_output_dir()
+        )
+        self.top = top
+        self.sample_interval = sample_interval
+
+        sol_path_str = self.config.config.get("solutions", {}).get("path", "")
+        if sol_path_str:
+            sol_path = Path(sol_path_str).expanduser()
+            if sol_path.exists() and str(sol_path) not in sys.path:
+                sys.path.insert(0, str(sol_path))
+
+    def get_output_dir(self) -> Path:
+        profile_cfg = self.config.config.get("profiles", {})
+        return Path(profile_cfg.get("path", str(self.DEFAULT_PATH))).expanduser()
+
+    def _get_module_name(self) -> str:
+        return f"year_{self.aoc_date.year}.solution_{self.aoc_date.year}_day_{self.aoc_date.day:02d}"
+
+    def _get_input_path(self) -> str:
+        input_cfg = self.config.config.get("inputs", {})
+        base_path = Path(input_cfg.get("path", "input/")).expanduser()
+        fmt = input_cfg.get("format", "year_{year}/input_{year}_day_{day:02d}.txt")
+        return str(
+            base_path.joinpath(
+                fmt.format(year=self.aoc_date.year, day=self.aoc_date.day)
+            )
+        )
+
+    @contextlib.contextmanager
+    def _working_input(self) -> Iterator[str]:
+        """The input path for one profile; see AoCInput.working_copy."""
+        if self.config.config.get("inputs", {}).get("store"):
+            with AoCInput(self.aoc_date, self.config).working_copy() as path:
+                yield str(path)
+        else:
+            yield self._get_input_path()
+
+    def _file_stem(self) -> str:
+        return f"{self.aoc_date.year}_day_{self.aoc_date.day:02d}"
+
+    @staticmethod
+    def _run_phase(mod, input_path: str, phase: str, solution):
+        if phase == "parse":
+            return mod.Solution(input_path)
+        getattr(solution, phase)()
+        return solution
+
+    def _sample(self, thread_id: int, stacks: Counter, stop: threading.Event):
+        """Record the target thread's call stack every sample_interval seconds."""
+        boundary = self._run_phase.__code__
+        while not stop.is_set():
+            frame = sys._current_frames().get(thread_id)
+            stack: List[str] = []
+            while frame is not None and frame.f_code is not boundary:
+                code = frame.f_code
+                stack.append(
+                    f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+                )
+                frame = frame.f_back
+            # Only count samples taken inside the solution itself
+            if frame is not None and stack:
+                stacks[";".join(reversed(stack))] += 1
+            time.sleep(self.sample_interval)
+
+    def hotspots(self, profile: cProfile.Profile) -> List[dict]:
+        stats = pstats.Stats(profile).sort_stats(pstats.SortKey.CUMULATIVE)
+        rows = []
+        for func in stats.fcn_list:
+            filename, line, name = func
+            # Hide the profiler's own frames
+            if filename == __file__ or "_lsprof.Profiler" in name:
+                continue
+            if len(rows) == self.top:
+                break
+            _, ncalls, tottime, cumtime, _ = stats.stats[func]
+            rows.append(
+                {
+                    "function": f"{Path(filename).name}:{line}({name})",
+                    "calls": ncalls,
+                    "tottime": tottime,
+                    "cumtime": cumtime,
+                }
+            )
+        return rows
+
+    def _profile_phases(self, mod, input_path: str, stem: str) -> dict:
+        results: dict = {}
+        solution = None
+        for phase in self.PHASES:
+            profiler = cProfile.Profile()
+            started = time.perf_counter()
+            profiler.enable()
+            try:
+                solution = self._run_phase(mod, input_path, phase, solution)
+            finally:
+                profiler.disable()
+                elapsed = time.perf_counter() - started
+
+            prof_path = self.output_dir / f"{stem}_{phase}.prof"
+            profiler.dump_stats(str(prof_path))
+            results[phase] = {
+                "time": elapsed,
+                "prof": str(prof_path),
+                "hotspots": self.hotspots(profiler),
+            }
+        return results
+
+    def _sample_phases(self, mod, input_path: str) -> Counter:
+        collapsed: Counter = Counter()
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(switch_interval, self.sample_interval / 2))
+        solution = None
+        try:
+            for phase in self.PHASES:
+                stacks: Counter = Counter()
+                stop = threading.Event()
+                sampler = threading.Thread(
+                    target=self._sample,
+                    args=(threading.get_ident(), stacks, stop),
+                    daemon=True,
+                )
+                sampler.start()
+                try:
+                    solution = self._run_phase(mod, input_path, phase, solution)
+                finally:
+                    stop.set()
+                    sampler.join()
+                for stack, count in stacks.items():
+                    collapsed[f"{phase};{stack}"] += count
+        finally:
+            sys.setswitchinterval(switch_interval)
+        return collapsed
+
+    def profile(self) -> dict:
+        """
+        Profile construction, part1 and part2 of the day's solution.
+
+        A first pass runs each phase under cProfile and writes one .prof file
+        per phase. A second pass on a fresh instance samples the call stack
+        from a background thread and writes a collapsed-stack file, prefixed
+        with the phase name, for flamegraph.pl or speedscope. The passes are
+        kept apart because cProfile also traces the sampler thread.
+
+        Returns:
+            dict: Per-phase elapsed time, .prof path, sample count and top
+            cumulative hotspots, plus the collapsed-stack file path.
+        """
+        module_name = self._get_module_name()
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        stem = self._file_stem()
+
+        try:
+            mod = importlib.import_module(module_name)
+            with self._working_input() as input_path:
+                results = self._profile_phases(mod, input_path, stem)
+                collapsed = self._sample_phases(mod, input_path)
+        except Exception as e:
+            self.logger.error(f"Profiling failed for {module_name}: {e}")
+            return {}
+
+        for phase in self.PHASES:
+            results[phase]["samples"] = sum(
+                count
+                for stack, count in collapsed.items()
+                if stack.startswith(f"{phase};")
+            )
+
+        collapsed_path = self.output_dir / f"{stem}.collapsed"
+        collapsed_path.write_text(
+            "".join(f"{stack} {count}\n" for stack, count in sorted(collapsed.items()))
+        )
+        results["collapsed"] = str(collapsed_path)
+
+        self.logger.info(f"Profiles for {module_name} written to {self.output_dir}")
+        return results
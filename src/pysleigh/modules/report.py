@@ -0,0 +1,134 @@
+import csv
+import io
+import json
+from itertools import groupby
+from pathlib import Path
+from typing import List
+
+from pysleigh.utilities.logger import AoCLogger
+
+
+class AoCBenchmarkReport:
+    logger = AoCLogger().get_logger()
+    FORMATS = ("json", "csv", "markdown")
+    SUFFIXES = {".json": "json", ".csv": "csv", ".md": "markdown"}
+    PHASES = ("parse", "part1", "part2", "total")
+    SLOWEST = 5
+
+    def __init__(self, results: List[dict]):
+        self.results = [r for r in results if r]
+        self.passed = [r for r in self.results if r.get("runs")]
+
+    @classmethod
+    def infer_format(cls, path: str | Path) -> str | None:
+        return cls.SUFFIXES.get(Path(path).suffix.lower())
+
+    def summary(self) -> dict:
+        """
+        Summarize the results: day counts, summed median totals and the
+        slowest days ranked by median total time.
+        """
+        ranked = sorted(self.passed, key=lambda r: r["total"]["median"], reverse=True)
+        return {
+            "days": len(self.passed),
+            "failed": len(self.results) - len(self.passed),
+            "total_median": sum(r["total"]["median"] for r in self.passed),
+            "slowest": [
+                {
+                    "year": r["year"],
+                    "day": r["day"],
+                    "total_median": r["total"]["median"],
+                }
+                for r in ranked[: self.SLOWEST]
+            ],
+        }
+
+    def _row(self, result: dict) -> dict:
+        row = {
+            "year": result.get("year"),
+            "day": result.get("day"),
+            "status": result.get("status", "ok" if result.get("runs") else "failed"),
+            "runs": result.get("runs", 0),
+        }
+        for phase in self.PHASES:
+            stats = result.get(phase, {})
+            row[f"{phase}_median"] = stats.get("median")
+            row[f"{phase}_p95"] = stats.get("p95")
+        return row
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {"results": self.results, "summary": self.summary()}, indent=2
+        )
+
+    def to_csv(self) -> str:
+        rows = [self._row(r) for r in self.results]
+        fields = list(self._row({}).keys())
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=fields, lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(rows)
+        return buffer.getvalue()
+
+    @staticmethod
+    def _seconds(value: float | None) -> str:
+        return "—" if value is None else f"{value:.6f}s"
+
+    def to_markdown(self) -> str:
+        lines: List[str] = []
+        by_year = groupby(
+            sorted(self.results, key=lambda r: (r.get("year", 0), r.get("day", 0))),
+            key=lambda r: r.get("year"),
+        )
+        for year, year_results in by_year:
+            rows = [self._row(r) for r in year_results]
+            lines += [
+                f"## {year}",
+                "",
+                "| Day | Parse | Part 1 | Part 2 | Total | Status |",
+                "| --: | ----: | -----: | -----: | ----: | :----- |",
+            ]
+            for row in rows:
+                lines.append(
+                    f"| {row['day']:02d} "
+                    + "".join(
+                        f"| {self._seconds(row[f'{phase}_median'])} "
+                        for phase in self.PHASES
+                    )
+                    + f"| {row['status']} |"
+                )
+            year_total = sum(r["total_median"] or 0 for r in rows)
+            lines += ["", f"**Total:** {self._seconds(year_total)}", ""]
+
+        summary = self.summary()
+        lines += [
+            "## Slowest days",
+            "",
+            "| Rank | Day | Total |",
+            "| ---: | :-- | ----: |",
+        ]
+        for rank, slow in enumerate(summary["slowest"], 1):
+            lines.append(
+                f"| {rank} | {slow['year']}-Day{slow['day']:02d} "
+                f"| {self._seconds(slow['total_median'])} |"
+            )
+        lines += [
+            "",
+            f"**{summary['days']} day(s), {summary['failed']} failed, "
+            f"total {self._seconds(summary['total_median'])}**",
+        ]
+        return "\n".join(lines) + "\n"
+
+    def render(self, fmt: str) -> str:
+        if fmt not in self.FORMATS:
+            raise ValueError(
+                f"Unknown report format '{fmt}'. Use one of {self.FORMATS}."
+            )
+        return getattr(self, f"to_{fmt}")()
+
+    def write(self, path: str | Path, fmt: str) -> Path:
+        output = Path(path).expanduser()
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(self.render(fmt))
+        self.logger.info(f"Benchmark report written to {output}")
+        return output
@@ -1,25 +1,39 @@
+import contextlib
 import importlib
 import sys
 from pathlib import Path
 import time
 import traceback
-import os
-import subprocess
+from typing import Iterator
 from pysleigh.utilities.config import AoCConfig
 from pysleigh.utilities.date import AoCDate
 from pysleigh.utilities.logger import AoCLogger
+from pysleigh.utilities.process import AoCProcessPool
+from pysleigh.modules.input import AoCInput
+from pysleigh.modules.run_test import AoCTestRunner
 
 
 class AoCRunner:
     logger = AoCLogger().get_logger()
 
     def __init__(
-        self, aoc_date: AoCDate | None = None, config: AoCConfig | None = None
+        self,
+        aoc_date: AoCDate | None = None,
+        config: AoCConfig | None = None,
+        timeout: float | None = None,
+        part_timeout: float | None = None,
     ):
         self.aoc_date = aoc_date or AoCDate(*AoCDate._compute_max_date())
         self.config = config or AoCConfig()
         self.logger = AoCLogger().get_logger()
 
+        timeouts_cfg = self.config.config.get("timeouts", {})
+        self.timeout = timeout if timeout is not None else timeouts_cfg.get("day")
+        self.part_timeout = (
+            part_timeout if part_timeout is not None else timeouts_cfg.get("part")
+        )
+        self._input_path: str | None = None
+
         sol_path_str = self.config.config.get("solutions", {}).get("path", "")
         if sol_path_str:
             sol_path = Path(sol_path_str).expanduser()
@@ -37,37 +51,79 @@ class AoCRunner:
         return f"year_{self.aoc_date.year}.solution_{self.aoc_date.year}_day_{self.aoc_date.day:02d}"
 
     def _get_input_path(self) -> str:
+        # Long-lived runners (the daemon) resolve an input once
+        if self._input_path:
+            return self._input_path
         input_cfg = self.config.config.get("inputs", {})
         base_path = Path(input_cfg.get("path", "input/")).expanduser()
         fmt = input_cfg.get("format", "year_{year}/input_{year}_day_{day:02d}.txt")
-        return str(
+        self._input_path = str(
             base_path.joinpath(
                 fmt.format(year=self.aoc_date.year, day=self.aoc_date.day)
             )
         )
+        return self._input_path
+
+    @contextlib.contextmanager
+    def _working_input(self) -> Iterator[str]:
+        """The input path for one run; see AoCInput.working_copy."""
+        if self.config.config.get("inputs", {}).get("store"):
+            with AoCInput(self.aoc_date, self.config).working_copy() as path:
+                yield str(path)
+        else:
+            yield self._get_input_path()
 
     def run_solution(self) -> dict:
-        module_name = self._get_module_name()
-        input_path = self._get_input_path()
+        """
+        Run the day's solution and time each phase.
+
+        When a day or part timeout is set, the solution runs in a killable
+        worker process and overrunning it yields {"status": "timeout"} plus
+        the phase that was running.
+        """
+        if (self.timeout or self.part_timeout) and not AoCProcessPool.in_worker():
+            pool = AoCProcessPool(
+                jobs=1, timeout=self.timeout, phase_timeout=self.part_timeout
+            )
+            return pool.map(self._execute, [{}])[0]
+        return self._execute()
+
+    def _execute(self) -> dict:
+        with self._working_input() as input_path:
+            return self._execute_with(input_path)
 
+    def _execute_with(self, input_path: str) -> dict:
+        module_name = self._get_module_name()
         self.logger.info(f"Running {module_name} with input: {input_path}")
         try:
             mod = importlib.import_module(module_name)
+
+            AoCProcessPool.report_phase("parse")
+            t0 = time.perf_counter()
             solution = mod.Solution(input_path)
+            t0_done = time.perf_counter()
 
+            AoCProcessPool.report_phase("part1")
             t1 = time.perf_counter()
             part1 = solution.part1()
             t1_done = time.perf_counter()
 
+            AoCProcessPool.report_phase("part2")
             t2 = time.perf_counter()
             part2 = solution.part2()
             t2_done = time.perf_counter()
 
+            time_parse = t0_done - t0
+            time_part1 = t1_done - t1
+            time_part2 = t2_done - t2
+
             return {
                 "part1": part1,
                 "part2": part2,
-                "time_part1": t1_done - t1,
-                "time_part2": t2_done - t2,
+                "time_parse": time_parse,
+                "time_part1": time_part1,
+                "time_part2": time_part2,
+                "time_total": time_parse + time_part1 + time_part2,
             }
 
         except Exception as e:
@@ -75,7 +131,7 @@ class AoCRunner:
             traceback.print_exc()
             return {}
 
-    def run_tests(self) -> bool:
+    def run_tests(self, in_process: bool | None = None) -> bool:
         test_cfg = self.config.config.get("tests", {})
         base_path = Path(test_cfg.get("path", "tests/python")).expanduser()
         fmt = test_cfg.get("format", "year_{year}/test_{year}_day_{day:02d}.py")
@@ -88,13 +144,6 @@ class AoCRunner:
             return False
 
         self.logger.info(f"Running tests from {test_path}")
-
-        # ✅ Inject PYTHONPATH for pytest subprocess
-        sol_path_str = self.config.config.get("solutions", {}).get("path", "")
-        sol_path = Path(sol_path_str).expanduser()
-        env = {**os.environ, "PYTHONPATH": str(sol_path)}
-
-        result = subprocess.run(
-            ["pytest", str(test_path)], env=env, capture_output=False
-        )
-        return result.returncode == 0
+        # In-process runs reuse the solution module this runner just imported
+        test_runner = AoCTestRunner(self.aoc_date, self.config, in_process)
+        return test_runner._run_pytest(test_path)
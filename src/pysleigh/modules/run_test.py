@@ -1,23 +1,52 @@
+import heapq
+import json
 import subprocess
 import os
 import sys
+import tempfile
+import threading
+import time
+import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Optional
+from statistics import median
+from typing import Dict, List, Optional
 
 from pysleigh.utilities.config import AoCConfig
 from pysleigh.utilities.date import AoCDate
 from pysleigh.utilities.logger import AoCLogger
+from pysleigh.modules.selection import AoCTestSelector
 
 
 class AoCTestRunner:
     logger = AoCLogger().get_logger()
+    DEFAULT_CACHE_PATH = Path("~/.cache/pysleigh")
+    TEST_FILE_PATTERNS = ("test_*.py", "*_test.py")
 
     def __init__(
-        self, aoc_date: Optional[AoCDate] = None, config: Optional[AoCConfig] = None
+        self,
+        aoc_date: Optional[AoCDate] = None,
+        config: Optional[AoCConfig] = None,
+        in_process: Optional[bool] = None,
+        jobs: Optional[int] = None,
+        changed: bool = False,
     ):
         self.aoc_date = aoc_date
         self.config = config or AoCConfig()
         self.logger = AoCLogger().get_logger()
+        test_cfg = self.config.config.get("tests", {})
+        self.in_process = (
+            in_process
+            if in_process is not None
+            else bool(test_cfg.get("in_process", False))
+        )
+        self.jobs = jobs
+        self.changed = changed
+        cache_cfg = self.config.config.get("cache", {})
+        self.durations_path = (
+            Path(cache_cfg.get("path", str(self.DEFAULT_CACHE_PATH))).expanduser()
+            / "test_durations.json"
+        )
+        self.summary: Dict[str, object] = {}
 
         # Ensure solution path is in sys.path and available for subprocess
         self.sol_path = Path(
@@ -43,10 +72,276 @@ class AoCTestRunner:
         return None
 
     def _run_pytest(self, path: Path) -> bool:
+        if self.in_process:
+            return self._run_pytest_in_process(path)
         env = {**os.environ, "PYTHONPATH": str(self.sol_path)}
         result = subprocess.run(["pytest", str(path)], env=env, capture_output=False)
         return result.returncode == 0
 
+    def _run_pytest_in_process(self, path: Path) -> bool:
+        """
+        Run pytest inside this interpreter instead of spawning one.
+
+        Solution modules already imported (e.g. by `run solution --test`) are
+        reused rather than imported again. Modules the session imports from
+        the solutions and tests paths, and any sys.path entries it adds, are
+        dropped afterwards, so the next run in a long-lived process collects
+        fresh copies instead of stale ones. Anything else it imports (e.g.
+        numpy, whose C extensions cannot be loaded twice) stays loaded.
+        """
+        import pytest
+
+        modules_before = set(sys.modules)
+        path_before = list(sys.path)
+        try:
+            exit_code = pytest.main([str(path)])
+        finally:
+            roots = self._module_roots(path)
+            for name in set(sys.modules) - modules_before:
+                if self._is_under(sys.modules[name], roots):
+                    del sys.modules[name]
+            sys.path[:] = path_before
+        return exit_code == pytest.ExitCode.OK
+
+    def _module_roots(self, path: Path) -> tuple:
+        roots = [self._get_base_path(), path if path.is_dir() else path.parent]
+        if self.config.config.get("solutions", {}).get("path"):
+            roots.append(self.sol_path)
+        return tuple(str(root.resolve()) + os.sep for root in roots)
+
+    @staticmethod
+    def _is_under(module, roots: tuple) -> bool:
+        files = [getattr(module, "__file__", None)]
+        # Namespace packages have no __file__, only a __path__
+        files += list(getattr(module, "__path__", None) or [])
+        return any(
+            isinstance(file, str) and os.path.realpath(file).startswith(roots)
+            for file in files
+        )
+
+    def _get_base_path(self) -> Path:
+        cfg = self.config.config.get("tests", {})
+        return Path(cfg.get("path", "tests/python")).expanduser()
+
+    def _run_tests(self, path: Path) -> bool:
+        if self.changed:
+            return self._run_changed(self._collect_files(path))
+        if self.jobs and self.jobs > 1:
+            files = self._collect_files(path)
+            if len(files) > 1:
+                return self._run_sharded(files, self.jobs)
+        return self._run_pytest(path)
+
+    def _run_changed(self, files: List[Path]) -> bool:
+        """
+        Run only the test files affected by changes since their last green
+        run (see AoCTestSelector), then record the new outcomes.
+        """
+        selector = AoCTestSelector(self.config)
+        fingerprints = {path: selector.fingerprint(path) for path in files}
+        selected = selector.select(fingerprints)
+        self.logger.info(
+            f"{len(selected)} of {len(files)} test files affected by changes"
+        )
+        if not selected:
+            sys.stdout.write(
+                f"No changes since the last green run ({len(files)} test files).\n"
+            )
+            self.summary = {"selected": 0, "total": len(files)}
+            return True
+
+        passed = self._run_sharded(selected, max(1, self.jobs or 1))
+        outcomes = self.summary.pop("file_outcomes")
+        selector.record(
+            fingerprints,
+            {
+                path: outcomes[self._relative(path)]
+                for path in selected
+                if self._relative(path) in outcomes
+            },
+        )
+        self.summary.update({"selected": len(selected), "total": len(files)})
+        return passed
+
+    def _collect_files(self, path: Path) -> List[Path]:
+        if path.is_file():
+            return [path]
+        files = {f for pattern in self.TEST_FILE_PATTERNS for f in path.rglob(pattern)}
+        return sorted(files)
+
+    def _relative(self, path: Path) -> str:
+        try:
+            return path.relative_to(self._get_base_path()).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def load_durations(self) -> Dict[str, float]:
+        try:
+            return json.loads(self.durations_path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def save_durations(self, measured: Dict[str, float]) -> None:
+        durations = {**self.load_durations(), **measured}
+        self.durations_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.durations_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(durations, indent=1, sort_keys=True))
+        os.replace(tmp, self.durations_path)
+
+    def plan_shards(self, files: List[Path], jobs: int) -> List[List[Path]]:
+        """
+        Split test files into at most `jobs` shards of similar total runtime.
+
+        Files are placed longest first onto the currently lightest shard
+        (LPT scheduling), using each file's duration from previous runs;
+        files never timed before count as the median known duration.
+        """
+        durations = self.load_durations()
+        default = median(durations.values()) if durations else 1.0
+
+        def weight(path: Path) -> float:
+            return durations.get(self._relative(path), default)
+
+        shards: List[List[Path]] = [[] for _ in range(min(jobs, len(files)))]
+        # Ties (e.g. files that ran in ~0s) go to the shard with fewer files
+        loads = [(0.0, 0, i) for i in range(len(shards))]
+        for path in sorted(files, key=lambda f: (-weight(f), str(f))):
+            load, count, i = heapq.heappop(loads)
+            shards[i].append(path)
+            heapq.heappush(loads, (load + weight(path), count + 1, i))
+        # An empty shard would make pytest collect the working directory
+        return [shard for shard in shards if shard]
+
+    def _run_sharded(self, files: List[Path], jobs: int) -> bool:
+        """
+        Run test files across concurrent pytest processes and merge the
+        results into one summary (also kept in self.summary).
+        """
+        shards = self.plan_shards(files, jobs)
+        base_path = self._get_base_path()
+        env = {**os.environ, "PYTHONPATH": str(self.sol_path)}
+        self.logger.info(f"Running {len(files)} test files in {len(shards)} shards")
+        print_lock = threading.Lock()
+
+        def stream(label: str, proc: subprocess.Popen) -> None:
+            for line in proc.stdout:
+                with print_lock:
+                    sys.stdout.write(f"[{label}] {line}")
+                    sys.stdout.flush()
+
+        start = time.perf_counter()
+        with tempfile.TemporaryDirectory(prefix="pysleigh-shards-") as tmp:
+            workers = []
+            for i, shard in enumerate(shards, 1):
+                report = Path(tmp) / f"shard_{i}.xml"
+                proc = subprocess.Popen(
+                    [
+                        "pytest",
+                        "-q",
+                        "-p",
+                        "no:cacheprovider",
+                        f"--rootdir={base_path}",
+                        "-o",
+                        "junit_family=xunit1",
+                        f"--junitxml={report}",
+                        *map(str, shard),
+                    ],
+                    env=env,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                )
+                reader = threading.Thread(
+                    target=stream, args=(f"{i}/{len(shards)}", proc), daemon=True
+                )
+                reader.start()
+                workers.append((proc, reader, report))
+
+            exit_codes = []
+            for proc, reader, _ in workers:
+                exit_codes.append(proc.wait())
+                reader.join()
+            summary = self._merge_reports([report for _, _, report in workers])
+
+        summary["duration"] = time.perf_counter() - start
+        summary["shards"] = len(shards)
+        summary["exit_codes"] = exit_codes
+        crashed = any(code not in (0, 1) for code in exit_codes)
+        failed_files = summary.pop("failed_files")
+        # An error not tied to a file could belong to any of them
+        unattributed = None in failed_files
+        outcomes: Dict[str, bool] = {}
+        for shard, code in zip(shards, exit_codes):
+            if code not in (0, 1):
+                continue  # The shard crashed, so its outcomes are unknown
+            for path in shard:
+                relative = self._relative(path)
+                outcomes[relative] = not unattributed and relative not in failed_files
+        summary["file_outcomes"] = outcomes
+        self.summary = summary
+        self.save_durations(summary.pop("file_durations"))
+        self._print_summary(summary)
+
+        return (
+            not crashed
+            and summary["passed"] > 0
+            and summary["failed"] == 0
+            and summary["errors"] == 0
+        )
+
+    def _merge_reports(self, reports: List[Path]) -> Dict[str, object]:
+        counts = {"passed": 0, "failed": 0, "errors": 0, "skipped": 0}
+        failures: List[str] = []
+        failed_files = set()
+        file_durations: Dict[str, float] = {}
+        for report in reports:
+            try:
+                root = ET.parse(report).getroot()
+            except (FileNotFoundError, ET.ParseError):
+                self.logger.error(f"Shard report missing or unreadable: {report}")
+                continue
+            for case in root.iter("testcase"):
+                test_file = case.get("file")
+                if test_file:
+                    file_durations[test_file] = file_durations.get(
+                        test_file, 0.0
+                    ) + float(case.get("time", 0) or 0)
+                if case.find("failure") is not None:
+                    outcome = "failed"
+                elif case.find("error") is not None:
+                    outcome = "errors"
+                elif case.find("skipped") is not None:
+                    outcome = "skipped"
+                else:
+                    outcome = "passed"
+                counts[outcome] += 1
+                if outcome in ("failed", "errors"):
+                    failed_files.add(test_file)
+                    failures.append(
+                        f"{test_file}::{case.get('name')}"
+                        if test_file
+                        else f"{case.get('classname')}.{case.get('name')}"
+                    )
+        return {
+            **counts,
+            "failures": failures,
+            "failed_files": failed_files,
+            "file_durations": file_durations,
+        }
+
+    def _print_summary(self, summary: Dict[str, object]) -> None:
+        parts = [
+            f"{summary[key]} {key}"
+            for key in ("passed", "failed", "errors", "skipped")
+            if summary[key]
+        ]
+        for failure in summary["failures"]:
+            sys.stdout.write(f"FAILED {failure}\n")
+        sys.stdout.write(
+            f"===== {', '.join(parts) or 'no tests ran'} in "
+            f"{summary['duration']:.2f}s across {summary['shards']} shards =====\n"
+        )
+
     def run_specific_test(self) -> bool:
         test_path = self._get_test_path()
         if test_path and test_path.exists():
@@ -66,7 +361,7 @@ class AoCTestRunner:
             return False
 
         self.logger.info(f"Running all tests for {year} in {year_path}")
-        return self._run_pytest(year_path)
+        return self._run_tests(year_path)
 
     def run_all_tests(self) -> bool:
         cfg = self.config.config.get("tests", {})
@@ -76,7 +371,7 @@ class AoCTestRunner:
             return False
 
         self.logger.info(f"Running all tests in {base_path}")
-        return self._run_pytest(base_path)
+        return self._run_tests(base_path)
 
     def run(self) -> bool:
         if self.aoc_date:
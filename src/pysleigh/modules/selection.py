@@ -0,0 +1,185 @@
+import ast
+import hashlib
+import json
+import os
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+from string import Formatter
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from pysleigh.modules.answers import AoCAnswers
+from pysleigh.modules.input import AoCInput
+from pysleigh.utilities.config import AoCConfig
+from pysleigh.utilities.date import AoCDate
+from pysleigh.utilities.logger import AoCLogger
+
+
+class AoCTestSelector:
+    """
+    Decide which test files need to run after a change.
+
+    A test file's fingerprint covers its own source, every local module it
+    imports (transitively, found by parsing imports rather than running
+    them), and, for a puzzle test, that day's input and answer files.
+    Fingerprints are stored with each file's last outcome, and a file is
+    selected again only if its fingerprint changed or it last failed.
+    """
+
+    logger = AoCLogger().get_logger()
+    DEFAULT_PATH = Path("~/.cache/pysleigh")
+
+    def __init__(self, config: AoCConfig | None = None):
+        self.config = config or AoCConfig()
+        cache_cfg = self.config.config.get("cache", {})
+        self.state_path = (
+            Path(cache_cfg.get("path", str(self.DEFAULT_PATH))).expanduser()
+            / "test_state.json"
+        )
+        test_cfg = self.config.config.get("tests", {})
+        self.tests_path = Path(test_cfg.get("path", "tests/python")).expanduser()
+        self.tests_pattern = self._format_to_regex(
+            test_cfg.get("format", "year_{year}/test_{year}_day_{day:02d}.py")
+        )
+        sol_cfg = self.config.config.get("solutions", {})
+        self.roots = [
+            Path(sol_cfg.get("path", "")).expanduser(),
+            self.tests_path,
+        ]
+
+    @staticmethod
+    def _format_to_regex(fmt: str) -> re.Pattern:
+        """Turn a path format like "year_{year}/test_{day:02d}.py" into a regex."""
+        pattern, seen = "", set()
+        for literal, field, _, _ in Formatter().parse(fmt):
+            pattern += re.escape(literal)
+            if field in ("year", "day"):
+                if field in seen:
+                    pattern += rf"(?P={field})"
+                else:
+                    pattern += rf"(?P<{field}>\d+)"
+                    seen.add(field)
+        return re.compile(pattern + "$")
+
+    def _relative(self, path: Path) -> str:
+        try:
+            return path.relative_to(self.tests_path).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def puzzle_date(self, test_file: Path) -> Optional[Tuple[int, int]]:
+        match = self.tests_pattern.search(self._relative(test_file))
+        if not match or "year" not in match.groupdict():
+            return None
+        return int(match["year"]), int(match["day"])
+
+    def _resolve(self, module: str, package_dir: Optional[Path]) -> List[Path]:
+        """Find the local files behind a dotted module name, if any."""
+        parts = module.split(".") if module else []
+        bases = [package_dir] if package_dir is not None else self.roots
+        found = []
+        for base in bases:
+            candidate = base.joinpath(*parts)
+            for path in (candidate.with_suffix(".py"), candidate / "__init__.py"):
+                if parts and path.is_file():
+                    found.append(path)
+            # Packages on the way down run their __init__ as well
+            for depth in range(1, len(parts)):
+                init = base.joinpath(*parts[:depth], "__init__.py")
+                if init.is_file():
+                    found.append(init)
+        return found
+
+    def _resolve_absolute(self, module: str, importer: Path) -> List[Path]:
+        # pytest puts a test file's directory on sys.path too
+        return self._resolve(module, None) + self._resolve(module, importer.parent)
+
+    def _imports(self, path: Path) -> Iterable[Path]:
+        try:
+            tree = ast.parse(path.read_bytes(), filename=str(path))
+        except (OSError, SyntaxError, ValueError):
+            return []
+        found: List[Path] = []
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    found += self._resolve_absolute(alias.name, path)
+            elif isinstance(node, ast.ImportFrom):
+                module = node.module or ""
+                # `from pkg import mod` may name submodules
+                names = [module] + [
+                    f"{module}.{alias.name}" if module else alias.name
+                    for alias in node.names
+                ]
+                if node.level:
+                    package_dir = path.parent
+                    for _ in range(node.level - 1):
+                        package_dir = package_dir.parent
+                    for name in names:
+                        found += self._resolve(name, package_dir)
+                else:
+                    for name in names:
+                        found += self._resolve_absolute(name, path)
+        return found
+
+    def dependencies(self, test_file: Path) -> Set[Path]:
+        """The test file plus every local module it imports, transitively."""
+        seen: Set[Path] = set()
+        pending = [test_file.resolve()]
+        while pending:
+            path = pending.pop()
+            if path in seen:
+                continue
+            seen.add(path)
+            pending.extend(dep.resolve() for dep in self._imports(path))
+        return seen
+
+    def fingerprint(self, test_file: Path) -> str:
+        digest = hashlib.sha256()
+        inputs = sorted(self.dependencies(test_file))
+        date = self.puzzle_date(test_file)
+        if date is not None:
+            aoc_date = AoCDate(*date)
+            inputs.append(AoCInput(aoc_date, self.config).input_path)
+            inputs.append(AoCAnswers(aoc_date, self.config).answers_path)
+        for path in inputs:
+            digest.update(str(path).encode())
+            try:
+                digest.update(hashlib.sha256(path.read_bytes()).digest())
+            except OSError:
+                digest.update(b"missing")
+        return digest.hexdigest()
+
+    def load(self) -> Dict[str, dict]:
+        try:
+            return json.loads(self.state_path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def select(self, fingerprints: Dict[Path, str]) -> List[Path]:
+        """Return the test files whose fingerprint changed or that last failed."""
+        state = self.load()
+        selected = []
+        for test_file, fingerprint in fingerprints.items():
+            entry = state.get(self._relative(test_file))
+            if (
+                not entry
+                or entry.get("fingerprint") != fingerprint
+                or not entry.get("passed")
+            ):
+                selected.append(test_file)
+        return selected
+
+    def record(self, fingerprints: Dict[Path, str], outcomes: Dict[Path, bool]) -> None:
+        state = self.load()
+        now = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        for test_file, passed in outcomes.items():
+            state[self._relative(test_file)] = {
+                "fingerprint": fingerprints[test_file],
+                "passed": passed,
+                "at": now,
+            }
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.state_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(state, indent=1, sort_keys=True))
+        os.replace(tmp, self.state_path)
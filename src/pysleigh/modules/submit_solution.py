@@ -5,6 +5,8 @@ from pysleigh.utilities.config import AoCConfig
 from pysleigh.utilities.date import AoCDate
 from pysleigh.utilities.logger import AoCLogger
 from pysleigh.utilities.session import AoCSession
+from pysleigh.utilities.async_session import AoCAsyncSession
+from pysleigh.modules.page import AoCPuzzlePage
 import importlib
 
 
@@ -14,7 +16,7 @@ class AoCSubmitter:
     def __init__(self, aoc_date: AoCDate, config: AoCConfig = None):
         self.aoc_date = aoc_date
         self.config = config or AoCConfig()
-        self.session = AoCSession(self.config)
+        self.session = AoCSession.shared(self.config)
 
         sol_path_str = self.config.config.get("solutions", {}).get("path", "")
         if sol_path_str:
@@ -22,12 +24,27 @@ class AoCSubmitter:
             if sol_path.exists() and str(sol_path) not in sys.path:
                 sys.path.insert(0, str(sol_path))
 
-        self.url = f"https://adventofcode.com/{aoc_date.year}/day/{aoc_date.day}/answer"
+        base_url = AoCSession.get_base_url(self.config)
+        self.url = f"{base_url}/{aoc_date.year}/day/{aoc_date.day}/answer"
 
     def submit(self, part: int, answer: str) -> str:
         data = {"level": str(part), "answer": answer}
         response = self.session.post(self.url, data=data)
+        return self._result_from_response(response)
+
+    async def submit_async(
+        self, part: int, answer: str, session: AoCAsyncSession | None = None
+    ) -> str:
+        data = {"level": str(part), "answer": answer}
+        async with AoCAsyncSession.using(session, self.config) as client:
+            response = await client.post(self.url, data=data)
+        return self._result_from_response(response)
+
+    def _result_from_response(self, response) -> str:
         if response.status_code == 200:
+            if "That's the right answer" in response.text:
+                # The cached page predates the answer it now shows
+                AoCPuzzlePage(self.aoc_date, self.config).invalidate()
             return response.text
         else:
             self.logger.error(f"Failed to submit answer: HTTP {response.status_code}")
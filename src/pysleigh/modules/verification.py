@@ -0,0 +1,71 @@
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from pysleigh.utilities.config import AoCConfig
+from pysleigh.utilities.logger import AoCLogger
+
+
+class AoCVerificationCache:
+    """
+    Remember which solution/input pairs already produced the right answers.
+
+    Entries are keyed by a SHA-256 over the solution source, the input and
+    the expected answers, so editing any of them invalidates the entry.
+    Each entry is its own small file, which keeps concurrent benchmark
+    workers from clobbering each other.
+    """
+
+    logger = AoCLogger().get_logger()
+    DEFAULT_PATH = Path("~/.cache/pysleigh")
+
+    def __init__(self, config: AoCConfig | None = None):
+        self.config = config or AoCConfig()
+        self.cache_dir = self.get_cache_dir() / "verified"
+
+    def get_cache_dir(self) -> Path:
+        cache_cfg = self.config.config.get("cache", {})
+        return Path(cache_cfg.get("path", str(self.DEFAULT_PATH))).expanduser()
+
+    @staticmethod
+    def fingerprint(
+        solution_path: str | Path, input_path: str | Path, expected: dict
+    ) -> Optional[str]:
+        """Return the cache key, or None if either file cannot be read."""
+        digest = hashlib.sha256()
+        try:
+            for path in (solution_path, input_path):
+                digest.update(Path(path).read_bytes())
+                digest.update(b"\0")
+        except (OSError, TypeError):
+            return None
+        digest.update(
+            json.dumps(
+                [str(expected.get("part1")), str(expected.get("part2"))]
+            ).encode()
+        )
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def is_verified(self, key: Optional[str]) -> bool:
+        return key is not None and self._entry_path(key).exists()
+
+    def record(self, key: Optional[str], year: int, day: int) -> None:
+        if key is None:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "year": year,
+            "day": day,
+            "verified_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        }
+        path = self._entry_path(key)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(entry))
+        os.replace(tmp, path)
+        self.logger.debug(f"Cached verification of {year}-Day{day:02d} as {key[:12]}")
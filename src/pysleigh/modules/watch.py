@@ -0,0 +1,385 @@
+import ast
+import hashlib
+import importlib
+import time
+import traceback
+from pathlib import Path
+from typing import Callable, Dict, Optional, Set, Tuple
+
+from pysleigh.utilities.config import AoCConfig
+from pysleigh.utilities.date import AoCDate
+from pysleigh.utilities.filewatch import AoCFileWatcher
+from pysleigh.utilities.logger import AoCLogger
+from pysleigh.utilities.reloader import AoCModuleReloader
+from pysleigh.modules.run_solution import AoCRunner
+from pysleigh.modules.run_test import AoCTestRunner
+
+
+class AoCWatchRunner:
+    """
+    Rerun a day's solution, and optionally its tests, as its files change.
+
+    Watched are the solution, every helper module it imported from the
+    solutions path, the input and (with tests) the test file. Changed
+    modules are refreshed with importlib.reload. When only the body of
+    part1 or part2 changed, just that part is rerun (after a fresh parse)
+    and the other part's previous answer is kept, unless the two parts are
+    tied (see part_links); any other change to the solution, a helper or the
+    input reruns everything. Each result carries the timing delta against
+    the previous run of the same phase.
+    """
+
+    logger = AoCLogger().get_logger()
+    PHASES = ("parse", "part1", "part2")
+    PARTS = ("part1", "part2")
+    # Methods that change the object they are called on
+    MUTATING_METHODS = frozenset(
+        {
+            "add",
+            "append",
+            "appendleft",
+            "clear",
+            "discard",
+            "extend",
+            "extendleft",
+            "insert",
+            "pop",
+            "popitem",
+            "popleft",
+            "remove",
+            "reverse",
+            "rotate",
+            "setdefault",
+            "sort",
+            "update",
+        }
+    )
+    # Functions that change the object given as their first argument
+    MUTATING_FUNCTIONS = frozenset(
+        {"heapify", "heappop", "heappush", "heappushpop", "heapreplace", "shuffle"}
+    )
+
+    def __init__(
+        self,
+        aoc_date: AoCDate | None = None,
+        config: AoCConfig | None = None,
+        test: bool = False,
+        debounce: float = 0.2,
+        poll_interval: float = 0.5,
+        backend: str = "auto",
+    ):
+        self.aoc_date = aoc_date or AoCDate(*AoCDate._compute_max_date())
+        self.config = config or AoCConfig()
+        self.runner = AoCRunner(self.aoc_date, self.config)
+        self.test_runner = (
+            AoCTestRunner(self.aoc_date, self.config, in_process=True) if test else None
+        )
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.backend = backend
+
+        sol_path = self.config.config.get("solutions", {}).get("path", "")
+        self.sol_path = Path(sol_path).expanduser()
+        self.reloader = AoCModuleReloader(sol_path or None)
+        self.module_name = self.runner._get_module_name()
+        self.solution_path = self.sol_path.joinpath(
+            *self.module_name.split(".")
+        ).with_suffix(".py")
+        self.input_path = Path(self.runner._get_input_path())
+        self.test_path = self.test_runner._get_test_path() if self.test_runner else None
+
+        self._digests: Dict[Path, Optional[str]] = {}
+        self._shape: Dict[str, str] = {}
+        self._links: Dict[str, Set[str]] = {}
+        self._previous: Dict[str, dict] = {}
+        # Modules whose reload failed (e.g. a syntax error) and are still stale
+        self._pending: Set[str] = set()
+
+    def watched_paths(self) -> Set[Path]:
+        paths = {self.solution_path, self.input_path}
+        paths |= {Path(m.__file__) for m in self.reloader.loaded().values()}
+        if self.test_path:
+            paths.add(Path(self.test_path))
+        return {path.resolve() for path in paths}
+
+    @staticmethod
+    def _digest(path: Path) -> Optional[str]:
+        try:
+            return hashlib.sha256(path.read_bytes()).hexdigest()
+        except OSError:
+            return None
+
+    @classmethod
+    def solution_shape(cls, source: str) -> Dict[str, str]:
+        """
+        Fingerprint part1, part2 and everything else ("parse") in a solution.
+
+        Fingerprints are taken over the AST, so comments, blank lines and
+        code moving up or down the file do not count as changes.
+        """
+        tree = ast.parse(source)
+        shape = {}
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef) and node.name == "Solution":
+                kept = []
+                for item in node.body:
+                    if (
+                        isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef))
+                        and item.name in cls.PARTS
+                    ):
+                        shape[item.name] = cls._hash(ast.dump(item))
+                    else:
+                        kept.append(item)
+                node.body = kept
+        shape["parse"] = cls._hash(ast.dump(tree))
+        return shape
+
+    @staticmethod
+    def _hash(text: str) -> str:
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    @staticmethod
+    def _self_attribute(node: ast.AST) -> Optional[str]:
+        """The X of `self.X[...].y...`, or None if not rooted at a self attribute."""
+        while isinstance(node, (ast.Attribute, ast.Subscript)):
+            if (
+                isinstance(node, ast.Attribute)
+                and isinstance(node.value, ast.Name)
+                and node.value.id == "self"
+            ):
+                return node.attr
+            node = node.value
+        return None
+
+    @classmethod
+    def _attributes(cls, method: ast.AST) -> Tuple[Set[str], Set[str]]:
+        """The self attributes (and methods) `method` uses, and those it writes."""
+        uses, writes = set(), set()
+        for node in ast.walk(method):
+            if isinstance(node, ast.Attribute):
+                attribute = cls._self_attribute(node)
+                if attribute:
+                    uses.add(attribute)
+            targets = []
+            if isinstance(node, (ast.Assign, ast.Delete)):
+                targets = node.targets
+            elif isinstance(node, (ast.AugAssign, ast.AnnAssign)):
+                targets = [node.target]
+            elif isinstance(node, ast.Call):
+                func = node.func
+                name = getattr(func, "attr", getattr(func, "id", None))
+                if isinstance(func, ast.Attribute) and name in cls.MUTATING_METHODS:
+                    # self.seen.add(x)
+                    targets = [func.value]
+                elif name in cls.MUTATING_FUNCTIONS:
+                    # heapq.heappush(self.queue, x)
+                    targets = node.args[:1]
+            for target in targets:
+                for element in ast.walk(target):
+                    attribute = cls._self_attribute(element)
+                    if attribute:
+                        writes.add(attribute)
+        return uses, writes
+
+    @classmethod
+    def part_links(cls, source: str) -> Dict[str, Set[str]]:
+        """
+        The other parts each part is tied to, and must be rerun with.
+
+        Parts are tied when one calls the other through `self`, or when
+        either writes a `self` attribute the other uses (state left behind
+        by part1 for part2), counting the methods each part calls. In-place
+        changes are recognised through assignments and common mutating calls
+        such as append, sort or heappush.
+        """
+        tree = ast.parse(source)
+        methods = {}
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef) and node.name == "Solution":
+                methods = {
+                    item.name: cls._attributes(item)
+                    for item in node.body
+                    if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef))
+                }
+
+        reach = {}
+        for part in cls.PARTS:
+            seen, todo = set(), [part]
+            while todo:
+                name = todo.pop()
+                if name in methods and name not in seen:
+                    seen.add(name)
+                    todo += methods[name][0]
+            reach[part] = seen
+
+        links: Dict[str, Set[str]] = {part: set() for part in cls.PARTS}
+        for part in cls.PARTS:
+            uses = set().union(*(methods[name][0] for name in reach[part]))
+            for other in cls.PARTS:
+                writes = set().union(*(methods[name][1] for name in reach[other]))
+                if other != part and (other in reach[part] or uses & writes):
+                    links[part].add(other)
+                    links[other].add(part)
+        return links
+
+    def _read_shape(self) -> Tuple[Dict[str, str], Dict[str, Set[str]]]:
+        try:
+            source = self.solution_path.read_text()
+            return self.solution_shape(source), self.part_links(source)
+        except (OSError, SyntaxError, ValueError):
+            return {}, {}
+
+    def _refresh_digests(self, paths: Set[Path]) -> Set[Path]:
+        """Update content digests; return the paths whose content changed."""
+        changed = set()
+        for path in paths:
+            digest = self._digest(path)
+            if path in self._digests and self._digests[path] != digest:
+                changed.add(path)
+            self._digests[path] = digest
+        return changed
+
+    def affected_parts(self, changed: Set[Path]) -> Set[str]:
+        """The parts whose answers a change to `changed` may have altered."""
+        solution = self.solution_path.resolve()
+        test = Path(self.test_path).resolve() if self.test_path else None
+        if changed - {solution, test}:
+            # The input or a helper module
+            self._shape, self._links = self._read_shape()
+            return set(self.PARTS)
+        if solution not in changed:
+            return set()
+        shape, links = self._read_shape()
+        previous, self._shape = self._shape, shape
+        previous_links, self._links = self._links, links
+        if not shape or not previous or shape["parse"] != previous["parse"]:
+            return set(self.PARTS)
+        parts = {part for part in self.PARTS if shape.get(part) != previous.get(part)}
+        # A tie in either version counts (e.g. part1 stopped setting state)
+        for part in list(parts):
+            parts |= links.get(part, set()) | previous_links.get(part, set())
+        return parts
+
+    def _relative(self, path: Path) -> str:
+        for root in (Path.cwd(), self.sol_path):
+            try:
+                return str(path.relative_to(root.resolve()))
+            except ValueError:
+                continue
+        return str(path)
+
+    def _run_parts(self, parts: Set[str]) -> Dict[str, dict]:
+        mod = importlib.import_module(self.module_name)
+        timings = {}
+
+        phase = "parse"
+        try:
+            with self.runner._working_input() as input_path:
+                t0 = time.perf_counter()
+                solution = mod.Solution(input_path)
+                timings["parse"] = (None, time.perf_counter() - t0)
+                for phase in self.PARTS:
+                    if phase in parts:
+                        t1 = time.perf_counter()
+                        answer = getattr(solution, phase)()
+                        timings[phase] = (answer, time.perf_counter() - t1)
+        except Exception:
+            # Never show an answer from before the failing edit as current
+            if phase == "parse":
+                self._previous.clear()
+            else:
+                self._previous.pop(phase, None)
+            raise
+
+        phases = {}
+        for phase in self.PHASES:
+            previous = self._previous.get(phase)
+            if phase not in timings:
+                if previous:
+                    phases[phase] = {**previous, "rerun": False, "delta": None}
+                continue
+            answer, took = timings[phase]
+            phases[phase] = {
+                "answer": answer,
+                "time": took,
+                "previous": previous["time"] if previous else None,
+                "delta": took - previous["time"] if previous else None,
+                "rerun": True,
+            }
+            self._previous[phase] = {"answer": answer, "time": took}
+        return phases
+
+    def _cycle(self, changed: Set[Path], parts: Set[str], run_tests: bool) -> dict:
+        result = {
+            "changed": sorted(self._relative(path) for path in changed),
+            "reloaded": [],
+            "phases": {},
+            "tests_passed": None,
+            "error": None,
+        }
+        try:
+            stale = self.reloader.affected(
+                self.reloader.modules_for(changed) | self._pending
+            )
+            self._pending = stale
+            result["reloaded"] = self.reloader.reload(stale)
+            self._pending = set()
+            if parts:
+                result["phases"] = self._run_parts(parts)
+        except Exception:
+            result["error"] = traceback.format_exc()
+            self.logger.error(f"Watch run of {self.module_name} failed")
+        finally:
+            self.reloader.track()
+        if run_tests and self.test_runner and result["error"] is None:
+            result["tests_passed"] = self.test_runner.run_specific_test()
+        return result
+
+    def run_once(self) -> dict:
+        """The initial run: every part, and the tests if enabled."""
+        self._shape, self._links = self._read_shape()
+        self._refresh_digests(self.watched_paths())
+        result = self._cycle(set(), set(self.PARTS), run_tests=True)
+        self._refresh_digests(self.watched_paths() - self._digests.keys())
+        return result
+
+    def handle_changes(self, paths: Set[Path]) -> Optional[dict]:
+        """
+        React to a batch of file events.
+
+        Returns:
+            Optional[dict]: The run's result, or None if no file content
+                actually changed (e.g. a save without edits).
+        """
+        changed = self._refresh_digests({Path(path).resolve() for path in paths})
+        if not changed:
+            return None
+        parts = self.affected_parts(changed)
+        if parts:
+            # Parts that never produced an answer (e.g. they raised) run too
+            parts |= {part for part in self.PARTS if part not in self._previous}
+        test = Path(self.test_path).resolve() if self.test_path else None
+        run_tests = bool(parts) or test in changed
+        result = self._cycle(changed, parts, run_tests)
+        # Newly imported helpers join the watch list
+        self._refresh_digests(self.watched_paths() - self._digests.keys())
+        return result
+
+    def watch(self, on_result: Callable[[dict], None]) -> None:
+        """Run once, then rerun on every change until interrupted."""
+        on_result(self.run_once())
+        with AoCFileWatcher(
+            self.watched_paths(),
+            debounce=self.debounce,
+            poll_interval=self.poll_interval,
+            backend=self.backend,
+        ) as watcher:
+            self.logger.info(
+                f"Watching {len(watcher.paths)} files for {self.module_name} "
+                f"({watcher.backend})"
+            )
+            while True:
+                result = self.handle_changes(watcher.wait())
+                if result is not None:
+                    on_result(result)
+                    watcher.update(self.watched_paths())
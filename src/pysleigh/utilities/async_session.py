@@ -0,0 +1,214 @@
+import asyncio
+import contextlib
+from typing import AsyncIterator, Awaitable, Callable, Dict, Optional, Tuple
+
+from pysleigh.utilities.circuit import AoCCircuitBreaker
+from pysleigh.utilities.config import AoCConfig
+from pysleigh.utilities.ratelimit import AoCRateLimiter
+from pysleigh.utilities.session import AoCSession
+
+
+def _import_aiohttp():
+    try:
+        import aiohttp
+    except ImportError as e:
+        raise ImportError(
+            "The async backend needs aiohttp. Install it with "
+            "`pip install pysleigh[async]`."
+        ) from e
+    return aiohttp
+
+
+class AoCAsyncResponse:
+    """The parts of a response the fetch modules use, read eagerly."""
+
+    def __init__(self, status_code: int, text: str, headers: Dict[str, str]):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers
+
+
+Transport = Callable[..., Awaitable[AoCAsyncResponse]]
+
+
+class AoCAsyncSession(AoCSession):
+    """
+    asyncio counterpart of AoCSession built on aiohttp.
+
+    It shares AoCSession's configuration, rate limiting, validators, retry
+    policy and circuit breaker, but never blocks the event loop. aiohttp is
+    imported on first request, so pysleigh works without it installed.
+
+    Sessions are bound to an event loop, so each is built anew, but all
+    async sessions with the same settings share one rate limiter and one
+    circuit breaker: short-lived sessions cannot add up past the limit.
+
+    Use one session for many requests:
+
+        async with AoCAsyncSession(config) as session:
+            await asyncio.gather(*(AoCInput(d).fetch_input_async(session) for d in days))
+    """
+
+    _shared_guards: Dict[tuple, Tuple[AoCRateLimiter, AoCCircuitBreaker]] = {}
+
+    def __init__(
+        self, config: Optional[AoCConfig] = None, transport: Optional[Transport] = None
+    ) -> None:
+        config = config or AoCConfig()
+        super().__init__(config)
+        self.limiter, self.breaker = self.shared_guards(config)
+        self.transport = transport or self._send
+        self._client = None
+
+    @classmethod
+    def shared(cls, config: Optional[AoCConfig] = None) -> "AoCAsyncSession":
+        raise TypeError(
+            "Async sessions are bound to an event loop and cannot be shared "
+            "process-wide. Use `async with AoCAsyncSession(config)` instead."
+        )
+
+    @classmethod
+    def shared_guards(
+        cls, config: Optional[AoCConfig] = None
+    ) -> Tuple[AoCRateLimiter, AoCCircuitBreaker]:
+        """
+        Return the process-wide rate limiter and circuit breaker for these
+        settings, building them on first use.
+        """
+        config = config or AoCConfig()
+        session_cfg = config.config.get("session", {})
+        key = (
+            cls.get_base_url(config),
+            session_cfg.get("rate_limit", AoCRateLimiter.DEFAULT_RATE),
+            session_cfg.get("burst", AoCRateLimiter.DEFAULT_BURST),
+            session_cfg.get("breaker_threshold", 5),
+            session_cfg.get("breaker_cooldown", 60.0),
+        )
+        with cls._shared_lock:
+            if key not in cls._shared_guards:
+                cls._shared_guards[key] = (
+                    AoCRateLimiter.from_config(config),
+                    AoCCircuitBreaker(
+                        threshold=int(session_cfg.get("breaker_threshold", 5)),
+                        cooldown=float(session_cfg.get("breaker_cooldown", 60.0)),
+                    ),
+                )
+            return cls._shared_guards[key]
+
+    @classmethod
+    def close_shared(cls) -> None:
+        with cls._shared_lock:
+            cls._shared_guards.clear()
+
+    def build_session(self):
+        # The aiohttp client must be created inside the running event loop
+        return None
+
+    @classmethod
+    @contextlib.asynccontextmanager
+    async def using(
+        cls, session: Optional["AoCAsyncSession"], config: Optional[AoCConfig] = None
+    ) -> AsyncIterator["AoCAsyncSession"]:
+        """Yield `session`, or a temporary one closed on exit if it is None."""
+        if session is not None:
+            yield session
+            return
+        async with cls(config) as temporary:
+            yield temporary
+
+    async def __aenter__(self) -> "AoCAsyncSession":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+    def _get_client(self):
+        if self._client is None:
+            aiohttp = _import_aiohttp()
+            self._client = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+                timeout=aiohttp.ClientTimeout(
+                    sock_connect=self.timeout[0], sock_read=self.timeout[1]
+                ),
+                cookies={"session": self.session_cookie},
+                headers={"User-Agent": "PySleigh/0.1"},
+            )
+            self.logger.info(
+                f"Built authenticated async AoC Session (pool size {self.pool_size})"
+            )
+        return self._client
+
+    async def _send(self, method: str, url: str, **kwargs) -> AoCAsyncResponse:
+        aiohttp = _import_aiohttp()
+        try:
+            async with self._get_client().request(method, url, **kwargs) as resp:
+                return AoCAsyncResponse(
+                    resp.status, await resp.text(), dict(resp.headers)
+                )
+        except aiohttp.ClientError as e:
+            raise ConnectionError(str(e)) from e
+
+    async def get(
+        self, url: str, conditional: bool = False, **kwargs
+    ) -> AoCAsyncResponse:
+        if conditional:
+            headers = self.validators.headers_for(url)
+            if headers:
+                kwargs["headers"] = {**headers, **kwargs.get("headers", {})}
+
+        self.logger.debug(f"Making async GET request to {url}")
+        response = await self._request_async("GET", url, self.retries, **kwargs)
+        self.logger.info(f"GET {url} - Status {response.status_code}")
+        if response.status_code == 200:
+            self.validators.update(url, response.headers)
+        return response
+
+    async def post(
+        self, url: str, data: Optional[dict] = None, **kwargs
+    ) -> AoCAsyncResponse:
+        self.logger.debug(f"Making async POST request to {url} with data: {data}")
+        # Submissions are not idempotent, so a POST is never retried
+        response = await self._request_async("POST", url, 0, data=data, **kwargs)
+        self.logger.info(f"POST {url} - Status {response.status_code}")
+        return response
+
+    async def _request_async(
+        self, method: str, url: str, retries: int, **kwargs
+    ) -> AoCAsyncResponse:
+        """The async twin of AoCSession._request."""
+        for attempt in range(retries + 1):
+            # A half-open trial is a single attempt, never retried
+            trial = self.breaker.before_request()
+            response = None
+            try:
+                await self.limiter.acquire_async()
+                response = await self.transport(method, url, **kwargs)
+            except (ConnectionError, asyncio.TimeoutError) as e:
+                if attempt == retries or trial:
+                    self.breaker.record_failure()
+                    raise
+                self.logger.warning(f"Request to {url} failed: {e}")
+            except BaseException:
+                # Never leave the circuit waiting on a trial that is gone
+                if trial:
+                    self.breaker.record_failure()
+                raise
+            else:
+                if response.status_code not in self.RETRY_STATUSES:
+                    self.breaker.record_success()
+                    return response
+                if attempt == retries or trial:
+                    self.breaker.record_failure()
+                    return response
+                self.logger.warning(f"{url} returned {response.status_code}")
+
+            delay = self._delay(attempt, response)
+            self.logger.info(
+                f"Retrying {url} in {delay:.2f}s ({attempt + 1}/{retries})"
+            )
+            await asyncio.sleep(delay)
@@ -0,0 +1,80 @@
+import threading
+import time
+
+from pysleigh.utilities.logger import AoCLogger
+
+
+class AoCCircuitOpenError(RuntimeError):
+    """Raised instead of sending a request while the circuit is open."""
+
+
+class AoCCircuitBreaker:
+    """
+    Stop talking to a server that keeps failing.
+
+    After `threshold` consecutive failed requests the circuit opens and every
+    request fails fast with AoCCircuitOpenError. Once `cooldown` seconds have
+    passed one trial request is let through, and other callers keep failing
+    fast until it finishes: success closes the circuit, failure opens it for
+    another cooldown.
+    """
+
+    logger = AoCLogger().get_logger()
+
+    def __init__(self, threshold: int = 5, cooldown: float = 60.0):
+        self.threshold = max(threshold, 1)
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: float | None = None
+        # Half-open: a trial request is out and others must wait for it
+        self.trial = False
+        self.lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def before_request(self) -> bool:
+        """
+        Returns:
+            bool: Whether this request is the half-open trial. The caller must
+                report its outcome with record_success or record_failure.
+
+        Raises:
+            AoCCircuitOpenError: While the circuit is open or a trial is out.
+        """
+        with self.lock:
+            if self.trial:
+                raise AoCCircuitOpenError(
+                    "Circuit half-open; waiting for the trial request to finish."
+                )
+            if self.opened_at is None:
+                return False
+            remaining = self.opened_at + self.cooldown - time.monotonic()
+            if remaining > 0:
+                raise AoCCircuitOpenError(
+                    f"Circuit open after {self.failures} consecutive failures; "
+                    f"retry in {remaining:.0f}s."
+                )
+            # Half-open: let this request through as a trial
+            self.opened_at = None
+            self.failures = self.threshold - 1
+            self.trial = True
+            return True
+
+    def record_success(self) -> None:
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+            self.trial = False
+
+    def record_failure(self) -> None:
+        with self.lock:
+            self.trial = False
+            self.failures += 1
+            if self.failures >= self.threshold and self.opened_at is None:
+                self.opened_at = time.monotonic()
+                self.logger.error(
+                    f"{self.failures} consecutive request failures. "
+                    f"Opening circuit for {self.cooldown:.0f}s."
+                )
@@ -0,0 +1,168 @@
+import argparse
+import json
+import socket
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from pysleigh.utilities.config import AoCConfig
+
+# Kept free of typer, requests and the fetch modules: this module is the
+# whole start-up cost of `pysleigh-client`.
+
+DEFAULT_CACHE_PATH = Path("~/.cache/pysleigh")
+
+
+def get_socket_path(config: AoCConfig) -> Path:
+    """[daemon].socket, or daemon.sock in the [cache] directory."""
+    daemon_cfg = config.config.get("daemon", {})
+    if daemon_cfg.get("socket"):
+        return Path(daemon_cfg["socket"]).expanduser()
+    cache_cfg = config.config.get("cache", {})
+    base_path = Path(cache_cfg.get("path", str(DEFAULT_CACHE_PATH))).expanduser()
+    return base_path / "daemon.sock"
+
+
+class AoCDaemonClient:
+    """
+    Send one request to a running `pysleigh daemon` and return its reply.
+
+    Requests and replies are single lines of JSON. A reply always has "ok";
+    successful ones carry "result" and the captured "output" of the run.
+    """
+
+    def __init__(self, socket_path: str | Path, timeout: Optional[float] = None):
+        self.socket_path = Path(socket_path).expanduser()
+        self.timeout = timeout
+
+    def request(self, command: str, **params) -> dict:
+        """
+        Raises:
+            ConnectionError: If no daemon is listening on the socket.
+        """
+        payload = json.dumps({"command": command, **params}).encode() + b"\n"
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(self.timeout)
+            try:
+                sock.connect(str(self.socket_path))
+            except (FileNotFoundError, ConnectionRefusedError) as e:
+                raise ConnectionError(
+                    f"No pysleigh daemon is listening on {self.socket_path}. "
+                    "Start one with `pysleigh daemon start`."
+                ) from e
+            sock.sendall(payload)
+            with sock.makefile("rb") as reply:
+                line = reply.readline()
+        if not line:
+            raise ConnectionError("The daemon closed the connection without replying")
+        return json.loads(line)
+
+    def ping(self) -> Optional[dict]:
+        """The daemon's status, or None if it is not running."""
+        try:
+            return self.request("ping").get("result")
+        except ConnectionError:
+            return None
+
+
+def _format_run(result: dict) -> List[str]:
+    lines = [
+        f"Parse: took {result['time_parse']:.6f}s",
+        f"Part 1: {result['part1']} (took {result['time_part1']:.6f}s)",
+        f"Part 2: {result['part2']} (took {result['time_part2']:.6f}s)",
+        f"Total: {result['time_total']:.6f}s",
+    ]
+    if "tests_passed" in result:
+        lines.append(
+            "✅ Tests passed." if result["tests_passed"] else "❌ Some tests failed."
+        )
+    return lines
+
+
+def _format_benchmark(result: dict) -> List[str]:
+    return [
+        f"{result['year']}-Day{result['day']:02d} ✓ parse: {result['avg_parse']:.6f}s, "
+        f"avg1: {result['avg_part1']:.6f}s, avg2: {result['avg_part2']:.6f}s, "
+        f"total: {result['avg_total']:.6f}s over {result['runs']} runs"
+    ]
+
+
+def _report(command: str, reply: dict) -> bool:
+    if reply.get("output"):
+        print(reply["output"], end="")
+    if not reply.get("ok"):
+        print(f"[Error] {reply.get('error', 'request failed')}", file=sys.stderr)
+        return False
+
+    result = reply.get("result")
+    if reply.get("reloaded"):
+        print(f"Reloaded: {', '.join(reply['reloaded'])}")
+    if command == "run":
+        if result.get("status") == "timeout":
+            print(f"⏱ Timed out in {result.get('phase', 'setup')}.")
+            return False
+        if "time_total" not in result:
+            print("[Error] Solution failed, see the output above.", file=sys.stderr)
+            return False
+        print("\n".join(_format_run(result)))
+        return result.get("tests_passed", True)
+    if command == "test":
+        print("✅ Tests passed." if result else "❌ Some tests failed.")
+        return bool(result)
+    if command == "benchmark":
+        if not result or not result.get("runs"):
+            print("[Error] Benchmark failed, see the daemon log.", file=sys.stderr)
+            return False
+        print("\n".join(_format_benchmark(result)))
+        return True
+    if command == "ping":
+        print(
+            f"pysleigh daemon {result['pid']} up {result['uptime']:.0f}s, "
+            f"{result['requests']} request(s) served, "
+            f"{result['modules']} solution module(s) loaded"
+        )
+    return True
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point of `pysleigh-client`, a fast front end to the daemon."""
+    parser = argparse.ArgumentParser(
+        prog="pysleigh-client",
+        description="Run solutions, tests and benchmarks on a warm pysleigh daemon.",
+    )
+    parser.add_argument("--socket", help="Daemon socket (default: from config)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    for name, help_text in (
+        ("run", "Run a solution"),
+        ("test", "Run a day's tests"),
+        ("benchmark", "Benchmark a solution"),
+    ):
+        sub = commands.add_parser(name, help=help_text)
+        sub.add_argument("--year", type=int, help="Year (default: latest)")
+        sub.add_argument("--day", type=int, help="Day (default: latest)")
+        if name == "run":
+            sub.add_argument("--test", action="store_true", help="Also run tests")
+        if name == "benchmark":
+            sub.add_argument("--runs", type=int, default=5, help="Timed runs")
+            sub.add_argument("--warmup", type=int, default=1, help="Warmup runs")
+    commands.add_parser("status", help="Show whether the daemon is running")
+    commands.add_parser("stop", help="Stop the daemon")
+    args = parser.parse_args(argv)
+
+    socket_path = args.socket or get_socket_path(AoCConfig())
+    params = {
+        key: value
+        for key, value in vars(args).items()
+        if key not in ("socket", "command") and value is not None
+    }
+    command = {"status": "ping", "stop": "shutdown"}.get(args.command, args.command)
+    try:
+        reply = AoCDaemonClient(socket_path).request(command, **params)
+    except ConnectionError as e:
+        print(f"[Error] {e}", file=sys.stderr)
+        return 1
+    return 0 if _report(command, reply) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,4 @@
-from typing import Tuple, Optional
+from typing import List, Tuple, Optional
 from datetime import datetime
 from zoneinfo import ZoneInfo
 from pysleigh.utilities.logger import AoCLogger
@@ -27,6 +27,15 @@ class AoCDate:
             return now.year - 1, AOC_MAX_DAY
         return now.year, min(now.day, AOC_MAX_DAY)
 
+    @staticmethod
+    def released_days(year: int) -> List[int]:
+        """Return the days of `year` that are unlocked so far."""
+        max_year, max_day = AoCDate._compute_max_date()
+        if year < AOC_START_YEAR or year > max_year:
+            return []
+        last = max_day if year == max_year else AOC_MAX_DAY
+        return list(range(1, last + 1))
+
     def _is_valid(self) -> bool:
         return self._validation_message() is None
 
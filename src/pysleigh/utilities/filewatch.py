@@ -0,0 +1,201 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from pysleigh.utilities.logger import AoCLogger
+
+IN_MODIFY = 0x002
+IN_ATTRIB = 0x004
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_FROM = 0x040
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_Q_OVERFLOW = 0x4000
+WATCH_MASK = (
+    IN_MODIFY
+    | IN_ATTRIB
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+)
+EVENT_HEADER = struct.Struct("iIII")
+
+
+class AoCFileWatcher:
+    """
+    Wait for changes to a set of files, coalescing bursts of saves.
+
+    On Linux this uses inotify (through ctypes, no extra dependency) on the
+    files' directories, which also catches editors that save by replacing
+    the file. Elsewhere, or if inotify is unavailable, it polls each file's
+    mtime and size every `poll_interval` seconds.
+
+        watcher = AoCFileWatcher([solution_path, input_path])
+        while True:
+            changed = watcher.wait()
+    """
+
+    logger = AoCLogger().get_logger()
+
+    def __init__(
+        self,
+        paths: Iterable[str | Path],
+        debounce: float = 0.2,
+        poll_interval: float = 0.5,
+        backend: str = "auto",
+    ):
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.paths: Set[Path] = set()
+        self._fd: Optional[int] = None
+        self._watches: Dict[int, Path] = {}
+        self._signatures: Dict[Path, Optional[Tuple[int, int]]] = {}
+        if backend in ("auto", "inotify"):
+            self._fd = self._inotify_init()
+            if self._fd is None and backend == "inotify":
+                raise OSError("inotify is not available on this system")
+        self.backend = "inotify" if self._fd is not None else "polling"
+        self.logger.debug(f"Watching files with {self.backend}")
+        self.update(paths)
+
+    @staticmethod
+    def _libc():
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        except OSError:
+            return None
+        if not hasattr(libc, "inotify_init1"):
+            return None
+        return libc
+
+    def _inotify_init(self) -> Optional[int]:
+        libc = self._libc()
+        if libc is None:
+            return None
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            self.logger.warning(
+                f"inotify_init1 failed: {os.strerror(ctypes.get_errno())}"
+            )
+            return None
+        self._inotify_add_watch = libc.inotify_add_watch
+        return fd
+
+    @staticmethod
+    def _signature(path: Path) -> Optional[Tuple[int, int]]:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def update(self, paths: Iterable[str | Path]) -> None:
+        """Replace the set of watched files (e.g. after a new helper import)."""
+        self.paths = {Path(path).expanduser().resolve() for path in paths}
+        self._signatures = {path: self._signature(path) for path in self.paths}
+        if self._fd is None:
+            return
+        watched = set(self._watches.values())
+        for directory in {path.parent for path in self.paths} - watched:
+            wd = self._inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+            if wd < 0:
+                self.logger.warning(
+                    f"Cannot watch {directory}: {os.strerror(ctypes.get_errno())}"
+                )
+                continue
+            self._watches[wd] = directory
+
+    def _read_events(self, timeout: Optional[float]) -> Set[Path]:
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+        changed, offset = set(), 0
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                # Events were dropped; assume everything changed
+                return set(self.paths)
+            directory = self._watches.get(wd)
+            if directory is not None and name:
+                path = directory / os.fsdecode(name)
+                if path in self.paths:
+                    changed.add(path)
+        return changed
+
+    def _poll(self) -> Set[Path]:
+        changed = set()
+        for path in self.paths:
+            signature = self._signature(path)
+            if signature != self._signatures.get(path):
+                self._signatures[path] = signature
+                changed.add(path)
+        return changed
+
+    def _next(self, timeout: Optional[float]) -> Set[Path]:
+        """The next change to a watched file, or an empty set after `timeout`."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = (
+                None if deadline is None else max(deadline - time.monotonic(), 0)
+            )
+            if self._fd is not None:
+                # Events for other files in the same directories are skipped
+                changed = self._read_events(remaining)
+            else:
+                changed = self._poll()
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            if self._fd is None:
+                interval = self.poll_interval
+                if remaining is not None:
+                    interval = min(interval, remaining)
+                time.sleep(interval)
+
+    def wait(self, timeout: Optional[float] = None) -> Set[Path]:
+        """
+        Block until watched files change, then keep collecting until they
+        have been quiet for `debounce` seconds.
+
+        Returns:
+            Set[Path]: The changed files, or an empty set on timeout.
+        """
+        changed = self._next(timeout)
+        if not changed:
+            return set()
+        while True:
+            more = self._next(self.debounce)
+            if not more:
+                return changed
+            changed |= more
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+            self._watches = {}
+
+    def __enter__(self) -> "AoCFileWatcher":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
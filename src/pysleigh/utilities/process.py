@@ -0,0 +1,188 @@
+import os
+import time
+import multiprocessing
+from multiprocessing.connection import Connection, wait
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from pysleigh.utilities.logger import AoCLogger
+
+# Connection back to the parent, set only inside worker processes
+_progress_conn: Optional[Connection] = None
+
+
+def _child_main(
+    conn: Connection, target: Callable[..., dict], kwargs: dict, cpu: Optional[int]
+) -> None:
+    global _progress_conn
+    _progress_conn = conn
+    if cpu is not None:
+        os.sched_setaffinity(0, {cpu})
+    try:
+        result = target(**kwargs)
+    except Exception as e:
+        result = {**kwargs, "status": "error", "error": str(e)}
+    conn.send(("result", result))
+    conn.close()
+
+
+class AoCProcessPool:
+    """
+    Run tasks in isolated, single-use worker processes.
+
+    Every task gets a fresh interpreter, so leaked state from one solution
+    never reaches the next, and a task that overruns its timeout is killed
+    without blocking the rest of the queue.
+    """
+
+    logger = AoCLogger().get_logger()
+
+    def __init__(
+        self,
+        jobs: int = 1,
+        timeout: Optional[float] = None,
+        pin_cpus: bool = False,
+        start_method: str = "spawn",
+        phase_timeout: Optional[float] = None,
+        untimed_phases: Tuple[str, ...] = (),
+    ):
+        self.jobs = max(jobs, 1)
+        self.timeout = timeout
+        self.phase_timeout = phase_timeout
+        # Phases phase_timeout does not apply to (the overall timeout still does)
+        self.untimed_phases = frozenset(untimed_phases)
+        self.context = multiprocessing.get_context(start_method)
+        self.cpus: List[int] = []
+
+        if pin_cpus:
+            if hasattr(os, "sched_setaffinity"):
+                self.cpus = sorted(os.sched_getaffinity(0))
+            else:
+                self.logger.warning("CPU pinning is not supported on this platform.")
+
+    @staticmethod
+    def in_worker() -> bool:
+        return _progress_conn is not None
+
+    @staticmethod
+    def report_phase(phase: str) -> None:
+        """
+        Tell the parent that the current task entered a new phase, restarting
+        its phase_timeout clock. A no-op outside worker processes.
+        """
+        if _progress_conn is not None:
+            _progress_conn.send(("phase", phase))
+
+    def _start(self, slot: int, target: Callable[..., dict], kwargs: dict) -> dict:
+        parent_conn, child_conn = self.context.Pipe(duplex=False)
+        cpu = self.cpus[slot % len(self.cpus)] if self.cpus else None
+        process = self.context.Process(
+            target=_child_main, args=(child_conn, target, kwargs, cpu)
+        )
+        process.start()
+        child_conn.close()
+        return {
+            "process": process,
+            "conn": parent_conn,
+            "kwargs": kwargs,
+            "slot": slot,
+            "started": time.monotonic(),
+            "phase": None,
+            "phase_started": time.monotonic(),
+        }
+
+    def _overran(self, worker: dict, now: float) -> bool:
+        if self.timeout is not None and now - worker["started"] > self.timeout:
+            self.logger.error(
+                f"Worker for {worker['kwargs']} exceeded {self.timeout}s. Killing."
+            )
+            return True
+        if (
+            self.phase_timeout is not None
+            and worker["phase"] is not None
+            and worker["phase"] not in self.untimed_phases
+            and now - worker["phase_started"] > self.phase_timeout
+        ):
+            self.logger.error(
+                f"Worker for {worker['kwargs']} spent more than {self.phase_timeout}s "
+                f"in {worker['phase']}. Killing."
+            )
+            return True
+        return False
+
+    def _finish(self, worker: dict, result: Dict[str, Any]) -> Dict[str, Any]:
+        worker["conn"].close()
+        worker["process"].join()
+        return result
+
+    def map(self, target: Callable[..., dict], tasks: List[dict]) -> List[dict]:
+        """
+        Run target(**task) for each task and collect the results in task order.
+
+        Args:
+            target (Callable[..., dict]): A picklable callable returning a dict.
+            tasks (List[dict]): Keyword arguments for each call.
+
+        Returns:
+            List[dict]: One result per task. Tasks that time out or crash yield
+            their kwargs plus a "status" of "timeout" or "error"; timeouts also
+            carry the last reported "phase".
+        """
+        results: List[Optional[dict]] = [None] * len(tasks)
+        pending = list(enumerate(tasks))
+        running: Dict[int, dict] = {}
+        free_slots = list(range(self.jobs))
+
+        try:
+            self._run(target, pending, running, free_slots, results)
+        finally:
+            # Never leave workers behind if the parent is interrupted
+            for worker in running.values():
+                worker["process"].kill()
+                self._finish(worker, {})
+
+        return [r if r is not None else {} for r in results]
+
+    def _run(
+        self,
+        target: Callable[..., dict],
+        pending: List[Tuple[int, dict]],
+        running: Dict[int, dict],
+        free_slots: List[int],
+        results: List[Optional[dict]],
+    ) -> None:
+        while pending or running:
+            while pending and free_slots:
+                index, kwargs = pending.pop(0)
+                running[index] = self._start(free_slots.pop(0), target, kwargs)
+
+            ready = wait([w["conn"] for w in running.values()], timeout=0.05)
+            now = time.monotonic()
+
+            for index, worker in list(running.items()):
+                if worker["conn"] in ready:
+                    try:
+                        kind, payload = worker["conn"].recv()
+                    except EOFError:
+                        exitcode = worker["process"].exitcode
+                        self.logger.error(
+                            f"Worker for {worker['kwargs']} exited without a result "
+                            f"(exit code {exitcode})."
+                        )
+                        result = {**worker["kwargs"], "status": "error"}
+                    else:
+                        if kind == "phase":
+                            worker["phase"] = payload
+                            worker["phase_started"] = time.monotonic()
+                            continue
+                        result = payload
+                elif self._overran(worker, now):
+                    worker["process"].kill()
+                    result = {**worker["kwargs"], "status": "timeout"}
+                    if worker["phase"]:
+                        result["phase"] = worker["phase"]
+                else:
+                    continue
+
+                results[index] = self._finish(worker, result)
+                free_slots.append(worker["slot"])
+                del running[index]
@@ -0,0 +1,76 @@
+import asyncio
+import threading
+import time
+from typing import Optional
+
+from pysleigh.utilities.config import AoCConfig
+from pysleigh.utilities.logger import AoCLogger
+
+
+class AoCRateLimiter:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill at `rate` per second up to `burst`; each request takes one
+    and blocks until one is available, so concurrent fetches never exceed
+    the configured request rate.
+    """
+
+    logger = AoCLogger().get_logger()
+    DEFAULT_RATE = 2.0
+    DEFAULT_BURST = 5
+
+    def __init__(self, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST):
+        if rate <= 0:
+            raise ValueError("Rate limit must be positive.")
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Optional[AoCConfig] = None) -> "AoCRateLimiter":
+        session_cfg = (config or AoCConfig()).config.get("session", {})
+        return cls(
+            rate=float(session_cfg.get("rate_limit", cls.DEFAULT_RATE)),
+            burst=int(session_cfg.get("burst", cls.DEFAULT_BURST)),
+        )
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def _try_acquire(self) -> float:
+        """Take a token if one is available; otherwise return the wait needed."""
+        with self.lock:
+            self._refill(time.monotonic())
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+    def acquire(self) -> float:
+        """
+        Take one token, sleeping until it is available.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        waited = 0.0
+        while delay := self._try_acquire():
+            time.sleep(delay)
+            waited += delay
+        if waited:
+            self.logger.debug(f"Rate limited for {waited:.2f}s")
+        return waited
+
+    async def acquire_async(self) -> float:
+        """Like acquire(), but yields to the event loop while waiting."""
+        waited = 0.0
+        while delay := self._try_acquire():
+            await asyncio.sleep(delay)
+            waited += delay
+        if waited:
+            self.logger.debug(f"Rate limited for {waited:.2f}s")
+        return waited
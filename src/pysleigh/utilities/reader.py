@@ -0,0 +1,179 @@
+import mmap
+from pathlib import Path
+from typing import Iterator, Optional
+
+from pysleigh.utilities.logger import AoCLogger
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "Grid arrays need NumPy. Install it with `pip install pysleigh[numpy]`."
+        ) from e
+    return numpy
+
+
+class AoCGrid:
+    """
+    Fixed-width character grid viewed in place over an input's bytes.
+
+    Cells are byte values (e.g. `grid[r, c] == ord("#")`); rows are
+    memoryview slices, so nothing is copied until you ask for it.
+    """
+
+    def __init__(self, buffer: memoryview, width: int, stride: int, height: int):
+        self.buffer = buffer
+        self.width = width
+        self.stride = stride
+        self.height = height
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.height, self.width
+
+    def __len__(self) -> int:
+        return self.height
+
+    def __getitem__(self, position: tuple[int, int]) -> int:
+        row, col = position
+        if not (0 <= row < self.height and 0 <= col < self.width):
+            raise IndexError(f"{position} is outside a {self.shape} grid")
+        return self.buffer[row * self.stride + col]
+
+    def row(self, row: int) -> memoryview:
+        start = row * self.stride
+        return self.buffer[start : start + self.width]
+
+    def rows(self) -> Iterator[memoryview]:
+        for row in range(self.height):
+            yield self.row(row)
+
+    def to_numpy(self):
+        """
+        Return a read-only (height, width) uint8 array sharing the input's
+        memory; line endings are skipped via strides rather than copied out.
+        """
+        np = _import_numpy()
+        return np.ndarray(
+            shape=self.shape,
+            dtype=np.uint8,
+            buffer=self.buffer,
+            strides=(self.stride, 1),
+        )
+
+
+class AoCInputReader:
+    """
+    Memory-mapped access to a puzzle input for solutions with large inputs.
+
+    Unlike reading the file into a str, the input is mapped read-only and
+    exposed as bytes-level views, lines are produced lazily, and grids are
+    addressed in place:
+
+        with AoCInputReader(input_path) as reader:
+            total = sum(int(line) for line in reader.lines() if line)
+            grid = reader.grid()
+    """
+
+    logger = AoCLogger().get_logger()
+
+    def __init__(self, input_path: str | Path):
+        self.input_path = Path(input_path)
+        self._file = self.input_path.open("rb")
+        try:
+            self._map: Optional[mmap.mmap] = mmap.mmap(
+                self._file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        except ValueError:
+            # Empty files cannot be mapped
+            self._map = None
+        self._view = memoryview(self._map if self._map is not None else b"")
+        self.logger.debug(f"Mapped {len(self._view)} bytes of {self.input_path}")
+
+    def __enter__(self) -> "AoCInputReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    @property
+    def view(self) -> memoryview:
+        """Zero-copy view of the whole input."""
+        return self._view
+
+    def read_bytes(self) -> bytes:
+        return self._view.tobytes()
+
+    def read_text(self, encoding: str = "utf-8") -> str:
+        return str(self._view, encoding)
+
+    def lines(self, keepends: bool = False) -> Iterator[bytes]:
+        """
+        Yield lines as bytes one at a time, without splitting the whole input.
+        A trailing newline does not produce a final empty line.
+        """
+        data = self._map if self._map is not None else b""
+        start, size = 0, len(data)
+        while start < size:
+            end = data.find(b"\n", start)
+            if end == -1:
+                end = size
+            line = data[start : end + 1 if keepends else end]
+            if not keepends and line.endswith(b"\r"):
+                line = line[:-1]
+            yield line
+            start = end + 1
+
+    def grid(self) -> AoCGrid:
+        """
+        View the input as a fixed-width grid.
+
+        Raises:
+            ValueError: If the lines are not all the same width.
+        """
+        data = self._view
+        source = self._map if self._map is not None else b""
+        first_newline = source.find(b"\n")
+        if first_newline == -1:
+            return AoCGrid(data, len(data), len(data) + 1, 1 if len(data) else 0)
+
+        crlf = first_newline > 0 and data[first_newline - 1] == ord("\r")
+        width = first_newline - 1 if crlf else first_newline
+        stride = first_newline + 1
+        size = len(data)
+        # The last line may or may not end with a newline
+        height, tail = divmod(size, stride)
+        if tail == width:
+            height += 1
+        elif tail:
+            raise ValueError(
+                f"{self.input_path} is not a grid: expected lines of width {width}"
+            )
+        terminator = ord("\r") if crlf else ord("\n")
+        for row in range(height):
+            start = row * stride
+            end = start + width
+            if source.find(b"\n", start, end) != -1 or (
+                end < size and data[end] != terminator
+            ):
+                raise ValueError(
+                    f"{self.input_path} is not a grid: line {row + 1} has a "
+                    f"different width"
+                )
+        return AoCGrid(data, width, stride, height)
+
+    def close(self) -> None:
+        try:
+            self._view.release()
+            if self._map is not None:
+                self._map.close()
+        except BufferError:
+            # Views handed out (rows, a NumPy grid) still reference the
+            # mapping; it is unmapped once they are garbage collected
+            pass
+        self._file.close()
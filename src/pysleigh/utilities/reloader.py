@@ -0,0 +1,194 @@
+import ast
+import contextlib
+import importlib
+import importlib.util
+import os
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from pysleigh.utilities.logger import AoCLogger
+
+
+class AoCModuleReloader:
+    """
+    Keep the modules imported from a solutions directory up to date.
+
+    Only modules whose source changed are refreshed, along with the modules
+    that import them (a `from helpers import f` keeps the old f until the
+    importer is refreshed too). Modules from anywhere else are never touched.
+    """
+
+    logger = AoCLogger().get_logger()
+
+    def __init__(self, root: str | Path | None):
+        self.root = Path(root).expanduser() if root else None
+        # Module name -> (id of the module object, source mtime when tracked)
+        self._mtimes: Dict[str, Tuple[int, Optional[int]]] = {}
+        # Source path -> (mtime, module names it imports)
+        self._imports: Dict[str, Tuple[Optional[int], Set[str]]] = {}
+
+    def loaded(self) -> Dict[str, ModuleType]:
+        """Loaded modules whose source lives under the root."""
+        if self.root is None:
+            return {}
+        prefixes = tuple({str(self.root) + os.sep, str(self.root.resolve()) + os.sep})
+        return {
+            name: module
+            for name, module in list(sys.modules.items())
+            if isinstance(getattr(module, "__file__", None), str)
+            and module.__file__.startswith(prefixes)
+        }
+
+    @staticmethod
+    def _mtime(path: str) -> Optional[int]:
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    def track(self) -> None:
+        """Record the source mtime of every module imported since the last call."""
+        tracked = {}
+        for name, module in self.loaded().items():
+            seen = self._mtimes.get(name)
+            if seen is None or seen[0] != id(module):
+                seen = (id(module), self._mtime(module.__file__))
+            tracked[name] = seen
+        self._mtimes = tracked
+
+    def changed(self) -> Set[str]:
+        """Tracked modules whose source mtime moved since they were tracked."""
+        return {
+            name
+            for name, module in self.loaded().items()
+            if self._mtimes.get(name, (None,))[0] == id(module)
+            and self._mtime(module.__file__) != self._mtimes[name][1]
+        }
+
+    def modules_for(self, paths: Iterable[str | Path]) -> Set[str]:
+        """Loaded modules whose source is one of `paths`."""
+        wanted = {Path(path).resolve() for path in paths}
+        return {
+            name
+            for name, module in self.loaded().items()
+            if Path(module.__file__).resolve() in wanted
+        }
+
+    def imports(self, module: ModuleType) -> Set[str]:
+        """Module names `module` imports in its source, relative ones resolved."""
+        path = module.__file__
+        mtime = self._mtime(path)
+        cached = self._imports.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        try:
+            tree = ast.parse(Path(path).read_text())
+        except (OSError, SyntaxError, ValueError):
+            return set()
+        names = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names |= {alias.name for alias in node.names}
+            elif isinstance(node, ast.ImportFrom):
+                base = node.module or ""
+                if node.level:
+                    try:
+                        base = importlib.util.resolve_name(
+                            "." * node.level + base, module.__package__ or ""
+                        )
+                    except (ImportError, ValueError):
+                        continue
+                names.add(base)
+                # `from pkg import submodule`
+                names |= {f"{base}.{alias.name}" for alias in node.names}
+        self._imports[path] = (mtime, names)
+        return names
+
+    def uses(self, module: ModuleType, names: Set[str]) -> bool:
+        """
+        Whether `module` imports one of `names`, or holds an object defined
+        in one (which also catches imports made at run time).
+        """
+        if self.imports(module) & names:
+            return True
+        for value in list(vars(module).values()):
+            if isinstance(value, ModuleType):
+                owner = value.__name__
+                if owner.startswith(module.__name__ + "."):
+                    # A package's own submodules are attributes, not uses
+                    continue
+            else:
+                owner = getattr(value, "__module__", None)
+            if owner in names:
+                return True
+        return False
+
+    def affected(self, names: Set[str]) -> Set[str]:
+        """`names` plus every loaded module that uses them, transitively."""
+        loaded = self.loaded()
+        stale = {name for name in names if name in loaded}
+        while True:
+            dependents = {
+                name for name in loaded.keys() - stale if self.uses(loaded[name], stale)
+            }
+            if not dependents:
+                return stale
+            stale |= dependents
+
+    @staticmethod
+    def _drop_bytecode(module: ModuleType) -> None:
+        # The bytecode cache only records the source mtime to the second, so
+        # a quick second save of the same size could otherwise load old code
+        with contextlib.suppress(OSError, NotImplementedError, ValueError):
+            Path(importlib.util.cache_from_source(module.__file__)).unlink()
+
+    def evict(self, names: Set[str]) -> List[str]:
+        """Remove modules from sys.modules so their next import is fresh."""
+        # A fresh package would lack attributes for submodules still loaded
+        names = set(names) | {
+            name
+            for name in self.loaded()
+            if any(name.startswith(package + ".") for package in names)
+        }
+        for name in sorted(names):
+            self._drop_bytecode(sys.modules[name])
+            del sys.modules[name]
+        if names:
+            importlib.invalidate_caches()
+            self.logger.info(f"Unloaded {', '.join(sorted(names))}")
+        return sorted(names)
+
+    def reload(self, names: Set[str]) -> List[str]:
+        """
+        importlib.reload() modules in place, each after the modules it uses.
+
+        Raises:
+            Exception: Whatever the first failing module raised (e.g. a
+                SyntaxError); modules after it are left unreloaded.
+        """
+        remaining = set(names)
+        order: List[str] = []
+        while remaining:
+            ready = {
+                name
+                for name in remaining
+                if not self.uses(sys.modules[name], remaining - {name})
+            }
+            # Modules that use each other are reloaded in name order
+            batch = sorted(ready or remaining)
+            order += batch
+            remaining -= set(batch)
+
+        importlib.invalidate_caches()
+        for name in order:
+            module = sys.modules[name]
+            self._drop_bytecode(module)
+            importlib.reload(module)
+            # Reloading keeps the module object, so track() would not notice
+            self._mtimes[name] = (id(module), self._mtime(module.__file__))
+        if order:
+            self.logger.info(f"Reloaded {', '.join(order)}")
+        self.track()
+        return order
@@ -1,44 +1,146 @@
+import hashlib
+import random
+import threading
+import time
 import requests
-from typing import Optional
+from requests.adapters import HTTPAdapter
+from typing import Dict, Optional
 from pysleigh.utilities.logger import AoCLogger
 from pysleigh.utilities.config import AoCConfig
+from pysleigh.utilities.circuit import AoCCircuitBreaker
+from pysleigh.utilities.ratelimit import AoCRateLimiter
+from pysleigh.utilities.validators import AoCValidatorStore
 
 
 class AoCSession:
     logger = AoCLogger().get_logger()
+    DEFAULT_BASE_URL = "https://adventofcode.com"
+    DEFAULT_POOL_SIZE = 10
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+    _shared: Dict[tuple, "AoCSession"] = {}
+    _shared_lock = threading.Lock()
 
     def __init__(self, config: Optional[AoCConfig] = None) -> None:
         config = config or AoCConfig()
         self.session_cookie = config.config.get("session_cookie", {}).get(
             "session_cookie", ""
         )
+        self.pool_size = self.get_pool_size(config)
+        self.limiter = AoCRateLimiter.from_config(config)
+        self.validators = AoCValidatorStore(config, self.get_account(config))
+
+        session_cfg = config.config.get("session", {})
+        self.retries = int(session_cfg.get("retries", 3))
+        self.backoff = float(session_cfg.get("backoff", 0.5))
+        self.backoff_max = float(session_cfg.get("backoff_max", 30.0))
+        self.timeout = (
+            float(session_cfg.get("connect_timeout", 5.0)),
+            float(session_cfg.get("read_timeout", 30.0)),
+        )
+        self.breaker = AoCCircuitBreaker(
+            threshold=int(session_cfg.get("breaker_threshold", 5)),
+            cooldown=float(session_cfg.get("breaker_cooldown", 60.0)),
+        )
 
         if not self.session_cookie:
             self.logger.warning("No session cookie provided. AoC requests may fail.")
 
         self.session = self.build_session()
 
+    @classmethod
+    def get_pool_size(cls, config: AoCConfig) -> int:
+        session_cfg = config.config.get("session", {})
+        return int(session_cfg.get("pool_size", cls.DEFAULT_POOL_SIZE))
+
+    @staticmethod
+    def get_account(config: AoCConfig) -> str:
+        """Short hash of the session cookie, naming the account it logs into."""
+        cookie = config.config.get("session_cookie", {}).get("session_cookie", "")
+        return hashlib.sha256(cookie.encode()).hexdigest()[:12]
+
+    @classmethod
+    def get_base_url(cls, config: Optional[AoCConfig] = None) -> str:
+        """
+        Return `[session].base_url`, the site every fetch and submit goes to.
+        Point it at `pysleigh serve-fixtures` to work offline.
+        """
+        config = config or AoCConfig()
+        session_cfg = config.config.get("session", {})
+        return session_cfg.get("base_url", cls.DEFAULT_BASE_URL).rstrip("/")
+
+    @classmethod
+    def shared(cls, config: Optional[AoCConfig] = None) -> "AoCSession":
+        """
+        Return the process-wide session for these settings, building it on
+        first use. Reusing it keeps connections to the site alive across
+        fetches, so bulk prep pays for one TLS handshake instead of one per
+        request.
+        """
+        config = config or AoCConfig()
+        key = cls._settings_key(config)
+        with cls._shared_lock:
+            if key not in cls._shared:
+                cls._shared[key] = cls(config)
+            return cls._shared[key]
+
+    @staticmethod
+    def _settings_key(config: AoCConfig) -> tuple:
+        """Everything __init__ reads: the cookie, [session] and the cache path."""
+        cookie = config.config.get("session_cookie", {}).get("session_cookie", "")
+        session_cfg = config.config.get("session", {})
+        cache_path = config.config.get("cache", {}).get("path")
+        return (
+            cookie,
+            tuple(sorted((key, repr(value)) for key, value in session_cfg.items())),
+            cache_path,
+        )
+
+    @classmethod
+    def close_shared(cls) -> None:
+        with cls._shared_lock:
+            for aoc_session in cls._shared.values():
+                aoc_session.session.close()
+            cls._shared.clear()
+
     def build_session(self) -> requests.Session:
         session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_size, pool_maxsize=self.pool_size
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
         session.cookies.set("session", self.session_cookie)
         session.headers.update({"User-Agent": "PySleigh/0.1"})
-        self.logger.info("Built authenticated AoC Session")
+        self.logger.info(
+            f"Built authenticated AoC Session (pool size {self.pool_size})"
+        )
         return session
 
-    def get(self, url: str, **kwargs) -> requests.Response:
+    def get(self, url: str, conditional: bool = False, **kwargs) -> requests.Response:
         """
         Make a GET request to the specified URL with the session's cookies and headers.
 
         Args:
             url (str): The URL to send the GET request to.
+            conditional (bool): Send the ETag/Last-Modified validators stored
+                for this URL. The server answers 304 if nothing changed, which
+                the caller should treat as "reuse your cached copy".
             **kwargs: Additional keyword arguments to pass to the requests.get() method.
 
         Returns:
             requests.Response: The response object from the GET request.
         """
+        if conditional:
+            headers = self.validators.headers_for(url)
+            if headers:
+                kwargs["headers"] = {**headers, **kwargs.get("headers", {})}
+
         self.logger.debug(f"Making GET request to {url}")
-        response = self.session.get(url, **kwargs)
+        response = self._request(self.session.get, url, self.retries, **kwargs)
         self.logger.info(f"GET {url} - Status {response.status_code}")
+        if response.status_code == 200:
+            self.validators.update(url, response.headers)
         return response
 
     def post(
@@ -56,6 +158,60 @@ class AoCSession:
             requests.Response: The response object from the POST request.
         """
         self.logger.debug(f"Making POST request to {url} with data: {data}")
-        response = self.session.post(url, data=data, **kwargs)
+        # Submissions are not idempotent, so a POST is never retried
+        response = self._request(self.session.post, url, 0, data=data, **kwargs)
         self.logger.info(f"POST {url} - Status {response.status_code}")
         return response
+
+    def _delay(self, attempt: int, response: Optional[requests.Response]) -> float:
+        retry_after = (
+            response.headers.get("Retry-After") if response is not None else None
+        )
+        if isinstance(retry_after, str) and retry_after.isdigit():
+            return min(float(retry_after), self.backoff_max)
+        # Full jitter: uniform over the exponential window
+        return random.uniform(0, min(self.backoff_max, self.backoff * 2**attempt))
+
+    def _request(self, send, url: str, retries: int, **kwargs) -> requests.Response:
+        """
+        Send a request through the circuit breaker and rate limiter, retrying
+        connection errors, timeouts and 429/5xx responses with backoff.
+
+        Raises:
+            AoCCircuitOpenError: If recent requests kept failing.
+            requests.RequestException: If the last attempt failed to connect.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        for attempt in range(retries + 1):
+            # A half-open trial is a single attempt, never retried
+            trial = self.breaker.before_request()
+            response = None
+            try:
+                self.limiter.acquire()
+                response = send(url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == retries or trial:
+                    self.breaker.record_failure()
+                    raise
+                self.logger.warning(f"Request to {url} failed: {e}")
+            except BaseException:
+                # Never leave the circuit waiting on a trial that is gone
+                if trial:
+                    self.breaker.record_failure()
+                raise
+            else:
+                if response.status_code not in self.RETRY_STATUSES:
+                    self.breaker.record_success()
+                    return response
+                if attempt == retries or trial:
+                    self.breaker.record_failure()
+                    return response
+                self.logger.warning(f"{url} returned {response.status_code}")
+                # A streamed response holds its pooled connection until closed
+                response.close()
+
+            delay = self._delay(attempt, response)
+            self.logger.info(
+                f"Retrying {url} in {delay:.2f}s ({attempt + 1}/{retries})"
+            )
+            time.sleep(delay)
@@ -0,0 +1,71 @@
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from pysleigh.utilities.config import AoCConfig
+from pysleigh.utilities.logger import AoCLogger
+
+
+class AoCValidatorStore:
+    """
+    Persist HTTP cache validators (ETag and Last-Modified) per account and
+    URL so later requests can be made conditional. Pages and inputs differ
+    between accounts, so one account's validators never revalidate another
+    account's cached copy.
+    """
+
+    logger = AoCLogger().get_logger()
+    DEFAULT_PATH = Path("~/.cache/pysleigh")
+    FILE_NAME = "validators.json"
+
+    def __init__(self, config: AoCConfig | None = None, account: str = ""):
+        self.config = config or AoCConfig()
+        self.account = account
+        cache_cfg = self.config.config.get("cache", {})
+        base_path = Path(cache_cfg.get("path", str(self.DEFAULT_PATH))).expanduser()
+        self.path = base_path / self.FILE_NAME
+        self.lock = threading.Lock()
+        self._validators: Optional[Dict[str, dict]] = None
+
+    def _load(self) -> Dict[str, dict]:
+        if self._validators is None:
+            try:
+                self._validators = json.loads(self.path.read_text())
+            except FileNotFoundError:
+                self._validators = {}
+            except (OSError, json.JSONDecodeError):
+                self.logger.warning(f"Ignoring corrupt validator store at {self.path}")
+                self._validators = {}
+        return self._validators
+
+    def _key(self, url: str) -> str:
+        return f"{self.account} {url}"
+
+    def headers_for(self, url: str) -> Dict[str, str]:
+        """Return If-None-Match / If-Modified-Since headers for a URL."""
+        with self.lock:
+            stored = self._load().get(self._key(url), {})
+        headers = {}
+        if stored.get("etag"):
+            headers["If-None-Match"] = stored["etag"]
+        if stored.get("last_modified"):
+            headers["If-Modified-Since"] = stored["last_modified"]
+        return headers
+
+    def update(self, url: str, response_headers) -> None:
+        validators = {
+            "etag": response_headers.get("ETag"),
+            "last_modified": response_headers.get("Last-Modified"),
+        }
+        validators = {k: v for k, v in validators.items() if isinstance(v, str)}
+        if not validators:
+            return
+        with self.lock:
+            stored = self._load()
+            stored[self._key(url)] = validators
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_text(json.dumps(stored, indent=2))
+            os.replace(tmp, self.path)
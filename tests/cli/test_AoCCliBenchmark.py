@@ -10,9 +10,57 @@ class TestAoCCliBenchmark:
     def test_benchmark_day(self, mock_benchmark, mock_date):
         mock_date.return_value = MagicMock()
         mock_instance = mock_benchmark.return_value
-        mock_instance.benchmark_day.return_value = {"avg_part1": 0.001, "avg_part2": 0.002, "runs": 1}
+        stats = {"mean": 0.001, "min": 0.001, "median": 0.001, "p95": 0.001,
+                 "stddev": 0.0, "mad": 0.0, "rse": 0.0, "samples": 1, "outliers": 0}
+        mock_instance.benchmark_day.return_value = {
+            "avg_parse": 0.003, "avg_part1": 0.001, "avg_part2": 0.002,
+            "avg_total": 0.006, "runs": 1, "warmup": 1,
+            "parse": stats, "part1": stats, "part2": stats, "total": stats,
+        }
         result = runner.invoke(benchmark_app, ["solution", "--year", "2015", "--day", "1", "--runs", "1"])
         assert result.exit_code == 0
+        assert "median" in result.stdout
+        assert "parse: 0.003000s" in result.stdout
+
+    @patch("pysleigh.cli.benchmark.AoCDate")
+    @patch("pysleigh.cli.benchmark.AoCBenchmark")
+    def test_benchmark_day_adaptive_options(self, mock_benchmark, mock_date):
+        mock_benchmark.return_value.benchmark_day.return_value = {}
+        result = runner.invoke(benchmark_app, [
+            "solution", "--year", "2015", "--day", "1", "--warmup", "3",
+            "--target-rse", "0.01", "--max-runs", "50", "--time-budget", "2.5",
+        ])
+        assert result.exit_code == 0
+        kwargs = mock_benchmark.call_args.kwargs
+        assert kwargs["warmup"] == 3
+        assert kwargs["target_rse"] == 0.01
+        assert kwargs["max_runs"] == 50
+        assert kwargs["time_budget"] == 2.5
+
+    @patch("pysleigh.cli.benchmark.AoCProfiler")
+    @patch("pysleigh.cli.benchmark.AoCDate")
+    @patch("pysleigh.cli.benchmark.AoCBenchmark")
+    def test_benchmark_day_profile_top(self, mock_benchmark, mock_date, mock_profiler):
+        stats = {"mean": 0.001, "min": 0.001, "median": 0.001, "p95": 0.001,
+                 "stddev": 0.0, "mad": 0.0, "rse": 0.0, "samples": 1, "outliers": 0}
+        mock_benchmark.return_value.benchmark_day.return_value = {
+            "avg_parse": 0.003, "avg_part1": 0.001, "avg_part2": 0.002,
+            "avg_total": 0.006, "runs": 1, "warmup": 1,
+            "parse": stats, "part1": stats, "part2": stats, "total": stats,
+        }
+        phase = {
+            "time": 0.5, "samples": 10, "prof": "/tmp/p.prof",
+            "hotspots": [{"function": "sol.py:3(part1)", "calls": 1, "tottime": 0.1, "cumtime": 0.5}],
+        }
+        mock_profiler.return_value.profile.return_value = {
+            "parse": phase, "part1": phase, "part2": phase, "collapsed": "/tmp/p.collapsed",
+        }
+        result = runner.invoke(benchmark_app, [
+            "solution", "--year", "2022", "--day", "1", "--runs", "1", "--profile", "--top", "5",
+        ])
+        assert result.exit_code == 0
+        assert mock_profiler.call_args.kwargs["top"] == 5
+        assert "sol.py:3(part1)" in result.stdout
 
     @patch("pysleigh.cli.benchmark.AoCDate")
     @patch("pysleigh.cli.benchmark.AoCBenchmark")
@@ -38,3 +86,114 @@ class TestAoCCliBenchmark:
         mock_instance.benchmark_day.return_value = {}
         result = runner.invoke(benchmark_app, ["solution", "--year", "2015", "--day", "99"])
         assert result.exit_code == 0
+
+    @patch("pysleigh.cli.benchmark.AoCDate")
+    @patch("pysleigh.cli.benchmark.AoCBenchmark")
+    def test_benchmark_year_with_jobs(self, mock_benchmark, mock_date):
+        mock_benchmark.return_value.benchmark_year.return_value = [
+            {"runs": 5}, {"year": 2015, "day": 2, "status": "timeout"},
+        ]
+        result = runner.invoke(benchmark_app, [
+            "solution", "--year", "2015", "--jobs", "4", "--timeout", "30", "--pin-cpus",
+        ])
+        assert result.exit_code == 0
+        kwargs = mock_benchmark.call_args.kwargs
+        assert kwargs["jobs"] == 4
+        assert kwargs["timeout"] == 30
+        assert kwargs["pin_cpus"] is True
+        assert "Benchmarked 1/2 days, 1 timed out" in result.stdout
+
+    @patch("pysleigh.cli.benchmark.AoCBenchmarkHistory")
+    def test_compare_exits_nonzero_on_regression(self, mock_history):
+        mock_history.return_value.compare.return_value = [{
+            "year": 2015, "day": 1, "baseline": "a", "candidate": "b",
+            "baseline_median": 1.0, "candidate_median": 1.5, "ratio": 1.5,
+            "regressed": True,
+        }]
+        result = runner.invoke(benchmark_app, ["compare", "--threshold", "0.1"])
+        assert result.exit_code == 1
+        assert "+50.0%" in result.stdout
+        mock_history.return_value.compare.assert_called_once_with(
+            baseline=None, candidate=None, threshold=0.1, year=None
+        )
+
+    @patch("pysleigh.cli.benchmark.AoCBenchmarkHistory")
+    def test_compare_passes_without_regression(self, mock_history):
+        mock_history.return_value.compare.return_value = [{
+            "year": 2015, "day": 1, "baseline": "a", "candidate": "b",
+            "baseline_median": 1.0, "candidate_median": 1.0, "ratio": 1.0,
+            "regressed": False,
+        }]
+        result = runner.invoke(benchmark_app, ["compare", "--baseline", "a"])
+        assert result.exit_code == 0
+        assert "No regressions" in result.stdout
+
+    @patch("pysleigh.cli.benchmark.AoCDate")
+    @patch("pysleigh.cli.benchmark.AoCBenchmark")
+    def test_benchmark_day_memory(self, mock_benchmark, mock_date):
+        mock_benchmark.PHASES = ("parse", "part1", "part2")
+        stats = {"mean": 0.001, "min": 0.001, "median": 0.001, "p95": 0.001,
+                 "stddev": 0.0, "mad": 0.0, "rse": 0.0, "samples": 1, "outliers": 0}
+        phase = {"peak_rss": 2**21, "peak_traced": 2**20,
+                 "top": [{"file": "sol.py", "line": 3, "size": 2**20, "count": 1}]}
+        mock_benchmark.return_value.benchmark_day.return_value = {
+            "avg_parse": 0.001, "avg_part1": 0.001, "avg_part2": 0.001,
+            "avg_total": 0.003, "runs": 1, "warmup": 0,
+            "parse": stats, "part1": stats, "part2": stats, "total": stats,
+            "memory": {"parse": phase, "part1": phase, "part2": phase,
+                       "peak_rss_scope": "phase"},
+        }
+        result = runner.invoke(benchmark_app, ["solution", "--year", "2015", "--day", "1", "--memory"])
+        assert result.exit_code == 0
+        assert mock_benchmark.call_args.kwargs["memory"] is True
+        assert "peak RSS 2.0 MiB (phase)" in result.stdout
+        assert "sol.py:3 +1.0 MiB" in result.stdout
+
+    @patch("pysleigh.cli.benchmark.AoCDate")
+    @patch("pysleigh.cli.benchmark.AoCBenchmark")
+    def test_benchmark_year_markdown_output(self, mock_benchmark, mock_date):
+        stats = {"median": 0.5, "p95": 0.6}
+        mock_benchmark.return_value.benchmark_year.return_value = [{
+            "year": 2015, "day": 1, "runs": 5,
+            "parse": stats, "part1": stats, "part2": stats, "total": stats,
+        }]
+        result = runner.invoke(benchmark_app, ["solution", "--year", "2015", "--format", "markdown"])
+        assert result.exit_code == 0
+        assert "## 2015" in result.stdout
+        assert "Slowest days" in result.stdout
+
+    @patch("pysleigh.cli.benchmark.AoCDate")
+    @patch("pysleigh.cli.benchmark.AoCBenchmark")
+    def test_benchmark_day_output_file_infers_format(self, mock_benchmark, mock_date, tmp_path):
+        mock_benchmark.return_value.benchmark_day.return_value = {"year": 2015, "day": 1, "status": "timeout"}
+        out = tmp_path / "report.json"
+        result = runner.invoke(benchmark_app, ["solution", "--year", "2015", "--day", "1", "--output", str(out)])
+        assert result.exit_code == 0
+        assert '"status": "timeout"' in out.read_text()
+
+    @patch("pysleigh.cli.benchmark.AoCDate")
+    @patch("pysleigh.cli.benchmark.AoCBenchmark")
+    def test_unknown_format_is_rejected(self, mock_benchmark, mock_date):
+        result = runner.invoke(benchmark_app, ["solution", "--year", "2015", "--format", "xml"])
+        assert result.exit_code == 2
+        mock_benchmark.return_value.benchmark_year.assert_not_called()
+
+    @patch("pysleigh.cli.benchmark.AoCBenchmarkMatrix")
+    def test_matrix_prints_speedups(self, mock_matrix):
+        ok = {"status": "ok", "total": {"median": 0.5},
+              "interpreter": {"implementation": "CPython", "version": "3.13.0",
+                              "free_threaded": True}}
+        mock_matrix.return_value.interpreters = ["python3.12", "python3.13t"]
+        mock_matrix.return_value.compare_day.return_value = {
+            "year": 2022, "day": 1,
+            "results": {"python3.12": {**ok, "total": {"median": 1.0}}, "python3.13t": ok},
+            "speedup": {"python3.12": 1.0, "python3.13t": 2.0},
+        }
+        result = runner.invoke(benchmark_app, [
+            "matrix", "--year", "2022", "--day", "1",
+            "-i", "python3.12", "-i", "python3.13t",
+        ])
+        assert result.exit_code == 0
+        assert mock_matrix.call_args.kwargs["interpreters"] == ["python3.12", "python3.13t"]
+        assert "CPython 3.13.0 free-threaded" in result.stdout
+        assert "0.500000s (2.00x)" in result.stdout
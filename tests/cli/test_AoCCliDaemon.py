@@ -0,0 +1,45 @@
+from typer.testing import CliRunner
+from unittest.mock import patch
+from pysleigh.cli.daemon import daemon_app
+
+runner = CliRunner()
+
+
+class TestAoCCliDaemon:
+    @patch("pysleigh.cli.daemon.AoCDaemon")
+    def test_daemon_start(self, mock_daemon):
+        mock_daemon.return_value.socket_path = "/tmp/daemon.sock"
+        result = runner.invoke(daemon_app, ["start", "--socket", "/tmp/daemon.sock"])
+        assert result.exit_code == 0
+        assert "listening on /tmp/daemon.sock" in result.stdout
+        mock_daemon.assert_called_once_with(socket_path="/tmp/daemon.sock")
+        mock_daemon.return_value.serve_forever.assert_called_once()
+
+    @patch("pysleigh.cli.daemon.AoCDaemon")
+    def test_daemon_start_already_running(self, mock_daemon):
+        mock_daemon.return_value.bind.side_effect = RuntimeError("already listening")
+        result = runner.invoke(daemon_app, ["start", "--socket", "/tmp/daemon.sock"])
+        assert result.exit_code == 1
+        assert "already listening" in result.stdout
+        mock_daemon.return_value.serve_forever.assert_not_called()
+
+    @patch("pysleigh.cli.daemon.AoCDaemonClient")
+    def test_daemon_status(self, mock_client):
+        mock_client.return_value.ping.return_value = {
+            "pid": 42,
+            "socket": "/tmp/daemon.sock",
+            "uptime": 12.0,
+            "requests": 3,
+            "modules": 2,
+        }
+        result = runner.invoke(daemon_app, ["status", "--socket", "/tmp/daemon.sock"])
+        assert "pysleigh daemon 42" in result.stdout
+        mock_client.return_value.ping.return_value = None
+        result = runner.invoke(daemon_app, ["status", "--socket", "/tmp/daemon.sock"])
+        assert "No pysleigh daemon is running" in result.stdout
+
+    @patch("pysleigh.cli.daemon.AoCDaemonClient")
+    def test_daemon_stop(self, mock_client):
+        result = runner.invoke(daemon_app, ["stop", "--socket", "/tmp/daemon.sock"])
+        assert "stopped" in result.stdout
+        mock_client.return_value.request.assert_called_once_with("shutdown")
@@ -22,6 +22,24 @@ class TestAoCCliFetch:
         assert result.exit_code == 0
         assert "Answers file available at" in result.stdout
 
+    @patch("pysleigh.cli.fetch.AoCInput")
+    def test_fetch_input_whole_year(self, mock_input):
+        mock_input.return_value.check_local.side_effect = [True] * 24 + [False]
+        result = runner.invoke(fetch_app, ["input", "--year", "2022", "--jobs", "1"])
+        assert result.exit_code == 0
+        assert mock_input.call_count == 25
+        assert mock_input.return_value.write_input.call_count == 25
+        assert "Inputs available for 24/25 days of 2022" in result.stdout
+        assert "Missing: Day 25" in result.stdout
+
+    @patch("pysleigh.cli.fetch.AoCInput")
+    def test_fetch_input_year_stops_when_circuit_opens(self, mock_input):
+        from pysleigh.utilities.circuit import AoCCircuitOpenError
+        mock_input.return_value.write_input.side_effect = AoCCircuitOpenError("down")
+        result = runner.invoke(fetch_app, ["input", "--year", "2022", "--jobs", "1"])
+        assert result.exit_code == 1
+        assert "Stopping early: down" in result.stdout
+
     @patch("pysleigh.cli.fetch.AoCInput")
     def test_fetch_input_with_show(self, mock_input):
         mock_instance = mock_input.return_value
@@ -17,3 +17,25 @@ class TestAoCCliPrep:
         result = runner.invoke(prep_app, ["test", "--year", "2022", "--day", "1"])
         assert result.exit_code == 0
         mock_prep_test.assert_called_once_with(2022, 1, False)
+
+    @patch("pysleigh.cli.prep._prep_day")
+    def test_prep_solution_year_runs_every_day(self, mock_prep_day):
+        result = runner.invoke(prep_app, ["solution", "--year", "2022", "--jobs", "8"])
+        assert result.exit_code == 0
+        assert mock_prep_day.call_count == 25
+        mock_prep_day.assert_any_call(2022, 25, False)
+
+    @patch("pysleigh.cli.prep._prep_test_day")
+    def test_prep_test_year_runs_every_day(self, mock_prep_test):
+        result = runner.invoke(prep_app, ["test", "--year", "2022", "--overwrite"])
+        assert result.exit_code == 0
+        assert mock_prep_test.call_count == 25
+        mock_prep_test.assert_any_call(2022, 1, True)
+
+    @patch("pysleigh.cli.prep.AoCArticle")
+    def test_prep_year_stops_when_circuit_opens(self, mock_article):
+        from pysleigh.utilities.circuit import AoCCircuitOpenError
+        mock_article.return_value.write_article.side_effect = AoCCircuitOpenError("down")
+        result = runner.invoke(prep_app, ["solution", "--year", "2022", "--jobs", "1"])
+        assert result.exit_code == 1
+        assert "Stopping early: down" in result.stdout
@@ -13,12 +13,53 @@ class TestAoCCliRun:
         mock_runner.return_value.run_solution.return_value = {
             "part1": 1,
             "part2": 2,
+            "time_parse": 0.05,
             "time_part1": 0.1,
             "time_part2": 0.2,
+            "time_total": 0.35,
         }
         result = runner.invoke(run_app, ["solution", "--year", "2022", "--day", "1"])
         assert result.exit_code == 0
+        assert "Parse: took 0.050000s" in result.stdout
         assert "Part 1:" in result.stdout
+        assert "Total: 0.350000s" in result.stdout
+
+    @patch("pysleigh.cli.run.AoCDate")
+    @patch("pysleigh.cli.run.AoCRunner")
+    def test_run_solution_timeout(self, mock_runner, mock_date):
+        mock_runner.return_value.run_solution.return_value = {
+            "status": "timeout", "phase": "part2",
+        }
+        result = runner.invoke(run_app, [
+            "solution", "--year", "2022", "--day", "1", "--part-timeout", "2",
+        ])
+        assert result.exit_code == 0
+        assert mock_runner.call_args.kwargs["part_timeout"] == 2
+        assert "Timed out in part2" in result.stdout
+        assert "Part 1:" not in result.stdout
+
+    @patch("pysleigh.cli.run.AoCProfiler")
+    @patch("pysleigh.cli.run.AoCDate")
+    @patch("pysleigh.cli.run.AoCRunner")
+    def test_run_solution_profile(self, mock_runner, mock_date, mock_profiler):
+        mock_runner.return_value.run_solution.return_value = {}
+        mock_profiler.PHASES = ("parse", "part1", "part2")
+        phase = {
+            "time": 0.5, "samples": 10, "prof": "/tmp/p.prof",
+            "hotspots": [{"function": "sol.py:3(part1)", "calls": 1, "tottime": 0.1, "cumtime": 0.5}],
+        }
+        mock_profiler.return_value.profile.return_value = {
+            "parse": phase, "part1": phase, "part2": phase, "collapsed": "/tmp/p.collapsed",
+        }
+        result = runner.invoke(run_app, [
+            "solution", "--year", "2022", "--day", "1", "--profile", "--top", "5",
+            "--profile-dir", "/tmp/profiles",
+        ])
+        assert result.exit_code == 0
+        assert mock_profiler.call_args.kwargs["output_dir"] == "/tmp/profiles"
+        assert mock_profiler.call_args.kwargs["top"] == 5
+        assert "sol.py:3(part1)" in result.stdout
+        assert "Collapsed stacks: /tmp/p.collapsed" in result.stdout
 
     @patch("pysleigh.cli.run.AoCTestRunner")
     def test_run_test_year(self, mock_runner):
@@ -26,3 +67,74 @@ class TestAoCCliRun:
         result = runner.invoke(run_app, ["test", "--year", "2022"])
         assert result.exit_code == 0
         assert "Tests passed" in result.stdout
+
+    @patch("pysleigh.cli.run.AoCTestRunner")
+    def test_run_test_in_process(self, mock_runner):
+        mock_runner.return_value.run_specific_test.return_value = True
+        result = runner.invoke(
+            run_app, ["test", "--year", "2022", "--day", "1", "--in-process"]
+        )
+        assert result.exit_code == 0
+        assert mock_runner.call_args.kwargs["in_process"] is True
+
+    @patch("pysleigh.cli.run.AoCTestRunner")
+    def test_run_test_jobs(self, mock_runner):
+        mock_runner.return_value.run_all_tests.return_value = False
+        result = runner.invoke(run_app, ["test", "--jobs", "8"])
+        assert result.exit_code == 0
+        assert mock_runner.call_args.kwargs["jobs"] == 8
+        assert "Some tests failed" in result.stdout
+
+    @patch("pysleigh.cli.run.AoCTestRunner")
+    def test_run_test_changed(self, mock_runner):
+        mock_runner.return_value.run_year_tests.return_value = True
+        result = runner.invoke(run_app, ["test", "--year", "2022", "--changed"])
+        assert result.exit_code == 0
+        assert mock_runner.call_args.kwargs["changed"] is True
+        mock_runner.return_value.run_year_tests.assert_called_once_with(2022)
+
+    @patch("pysleigh.cli.run.AoCDate")
+    @patch("pysleigh.cli.run.AoCRunner")
+    @patch("pysleigh.cli.run.AoCWatchRunner")
+    def test_run_solution_watch(self, mock_watch, mock_runner, mock_date):
+        mock_watch.return_value.module_name = "year_2022.solution_2022_day_01"
+        mock_watch.return_value.watch.side_effect = KeyboardInterrupt
+        result = runner.invoke(
+            run_app, ["solution", "--year", "2022", "--day", "1", "--watch", "--test"]
+        )
+        assert result.exit_code == 0
+        assert "Watching year_2022.solution_2022_day_01" in result.stdout
+        assert "Stopped watching." in result.stdout
+        assert mock_watch.call_args.kwargs["test"] is True
+        mock_runner.assert_not_called()
+
+    @patch("pysleigh.cli.run.AoCDate")
+    @patch("pysleigh.cli.run.AoCWatchRunner")
+    def test_run_solution_watch_output(self, mock_watch, mock_date):
+        results = [
+            {
+                "changed": ["year_2022/solution_2022_day_01.py"],
+                "reloaded": ["year_2022.solution_2022_day_01"],
+                "phases": {
+                    "parse": {"answer": None, "time": 0.2, "previous": 0.1, "delta": 0.1, "rerun": True},
+                    "part1": {"answer": 7, "time": 0.5, "rerun": False, "delta": None},
+                    "part2": {"answer": 9, "time": 0.1, "previous": 0.2, "delta": -0.1, "rerun": True},
+                },
+                "tests_passed": False,
+                "error": None,
+            },
+            {"changed": ["x.py"], "reloaded": [], "phases": {}, "tests_passed": None, "error": "Traceback: boom"},
+        ]
+
+        def watch(on_result):
+            for result in results:
+                on_result(result)
+
+        mock_watch.return_value.watch.side_effect = watch
+        result = runner.invoke(run_app, ["solution", "--watch"])
+        assert "↻ year_2022/solution_2022_day_01.py" in result.stdout
+        assert "Parse: took 0.200000s, +0.100000s / +100%" in result.stdout
+        assert "Part 1: 7 (unchanged)" in result.stdout
+        assert "Part 2: 9 (took 0.100000s, -0.100000s / -50%)" in result.stdout
+        assert "❌ Some tests failed." in result.stdout
+        assert "Traceback: boom" in result.stdout
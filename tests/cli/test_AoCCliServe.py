@@ -0,0 +1,23 @@
+from typer.testing import CliRunner
+from unittest.mock import patch
+import pysleigh.cli.main as cli_main
+
+runner = CliRunner()
+
+class TestAoCCliServe:
+    @patch("pysleigh.cli.serve.AoCFixtureServer")
+    def test_serve_fixtures(self, mock_server):
+        mock_server.return_value.url = "http://127.0.0.1:9000"
+        mock_server.return_value.root = "/tmp/fixtures"
+        result = runner.invoke(cli_main.main, ["serve-fixtures", "--port", "9000"])
+        assert result.exit_code == 0
+        assert 'base_url = "http://127.0.0.1:9000"' in result.stdout
+        mock_server.assert_called_once_with(
+            path=None, host="127.0.0.1", port=9000, upstream=None
+        )
+        mock_server.return_value.serve_forever.assert_called_once()
+
+    @patch("pysleigh.cli.serve.AoCFixtureServer")
+    def test_serve_fixtures_record(self, mock_server):
+        runner.invoke(cli_main.main, ["serve-fixtures", "--record"])
+        assert mock_server.call_args.kwargs["upstream"] == "https://adventofcode.com"
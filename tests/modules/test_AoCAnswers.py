@@ -41,14 +41,23 @@ class TestAoCAnswers:
         a.write_answers({"part1": "aaa", "part2": "bbb"}, overwrite=True)
         assert file.read_text() == "Part 1: aaa\nPart 2: bbb"
 
-    def test_fetch_answers_extracts_parts(self):
+    def test_write_answers_refuses_missing_answers(self, tmp_path, caplog):
+        file = tmp_path / "answer.txt"
+        a = AoCAnswers(AoCDate(2022, 1))
+        a.answers_path = file
+        a.write_answers({"part1": "aaa", "part2": None}, overwrite=True)
+        assert not file.exists()
+        assert "incomplete" in caplog.text
+
+    def test_fetch_answers_extracts_parts(self, tmp_path):
         html = """
         <p>Your puzzle answer was <code>one</code>.</p>
         <p>Your puzzle answer was <code>two</code>.</p>
         """
+        cfg = {"cache": {"path": str(tmp_path)}}
         with patch("pysleigh.utilities.session.AoCSession.get") as mock_get:
             mock_resp = MagicMock(status_code=200, text=html)
             mock_get.return_value = mock_resp
-            a = AoCAnswers(AoCDate(2022, 1))
+            a = AoCAnswers(AoCDate(2022, 1), config=MagicMock(config=cfg))
             result = a.fetch_answers()
             assert result == {"part1": "one", "part2": "two"}
@@ -31,10 +31,11 @@ class TestAoCArticle:
         assert "This is part one." in md
         assert "This is part two." in md
 
-    def test_fetch_article_logs_on_failure(self, caplog):
+    def test_fetch_article_logs_on_failure(self, caplog, tmp_path):
+        cfg = {"cache": {"path": str(tmp_path)}}
         with patch("pysleigh.utilities.session.AoCSession.get") as mock_get:
             mock_get.return_value.status_code = 404
-            a = AoCArticle(AoCDate(2022, 5))
+            a = AoCArticle(AoCDate(2022, 5), config=MagicMock(config=cfg))
             result = a.fetch_article()
             assert result == ""
             assert "Failed to fetch article" in caplog.text
@@ -1,5 +1,6 @@
 import pytest
 from unittest.mock import patch, MagicMock
+from pysleigh.modules import benchmark as benchmark_module
 from pysleigh.modules.benchmark import AoCBenchmark
 from pysleigh.utilities.date import AoCDate
 
@@ -30,6 +31,108 @@ class TestAoCBenchmark:
         assert result["avg_part1"] > 0
         assert result["avg_part2"] > 0
         assert result["runs"] == 2
+        assert result["part1"]["samples"] == 2
+        assert set(result["part2"]) >= {"min", "median", "p95", "stddev", "mad"}
+        assert result["parse"]["samples"] == 2
+        assert result["total"]["mean"] >= result["part1"]["mean"]
+        assert "avg_parse" in result and "avg_total" in result
+
+    @patch("pysleigh.modules.benchmark.importlib.import_module")
+    @patch("pysleigh.modules.benchmark.AoCAnswers")
+    def test_benchmark_day_uses_fresh_instances_and_warmup(self, MockAnswers, mock_import):
+        benchmark = AoCBenchmark(AoCDate(2024, 2), runs=3, warmup=2)
+
+        instances = []
+
+        def make_solution(_):
+            sol = MagicMock()
+            sol.part1.return_value = "abc"
+            sol.part2.return_value = "def"
+            instances.append(sol)
+            return sol
+
+        mock_import.return_value = MagicMock(Solution=make_solution)
+        MockAnswers.return_value.get_or_fetch.return_value = {"part1": "abc", "part2": "def"}
+
+        result = benchmark.benchmark_day(2024, 2)
+        # 1 verification + 2 warmup + 3 timed, each on its own instance
+        assert len(instances) == 6
+        assert all(sol.part1.call_count == 1 for sol in instances)
+        assert result["runs"] == 3
+        assert result["warmup"] == 2
+
+    @patch("pysleigh.modules.benchmark.importlib.import_module")
+    @patch("pysleigh.modules.benchmark.AoCAnswers")
+    def test_benchmark_day_adaptive_stops_at_max_runs(self, MockAnswers, mock_import):
+        benchmark = AoCBenchmark(
+            AoCDate(2024, 2), runs=2, warmup=0, max_runs=7, target_rse=0.0
+        )
+        sol = MagicMock()
+        sol.part1.return_value = "abc"
+        sol.part2.return_value = "def"
+        mock_import.return_value = MagicMock(Solution=lambda _: sol)
+        MockAnswers.return_value.get_or_fetch.return_value = {"part1": "abc", "part2": "def"}
+
+        noisy = {"mean": 1.0, "median": 1.0, "rse": 1.0}
+        with patch.object(AoCBenchmark, "summarize", return_value=noisy):
+            result = benchmark.benchmark_day(2024, 2)
+        assert result["runs"] == 7
+
+    @patch("pysleigh.modules.benchmark.importlib.import_module")
+    @patch("pysleigh.modules.benchmark.AoCAnswers")
+    def test_benchmark_day_skips_verification_when_cached(self, MockAnswers, mock_import, tmp_path):
+        solution_file = tmp_path / "solution.py"
+        solution_file.write_text("class Solution: pass\n")
+        (tmp_path / "input" / "year_2024").mkdir(parents=True)
+        (tmp_path / "input" / "year_2024" / "input_2024_day_02.txt").write_text("1\n")
+        config = MagicMock(config={
+            "inputs": {"path": str(tmp_path / "input")},
+            "cache": {"path": str(tmp_path / "cache")},
+        })
+
+        instances = []
+
+        def make_solution(_):
+            sol = MagicMock()
+            sol.part1.return_value = "abc"
+            sol.part2.return_value = "def"
+            instances.append(sol)
+            return sol
+
+        mock_import.return_value = MagicMock(Solution=make_solution, __file__=str(solution_file))
+        MockAnswers.return_value.get_or_fetch.return_value = {"part1": "abc", "part2": "def"}
+
+        first = AoCBenchmark(AoCDate(2024, 2), config=config, runs=1, warmup=0).benchmark_day(2024, 2)
+        assert first["verification"] == "run"
+        assert len(instances) == 2
+
+        second = AoCBenchmark(AoCDate(2024, 2), config=config, runs=1, warmup=0).benchmark_day(2024, 2)
+        assert second["verification"] == "cached"
+        assert len(instances) == 3
+
+        forced = AoCBenchmark(
+            AoCDate(2024, 2), config=config, runs=1, warmup=0, reverify=True
+        ).benchmark_day(2024, 2)
+        assert forced["verification"] == "run"
+        assert len(instances) == 5
+
+    def test_summarize_rejects_outliers(self):
+        samples = [1.0, 1.01, 0.99, 1.0, 1.02, 0.98, 50.0]
+        stats = AoCBenchmark.summarize(samples)
+        assert stats["outliers"] == 1
+        assert stats["samples"] == 7
+        assert stats["min"] == 0.98
+        assert stats["median"] == 1.0
+        assert stats["p95"] < 2.0
+        assert stats["stddev"] > 0
+        assert stats["mad"] == pytest.approx(0.01)
+
+    def test_summarize_single_sample(self):
+        stats = AoCBenchmark.summarize([0.5])
+        assert stats["mean"] == 0.5
+        assert stats["p95"] == 0.5
+        assert stats["stddev"] == 0.0
+        assert stats["rse"] == 0.0
 
 
 
@@ -54,3 +157,146 @@ class TestAoCBenchmark:
             result = benchmark.benchmark_day(2022, 1)
             assert result == {}
             assert "Benchmark failed" in caplog.text
+
+    def test_benchmark_year_serial_without_jobs(self):
+        benchmark = AoCBenchmark(AoCDate(2022, 1))
+        with patch.object(benchmark, "_measure_day", return_value={"runs": 1}) as mock_day:
+            results = benchmark.benchmark_year(2022)
+        assert len(results) == 25
+        mock_day.assert_any_call(2022, 25)
+
+    def test_benchmark_year_uses_process_pool_with_jobs(self):
+        benchmark = AoCBenchmark(AoCDate(2022, 1), jobs=4, timeout=10, pin_cpus=True)
+        with patch("pysleigh.modules.benchmark.AoCProcessPool") as MockPool:
+            MockPool.return_value.map.return_value = [{"runs": 1}] * 25
+            results = benchmark.benchmark_year(2022)
+        MockPool.assert_called_once_with(
+            jobs=4,
+            timeout=10,
+            pin_cpus=True,
+            phase_timeout=None,
+            untimed_phases=("memory",),
+        )
+        target, tasks = MockPool.return_value.map.call_args.args
+        assert target == benchmark._measure_day
+        assert tasks[0] == {"year": 2022, "day": 1}
+        assert len(tasks) == 25
+        assert len(results) == 25
+
+    def test_benchmark_day_runs_in_worker_with_part_timeout(self):
+        config = MagicMock(config={"timeouts": {"part": 3}})
+        benchmark = AoCBenchmark(AoCDate(2022, 1), config=config, timeout=20)
+        with patch("pysleigh.modules.benchmark.AoCProcessPool") as MockPool:
+            MockPool.in_worker.return_value = False
+            MockPool.return_value.map.return_value = [
+                {"year": 2022, "day": 1, "status": "timeout", "phase": "part1"}
+            ]
+            result = benchmark.benchmark_day(2022, 1)
+        MockPool.assert_called_once_with(
+            jobs=1,
+            timeout=20,
+            pin_cpus=False,
+            phase_timeout=3,
+            untimed_phases=("memory",),
+        )
+        assert result["status"] == "timeout"
+        assert result["phase"] == "part1"
+
+    def test_benchmark_day_records_history_when_enabled(self):
+        with patch("pysleigh.modules.benchmark.AoCBenchmarkHistory") as MockHistory:
+            benchmark = AoCBenchmark(AoCDate(2022, 1), record=True)
+            with patch.object(benchmark, "_measure_day", return_value={"runs": 1}):
+                benchmark.benchmark_day(2022, 1)
+        MockHistory.return_value.append.assert_called_once_with([{"runs": 1}])
+
+    def test_benchmark_year_records_sweep_once(self):
+        with patch("pysleigh.modules.benchmark.AoCBenchmarkHistory") as MockHistory:
+            benchmark = AoCBenchmark(AoCDate(2022, 1), record=True)
+            with patch.object(benchmark, "_measure_day", return_value={"runs": 1}):
+                benchmark.benchmark_year(2022)
+        MockHistory.return_value.append.assert_called_once()
+        assert len(MockHistory.return_value.append.call_args.args[0]) == 25
+
+    def test_measure_memory_reports_phases_and_allocation_sites(self, tmp_path, monkeypatch):
+        pkg = tmp_path / "year_2022"
+        pkg.mkdir()
+        (pkg / "__init__.py").write_text("")
+        solution_file = pkg / "solution_2022_day_07.py"
+        solution_file.write_text(
+            "class Solution:\n"
+            "    def __init__(self, input_path):\n"
+            "        self.data = open(input_path).read().split()\n"
+            "    def part1(self):\n"
+            "        self.big = bytearray(4_000_000)\n"
+            "        return len(self.data)\n"
+            "    def part2(self):\n"
+            "        return 0\n"
+        )
+        input_file = tmp_path / "input.txt"
+        input_file.write_text("a b c")
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        benchmark = AoCBenchmark(AoCDate(2022, 7))
+        with patch.object(benchmark, "_get_input_path", return_value=str(input_file)):
+            memory = benchmark._measure_memory(2022, 7)
+
+        assert memory["peak_rss_scope"] in ("phase", "process")
+        assert set(AoCBenchmark.PHASES) <= set(memory)
+        assert memory["part1"]["peak_traced"] > 3_900_000
+        top = memory["part1"]["top"][0]
+        assert top["file"] == str(solution_file)
+        assert top["line"] == 5
+        assert top["size"] >= 4_000_000
+
+    def test_measure_memory_reports_only_solution_sites(self, tmp_path, monkeypatch):
+        pkg = tmp_path / "year_2018"
+        pkg.mkdir()
+        (pkg / "__init__.py").write_text("")
+        solution_file = pkg / "solution_2018_day_08.py"
+        solution_file.write_text(
+            "import json\n"
+            "class Solution:\n"
+            "    def __init__(self, input_path):\n"
+            "        self.text = '[' + ','.join(['1'] * 200_000) + ']'\n"
+            "    def part1(self):\n"
+            "        self.data = json.loads(self.text)\n"
+            "    def part2(self):\n"
+            "        self.big = bytearray(1_000_000)\n"
+        )
+        input_file = tmp_path / "input.txt"
+        input_file.write_text("")
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        benchmark = AoCBenchmark(AoCDate(2018, 8))
+        with patch.object(benchmark, "_get_input_path", return_value=str(input_file)):
+            memory = benchmark._measure_memory(2018, 8)
+
+        files = {site["file"] for phase in AoCBenchmark.PHASES for site in memory[phase]["top"]}
+        assert files == {str(solution_file)}
+        # Allocations made inside the stdlib still count toward the peak
+        assert memory["part1"]["peak_traced"] > 1_000_000
+
+    @patch("pysleigh.modules.benchmark.importlib.import_module")
+    @patch("pysleigh.modules.benchmark.AoCAnswers")
+    def test_benchmark_day_attaches_memory_profile(self, MockAnswers, mock_import):
+        benchmark = AoCBenchmark(AoCDate(2024, 2), runs=1, memory=True)
+        sol = MagicMock()
+        sol.part1.return_value = "abc"
+        sol.part2.return_value = "def"
+        mock_import.return_value = MagicMock(Solution=lambda _: sol)
+        MockAnswers.return_value.get_or_fetch.return_value = {"part1": "abc", "part2": "def"}
+
+        with patch.object(benchmark_module, "AoCProcessPool") as MockPool:
+            MockPool.return_value.map.return_value = [{"parse": {"peak_rss": 1}}]
+            result = benchmark.benchmark_day(2024, 2)
+
+        assert result["memory"] == {"parse": {"peak_rss": 1}}
+        target, tasks = MockPool.return_value.map.call_args.args
+        assert target == benchmark._measure_memory
+        assert tasks == [{"year": 2024, "day": 2}]
+
+    def test_benchmark_days_marks_failed_days(self):
+        benchmark = AoCBenchmark(AoCDate(2022, 1))
+        with patch.object(benchmark, "_measure_day", side_effect=[{"runs": 1}, {}]):
+            results = benchmark.benchmark_days([(2022, 1), (2022, 2)])
+        assert results == [{"runs": 1}, {"year": 2022, "day": 2, "status": "failed"}]
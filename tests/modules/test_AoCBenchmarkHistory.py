@@ -0,0 +1,77 @@
+import json
+import pytest
+from unittest.mock import patch, MagicMock
+from pysleigh.modules.history import AoCBenchmarkHistory
+
+
+def _result(year, day, median):
+    return {"year": year, "day": day, "runs": 5, "total": {"median": median}}
+
+
+@pytest.mark.unit
+class TestAoCBenchmarkHistory:
+    def _history(self, tmp_path):
+        cfg = {"benchmark": {"history_path": str(tmp_path / "history.jsonl")}}
+        return AoCBenchmarkHistory(config=MagicMock(config=cfg))
+
+    def test_default_path_is_next_to_answers(self, tmp_path):
+        cfg = {"answers": {"path": str(tmp_path / "answers")}}
+        history = AoCBenchmarkHistory(config=MagicMock(config=cfg))
+        assert history.history_path == tmp_path / "benchmark_history.jsonl"
+
+    def test_append_writes_keyed_records(self, tmp_path):
+        history = self._history(tmp_path)
+        written = history.append([_result(2022, 1, 0.5), {}], revision="abc123")
+        assert written == 1
+
+        lines = history.history_path.read_text().splitlines()
+        entry = json.loads(lines[0])
+        assert entry["revision"] == "abc123"
+        assert entry["python"] == history.python
+        assert (entry["year"], entry["day"]) == (2022, 1)
+        assert "timestamp" in entry
+
+    def test_append_uses_git_revision_by_default(self, tmp_path):
+        history = self._history(tmp_path)
+        with patch.object(history, "get_revision", return_value="deadbee"):
+            history.append([_result(2022, 1, 0.5)])
+        assert history.read()[0]["revision"] == "deadbee"
+
+    def test_get_revision_unknown_outside_git(self, tmp_path):
+        cfg = {"solutions": {"path": str(tmp_path)}}
+        history = AoCBenchmarkHistory(config=MagicMock(config=cfg))
+        assert history.get_revision() == "unknown"
+
+    def test_read_skips_malformed_lines(self, tmp_path, caplog):
+        history = self._history(tmp_path)
+        history.append([_result(2022, 1, 0.5)], revision="a")
+        with history.history_path.open("a") as f:
+            f.write("{not json\n")
+        assert len(history.read()) == 1
+        assert "malformed" in caplog.text
+
+    def test_compare_flags_regressions_against_previous_revision(self, tmp_path):
+        history = self._history(tmp_path)
+        history.append([_result(2022, 1, 1.0), _result(2022, 2, 1.0)], revision="a")
+        history.append([_result(2022, 1, 1.02), _result(2022, 2, 1.5)], revision="b")
+
+        rows = history.compare(threshold=0.05)
+        assert [(r["day"], r["regressed"]) for r in rows] == [(1, False), (2, True)]
+        assert rows[1]["baseline"] == "a"
+        assert rows[1]["candidate"] == "b"
+        assert rows[1]["ratio"] == pytest.approx(1.5)
+
+    def test_compare_uses_latest_entry_per_revision_and_filters_year(self, tmp_path):
+        history = self._history(tmp_path)
+        history.append([_result(2021, 1, 1.0), _result(2022, 1, 1.0)], revision="a")
+        history.append([_result(2022, 1, 9.0)], revision="b")
+        history.append([_result(2022, 1, 1.0)], revision="b")
+
+        rows = history.compare(baseline="a", candidate="b", year=2022)
+        assert len(rows) == 1
+        assert rows[0]["regressed"] is False
+
+    def test_compare_needs_two_revisions(self, tmp_path):
+        history = self._history(tmp_path)
+        history.append([_result(2022, 1, 1.0)], revision="a")
+        assert history.compare() == []
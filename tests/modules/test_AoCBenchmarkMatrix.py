@@ -0,0 +1,77 @@
+import sys
+import pytest
+from unittest.mock import patch, MagicMock
+from pysleigh.modules.matrix import AoCBenchmarkMatrix
+
+SOLUTION = """
+class Solution:
+    def __init__(self, input_path):
+        print("noisy solution")
+        self.data = [int(x) for x in open(input_path).read().split()]
+
+    def part1(self):
+        return sum(self.data)
+
+    def part2(self):
+        return max(self.data)
+"""
+
+
+@pytest.mark.unit
+class TestAoCBenchmarkMatrix:
+    def _matrix(self, tmp_path, interpreters=None):
+        sol_dir = tmp_path / "sol" / "year_2022"
+        sol_dir.mkdir(parents=True)
+        (sol_dir / "__init__.py").write_text("")
+        (sol_dir / "solution_2022_day_01.py").write_text(SOLUTION)
+        input_dir = tmp_path / "in" / "year_2022"
+        input_dir.mkdir(parents=True)
+        (input_dir / "input_2022_day_01.txt").write_text("1\n2\n3\n")
+        cfg = {
+            "solutions": {"path": str(tmp_path / "sol")},
+            "inputs": {"path": str(tmp_path / "in")},
+        }
+        return AoCBenchmarkMatrix(
+            config=MagicMock(config=cfg), interpreters=interpreters, runs=2
+        )
+
+    def test_defaults_to_current_interpreter(self):
+        matrix = AoCBenchmarkMatrix(config=MagicMock(config={}))
+        assert matrix.interpreters == [sys.executable]
+
+    def test_reads_interpreters_from_config(self):
+        cfg = {"benchmark": {"interpreters": ["python3.12", "pypy3"]}}
+        matrix = AoCBenchmarkMatrix(config=MagicMock(config=cfg))
+        assert matrix.interpreters == ["python3.12", "pypy3"]
+
+    def test_compare_day_runs_each_interpreter(self, tmp_path):
+        matrix = self._matrix(tmp_path, [sys.executable, "no-such-python"])
+        with patch("pysleigh.modules.matrix.AoCAnswers") as MockAnswers:
+            MockAnswers.return_value.get_or_fetch.return_value = {
+                "part1": "6", "part2": "3",
+            }
+            row = matrix.compare_day(2022, 1)
+
+        current = row["results"][sys.executable]
+        assert current["status"] == "ok"
+        assert current["runs"] == 2
+        assert current["interpreter"]["executable"] == sys.executable
+        assert row["speedup"][sys.executable] == 1.0
+        assert row["results"]["no-such-python"] == {"status": "missing"}
+        assert row["speedup"]["no-such-python"] is None
+
+    def test_compare_day_reports_mismatch(self, tmp_path):
+        matrix = self._matrix(tmp_path)
+        with patch("pysleigh.modules.matrix.AoCAnswers") as MockAnswers:
+            MockAnswers.return_value.get_or_fetch.return_value = {
+                "part1": "7", "part2": "3",
+            }
+            row = matrix.compare_day(2022, 1)
+        assert row["results"][sys.executable]["status"] == "mismatch"
+
+    def test_compare_year_skips_days_without_solutions(self, tmp_path):
+        matrix = self._matrix(tmp_path)
+        with patch.object(matrix, "compare_day", return_value={}) as mock_day:
+            rows = matrix.compare_year(2022)
+        mock_day.assert_called_once_with(2022, 1)
+        assert rows == [{}]
@@ -0,0 +1,75 @@
+import csv
+import io
+import json
+import pytest
+from pysleigh.modules.report import AoCBenchmarkReport
+
+
+def _stats(median):
+    return {"median": median, "p95": median * 1.1}
+
+
+def _result(year, day, parse, part1, part2):
+    return {
+        "year": year,
+        "day": day,
+        "runs": 5,
+        "parse": _stats(parse),
+        "part1": _stats(part1),
+        "part2": _stats(part2),
+        "total": _stats(parse + part1 + part2),
+    }
+
+
+RESULTS = [
+    _result(2022, 1, 0.1, 0.2, 0.3),
+    _result(2022, 2, 1.0, 2.0, 3.0),
+    {"year": 2022, "day": 3, "status": "timeout"},
+    _result(2021, 5, 0.0, 0.5, 0.5),
+    {},
+]
+
+
+@pytest.mark.unit
+class TestAoCBenchmarkReport:
+    def test_summary_ranks_slowest_days(self):
+        summary = AoCBenchmarkReport(RESULTS).summary()
+        assert summary["days"] == 3
+        assert summary["failed"] == 1
+        assert summary["total_median"] == pytest.approx(7.6)
+        assert [(s["year"], s["day"]) for s in summary["slowest"]] == [
+            (2022, 2), (2021, 5), (2022, 1),
+        ]
+
+    def test_to_json_includes_results_and_summary(self):
+        data = json.loads(AoCBenchmarkReport(RESULTS).to_json())
+        assert len(data["results"]) == 4
+        assert data["summary"]["days"] == 3
+
+    def test_to_csv_has_one_row_per_result(self):
+        rows = list(csv.DictReader(io.StringIO(AoCBenchmarkReport(RESULTS).to_csv())))
+        assert len(rows) == 4
+        assert rows[0]["total_median"] == str(0.1 + 0.2 + 0.3)
+        assert rows[2]["status"] == "timeout"
+        assert rows[2]["total_median"] == ""
+
+    def test_to_markdown_groups_years_and_lists_slowest(self):
+        md = AoCBenchmarkReport(RESULTS).to_markdown()
+        assert md.index("## 2021") < md.index("## 2022")
+        assert "| 02 | 1.000000s | 2.000000s | 3.000000s | 6.000000s | ok |" in md
+        assert "| 03 | — | — | — | — | timeout |" in md
+        assert "**Total:** 6.600000s" in md
+        assert "| 1 | 2022-Day02 | 6.000000s |" in md
+
+    def test_render_rejects_unknown_format(self):
+        with pytest.raises(ValueError):
+            AoCBenchmarkReport(RESULTS).render("xml")
+
+    def test_write_creates_file(self, tmp_path):
+        path = AoCBenchmarkReport(RESULTS).write(tmp_path / "out" / "bench.csv", "csv")
+        assert path.read_text().startswith("year,day,status")
+
+    def test_infer_format_from_suffix(self):
+        assert AoCBenchmarkReport.infer_format("a.JSON") == "json"
+        assert AoCBenchmarkReport.infer_format("a.md") == "markdown"
+        assert AoCBenchmarkReport.infer_format("a.txt") is None
@@ -0,0 +1,146 @@
+import os
+import sys
+import pytest
+from unittest.mock import patch, MagicMock
+from pysleigh.modules.daemon import AoCDaemon
+from pysleigh.utilities.daemon_client import AoCDaemonClient
+
+SOLUTION = """from daemon_helpers.scaling import scale
+
+
+class Solution:
+    def __init__(self, path):
+        self.nums = [int(x) for x in open(path).read().split()]
+
+    def part1(self):
+        return scale(sum(self.nums))
+
+    def part2(self):
+        print("part two")
+        return max(self.nums)
+"""
+
+
+@pytest.fixture
+def tree(tmp_path):
+    sol = tmp_path / "sol"
+    (sol / "year_2031").mkdir(parents=True)
+    (sol / "daemon_helpers").mkdir()
+    (sol / "year_2031" / "__init__.py").write_text("")
+    (sol / "daemon_helpers" / "__init__.py").write_text("")
+    (sol / "daemon_helpers" / "scaling.py").write_text(
+        "def scale(x):\n    return x * 2\n"
+    )
+    (sol / "daemon_helpers" / "unused.py").write_text("")
+    (sol / "year_2031" / "solution_2031_day_01.py").write_text(SOLUTION)
+    (tmp_path / "in" / "year_2031").mkdir(parents=True)
+    (tmp_path / "in" / "year_2031" / "input_2031_day_01.txt").write_text("1\n2\n3\n")
+    yield tmp_path
+    for name in list(sys.modules):
+        if name.split(".")[0] in ("year_2031", "daemon_helpers"):
+            del sys.modules[name]
+    if str(sol) in sys.path:
+        sys.path.remove(str(sol))
+
+
+def _config(tmp_path):
+    return MagicMock(
+        config={
+            "solutions": {"path": str(tmp_path / "sol")},
+            "inputs": {"path": str(tmp_path / "in")},
+            "cache": {"path": str(tmp_path / "cache")},
+        }
+    )
+
+
+def _touch(path, content):
+    path.write_text(content)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+@pytest.mark.unit
+class TestAoCDaemon:
+    def test_socket_path_defaults_to_cache_dir(self, tmp_path):
+        daemon = AoCDaemon(_config(tmp_path))
+        assert daemon.socket_path == tmp_path / "cache" / "daemon.sock"
+        config = MagicMock(config={"daemon": {"socket": str(tmp_path / "d.sock")}})
+        assert AoCDaemon(config).socket_path == tmp_path / "d.sock"
+
+    @patch("pysleigh.modules.daemon.AoCDate._compute_max_date", return_value=(2031, 25))
+    def test_run_captures_output(self, mock_date, tree):
+        reply = AoCDaemon(_config(tree)).handle({"command": "run", "day": 1})
+        assert reply["ok"] is True
+        assert reply["result"]["part1"] == 12
+        assert reply["result"]["part2"] == 3
+        assert reply["output"] == "part two\n"
+        assert reply["reloaded"] == []
+
+    @patch("pysleigh.modules.daemon.AoCDate._compute_max_date", return_value=(2031, 25))
+    def test_changed_helper_reloads_only_its_users(self, mock_date, tree):
+        daemon = AoCDaemon(_config(tree))
+        request = {"command": "run", "year": 2031, "day": 1}
+        daemon.handle(request)
+        solution = sys.modules["year_2031.solution_2031_day_01"]
+        package = sys.modules["year_2031"]
+
+        assert daemon.handle(request)["reloaded"] == []
+        assert sys.modules["year_2031.solution_2031_day_01"] is solution
+
+        _touch(
+            tree / "sol" / "daemon_helpers" / "scaling.py",
+            "def scale(x):\n    return x * 3\n",
+        )
+        reply = daemon.handle(request)
+        assert reply["reloaded"] == [
+            "daemon_helpers.scaling",
+            "year_2031.solution_2031_day_01",
+        ]
+        assert reply["result"]["part1"] == 18
+        assert sys.modules["year_2031"] is package
+
+    @patch("pysleigh.modules.daemon.AoCDate._compute_max_date", return_value=(2031, 25))
+    def test_runner_is_reused_per_day(self, mock_date, tree):
+        daemon = AoCDaemon(_config(tree))
+        with patch("pysleigh.modules.daemon.AoCRunner") as mock_runner:
+            mock_runner.return_value.run_solution.return_value = {"part1": 1}
+            daemon.handle({"command": "run", "year": 2031, "day": 1})
+            daemon.handle({"command": "run", "year": 2031, "day": 1})
+        mock_runner.assert_called_once()
+
+    def test_unknown_command(self, tmp_path):
+        reply = AoCDaemon(_config(tmp_path)).handle({"command": "fly"})
+        assert reply == {"ok": False, "error": "Unknown command: fly"}
+
+    def test_handler_errors_are_replied(self, tmp_path):
+        daemon = AoCDaemon(_config(tmp_path))
+        with patch.object(daemon, "_handle_test", side_effect=ValueError("bad day")):
+            reply = daemon.handle({"command": "test"})
+        assert reply["ok"] is False
+        assert reply["error"] == "bad day"
+
+    @patch("pysleigh.modules.daemon.AoCDate._compute_max_date", return_value=(2031, 25))
+    def test_serves_over_unix_socket(self, mock_date, tree):
+        daemon = AoCDaemon(_config(tree)).start()
+        try:
+            client = AoCDaemonClient(daemon.socket_path, timeout=10)
+            reply = client.request("run", year=2031, day=1)
+            assert reply["result"]["part1"] == 12
+            assert client.ping()["requests"] == 2
+            with pytest.raises(RuntimeError):
+                AoCDaemon(_config(tree)).bind()
+            client.request("shutdown")
+        finally:
+            daemon.stop()
+        assert not daemon.socket_path.exists()
+        assert client.ping() is None
+
+    def test_bind_replaces_stale_socket(self, tmp_path):
+        daemon = AoCDaemon(_config(tmp_path)).start()
+        daemon.stop()
+        daemon.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        daemon.socket_path.write_text("")
+        replacement = AoCDaemon(_config(tmp_path))
+        replacement.bind()
+        replacement.server.server_close()
+        assert daemon.socket_path.exists()
@@ -0,0 +1,97 @@
+import pytest
+import requests
+from unittest.mock import patch, MagicMock
+from pysleigh.modules.fixtures import AoCFixtureServer
+from pysleigh.modules.input import AoCInput
+from pysleigh.modules.answers import AoCAnswers
+from pysleigh.modules.submit_solution import AoCSubmitter
+from pysleigh.utilities.date import AoCDate
+from pysleigh.utilities.session import AoCSession
+
+HTML = """
+<article><h2>--- Day 1: Elves ---</h2><p>Part one.</p></article>
+<p>Your puzzle answer was <code>one</code>.</p>
+<article><h2>--- Part Two ---</h2><p>Part two.</p></article>
+<p>Your puzzle answer was <code>two</code>.</p>
+"""
+
+
+@pytest.mark.unit
+class TestAoCFixtureServer:
+    def _fixtures(self, tmp_path):
+        day = tmp_path / "fixtures" / "2022" / "day" / "1"
+        day.mkdir(parents=True)
+        (day / "index.html").write_text(HTML)
+        (day / "input").write_text("1\n2\n3\n")
+        (day / "answer").write_text("<article><p>That's the right answer!</p></article>")
+        return tmp_path / "fixtures"
+
+    def _serve(self, tmp_path, **kwargs):
+        AoCSession.close_shared()
+        server = AoCFixtureServer(
+            MagicMock(config={}), path=self._fixtures(tmp_path), port=0, **kwargs
+        )
+        return server.start()
+
+    def _config(self, tmp_path, server):
+        return MagicMock(
+            config={
+                "session_cookie": {"session_cookie": "fixtures"},
+                "session": {"base_url": server.url + "/"},
+                "cache": {"path": str(tmp_path / "cache")},
+                "inputs": {"path": str(tmp_path / "inputs")},
+                "answers": {"path": str(tmp_path / "answers")},
+            }
+        )
+
+    def test_modules_fetch_from_configured_base_url(self, tmp_path):
+        server = self._serve(tmp_path)
+        try:
+            config = self._config(tmp_path, server)
+            date = AoCDate(2022, 1)
+            assert AoCInput(date, config).url == f"{server.url}/2022/day/1/input"
+            assert AoCInput(date, config).fetch_input() == "1\n2\n3\n"
+            assert AoCAnswers(date, config).fetch_answers() == {
+                "part1": "one",
+                "part2": "two",
+            }
+            submitter = AoCSubmitter(date, config)
+            assert "right answer" in submitter.submit(1, "one")
+        finally:
+            server.stop()
+            AoCSession.close_shared()
+
+    def test_missing_fixture_is_404(self, tmp_path):
+        server = self._serve(tmp_path)
+        try:
+            assert requests.get(f"{server.url}/2022/day/2/input").status_code == 404
+            assert requests.get(f"{server.url}/../../etc/passwd").status_code == 404
+        finally:
+            server.stop()
+
+    def test_etag_revalidation_returns_304(self, tmp_path):
+        server = self._serve(tmp_path)
+        try:
+            first = requests.get(f"{server.url}/2022/day/1")
+            assert first.status_code == 200
+            again = requests.get(
+                f"{server.url}/2022/day/1",
+                headers={"If-None-Match": first.headers["ETag"]},
+            )
+            assert again.status_code == 304
+        finally:
+            server.stop()
+
+    def test_record_saves_upstream_response(self, tmp_path):
+        server = self._serve(tmp_path, upstream="https://upstream.example/")
+        try:
+            with patch.object(AoCSession, "get") as mock_get:
+                mock_get.return_value = MagicMock(status_code=200, content=b"9\n")
+                response = requests.get(f"{server.url}/2022/day/2/input")
+                requests.get(f"{server.url}/2022/day/2/input")
+            assert response.text == "9\n"
+            mock_get.assert_called_once_with("https://upstream.example/2022/day/2/input")
+            assert (server.root / "2022" / "day" / "2" / "input").read_text() == "9\n"
+        finally:
+            server.stop()
+            AoCSession.close_shared()
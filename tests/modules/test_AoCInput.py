@@ -1,8 +1,9 @@
 import pytest
 from unittest.mock import patch, MagicMock
 from pathlib import Path
-from pysleigh.modules.input import AoCInput
+from pysleigh.modules.input import AoCInput, AoCInputStore
 from pysleigh.utilities.date import AoCDate
+from pysleigh.utilities.process import AoCProcessPool
 
 
 @pytest.mark.unit
@@ -52,15 +53,69 @@ class TestAoCInput:
         assert result == ""
         assert "Failed to fetch input: 404" in caplog.text
 
-    def test_write_input_creates_file(self, tmp_path, monkeypatch):
+    def test_fetch_input_async(self):
+        import asyncio
+        from pysleigh.utilities.async_session import AoCAsyncResponse
+
+        session = MagicMock()
+
+        async def get(url):
+            assert url == "https://adventofcode.com/2022/day/1/input"
+            return AoCAsyncResponse(200, "abc123", {})
+
+        session.get = get
+        i = AoCInput(AoCDate(2022, 1))
+        assert asyncio.run(i.fetch_input_async(session)) == "abc123"
+
+    def _stream(self, chunks, headers=None):
+        resp = MagicMock(status_code=200, headers=headers or {})
+        resp.iter_content.return_value = iter(chunks)
+        return resp
+
+    def test_write_input_creates_file(self, tmp_path):
         file = tmp_path / "test.txt"
-        monkeypatch.setattr(
-            "pysleigh.modules.input.AoCInput.fetch_input", lambda self: "data"
-        )
         i = AoCInput(AoCDate(2022, 1))
         i.input_path = file
-        i.write_input(overwrite=True)
+        with patch("pysleigh.utilities.session.AoCSession.get") as mock_get:
+            mock_get.return_value = self._stream([b"da", b"ta"])
+            i.write_input(overwrite=True)
+        mock_get.assert_called_once_with(i.url, stream=True)
         assert file.read_text() == "data"
+        assert i.checksum_path.read_text().startswith(
+            "3a6eb0790f39ac87c94f3856b2dd2c5d110e6811602261a9a923d3bb23adc8b7"
+        )
+        assert i.verify_local() is True
+
+    def test_truncated_download_leaves_no_file(self, tmp_path):
+        file = tmp_path / "test.txt"
+        i = AoCInput(AoCDate(2022, 1))
+        i.input_path = file
+        with patch("pysleigh.utilities.session.AoCSession.get") as mock_get:
+            mock_get.return_value = self._stream([b"da"], {"Content-Length": "4"})
+            i.write_input(overwrite=True)
+        assert not file.exists()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_corrupt_input_is_detected(self, tmp_path, caplog):
+        file = tmp_path / "test.txt"
+        i = AoCInput(AoCDate(2022, 1))
+        i.input_path = file
+        with patch("pysleigh.utilities.session.AoCSession.get") as mock_get:
+            mock_get.return_value = self._stream([b"data\n"])
+            i.write_input()
+        file.write_text("da")
+        assert i.verify_local() is False
+        assert i.check_local() is False
+        assert i.read_local() == ""
+        assert "Checksum mismatch" in caplog.text
+
+    def test_input_without_checksum_is_trusted(self, tmp_path):
+        file = tmp_path / "test.txt"
+        file.write_text("by hand")
+        i = AoCInput(AoCDate(2022, 1))
+        i.input_path = file
+        assert i.verify_local() is None
+        assert i.check_local() is True
 
     def test_read_local_returns_content(self, tmp_path):
         file = tmp_path / "a.txt"
@@ -77,7 +132,147 @@ class TestAoCInput:
         assert i.get_or_fetch() == "cached"
 
 
+def _add_inputs(root, account):
+    config = MagicMock(config={"inputs": {"store_path": root, "compression": "gzip"}})
+    store = AoCInputStore(config)
+    source = Path(root) / f"{account}.txt"
+    source.write_text(account)
+    for day in range(1, 26):
+        store.add_file(account, 2022, day, source)
+    return {"account": account}
+
+
+@pytest.mark.unit
+class TestAoCInputStore:
+    def _config(self, tmp_path, account="alice", **inputs):
+        return MagicMock(
+            config={
+                "session_cookie": {"session_cookie": "cookie"},
+                "inputs": {
+                    "path": str(tmp_path / "inputs"),
+                    "store": True,
+                    "account": account,
+                    **inputs,
+                },
+            }
+        )
+
+    def _download(self, inp, data):
+        resp = MagicMock(status_code=200, headers={})
+        resp.iter_content.return_value = iter([data])
+        with patch("pysleigh.utilities.session.AoCSession.get", return_value=resp):
+            inp.write_input()
+
+    def test_identical_inputs_share_one_blob(self, tmp_path):
+        for account in ("alice", "bob"):
+            config = self._config(tmp_path, account, materialize=False)
+            self._download(AoCInput(AoCDate(2022, 1), config), b"1\n2\n")
+
+        store = AoCInputStore(self._config(tmp_path))
+        assert sorted(store.read_index()) == ["alice/2022/01", "bob/2022/01"]
+        assert store.stats()["blobs"] == 1
+        assert not (tmp_path / "inputs" / "2022").exists()
+
+    def test_read_local_decompresses_from_store(self, tmp_path):
+        config = self._config(tmp_path, materialize=False, compression="gzip")
+        self._download(AoCInput(AoCDate(2022, 1), config), b"hello")
+        inp = AoCInput(AoCDate(2022, 1), config)
+        assert inp.check_local() is True
+        assert inp.read_local() == "hello"
+        assert inp.get_or_fetch() == "hello"
+        assert list((tmp_path / "inputs" / ".store" / "blobs").rglob("*.gz"))
 
+    def test_zstd_blobs(self, tmp_path):
+        pytest.importorskip("zstandard")
+        config = self._config(tmp_path, compression="zstd")
+        self._download(AoCInput(AoCDate(2022, 1), config), b"zz")
+        assert list((tmp_path / "inputs" / ".store" / "blobs").rglob("*.zst"))
+        assert AoCInput(AoCDate(2022, 1), config).read_local() == "zz"
 
+    def test_materialize_restores_plain_file(self, tmp_path):
+        config = self._config(tmp_path, materialize=False)
+        self._download(AoCInput(AoCDate(2022, 1), config), b"abc")
+        inp = AoCInput(AoCDate(2022, 1), config)
+        assert not inp.input_path.exists()
+        assert inp.materialize().read_text() == "abc"
+        assert inp.verify_local() is True
+
+    def test_existing_plain_input_is_adopted(self, tmp_path):
+        config = self._config(tmp_path)
+        inp = AoCInput(AoCDate(2022, 1), config)
+        inp.input_path.parent.mkdir(parents=True)
+        inp.input_path.write_text("legacy")
+        assert inp.check_local() is True
+        assert AoCInputStore(config).read("alice", 2022, 1) == b"legacy"
+
+    def test_adopted_input_is_removed_without_materialize(self, tmp_path):
+        config = self._config(tmp_path, materialize=False)
+        inp = AoCInput(AoCDate(2022, 1), config)
+        inp.input_path.parent.mkdir(parents=True)
+        inp.input_path.write_text("legacy")
+        assert inp.check_local() is True
+        assert not inp.input_path.exists()
+        assert inp.read_local() == "legacy"
+
+    def test_working_copy_is_temporary_without_materialize(self, tmp_path):
+        config = self._config(tmp_path, materialize=False)
+        self._download(AoCInput(AoCDate(2022, 1), config), b"abc")
+        inp = AoCInput(AoCDate(2022, 1), config)
+        with inp.working_copy() as path:
+            assert path.read_text() == "abc"
+            assert path.parent == inp.store.root / "work"
+        assert not path.exists()
+        assert not inp.input_path.exists()
+        assert not inp.checksum_path.exists()
+
+        # With materialize on, the plain file is the working copy
+        inp = AoCInput(AoCDate(2022, 1), self._config(tmp_path))
+        with inp.working_copy() as path:
+            assert path == inp.input_path
+        assert inp.input_path.read_text() == "abc"
+
+    def test_runner_leaves_no_plain_input_without_materialize(self, tmp_path):
+        from pysleigh.modules.run_solution import AoCRunner
+
+        config = self._config(tmp_path, materialize=False)
+        self._download(AoCInput(AoCDate(2022, 1), config), b"1\n2\n")
+        mod = MagicMock()
+        mod.Solution.side_effect = lambda path: MagicMock(
+            part1=MagicMock(return_value=Path(path).read_text())
+        )
+        with patch("importlib.import_module", return_value=mod):
+            result = AoCRunner(AoCDate(2022, 1), config).run_solution()
+        assert result["part1"] == "1\n2\n"
+        inp = AoCInput(AoCDate(2022, 1), config)
+        assert not inp.input_path.exists()
+        assert list((inp.store.root / "work").iterdir()) == []
+
+    def test_corrupt_blob_is_not_returned(self, tmp_path, caplog):
+        config = self._config(tmp_path, materialize=False, compression="gzip")
+        self._download(AoCInput(AoCDate(2022, 1), config), b"abc")
+        store = AoCInputStore(config)
+        blob = store.lookup("alice", 2022, 1)
+        blob.write_bytes(b"not gzip")
+        assert store.read("alice", 2022, 1) is None
+        assert "Corrupt input blob" in caplog.text
+
+    def test_concurrent_processes_keep_every_index_entry(self, tmp_path):
+        accounts = [f"user{n}" for n in range(4)]
+        AoCProcessPool(jobs=4).map(
+            _add_inputs, [{"root": str(tmp_path), "account": a} for a in accounts]
+        )
+        index = AoCInputStore(
+            MagicMock(config={"inputs": {"store_path": str(tmp_path)}})
+        ).read_index()
+        assert len(index) == 4 * 25
 
+    def test_account_defaults_to_cookie_hash(self):
+        config = MagicMock(config={"session_cookie": {"session_cookie": "cookie"}})
+        account = AoCInputStore.get_account(config)
+        assert len(account) == 12 and "cookie" not in account
 
+    def test_reader_maps_materialized_input(self, tmp_path):
+        config = self._config(tmp_path, materialize=False)
+        self._download(AoCInput(AoCDate(2022, 1), config), b"1\n2\n")
+        with AoCInput(AoCDate(2022, 1), config).reader() as reader:
+            assert list(reader.lines()) == [b"1", b"2"]
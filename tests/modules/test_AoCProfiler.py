@@ -0,0 +1,68 @@
+import pstats
+import pytest
+from unittest.mock import patch, MagicMock
+from pysleigh.modules.profiler import AoCProfiler
+from pysleigh.utilities.date import AoCDate
+
+
+SOLUTION = (
+    "def busy(n):\n"
+    "    return sum(i * i for i in range(n))\n"
+    "\n"
+    "class Solution:\n"
+    "    def __init__(self, input_path):\n"
+    "        self.n = int(open(input_path).read())\n"
+    "    def part1(self):\n"
+    "        return busy(self.n)\n"
+    "    def part2(self):\n"
+    "        return busy(self.n * 2)\n"
+)
+
+
+@pytest.mark.unit
+class TestAoCProfiler:
+    def _profiler(self, tmp_path, monkeypatch):
+        pkg = tmp_path / "sol" / "year_2021"
+        pkg.mkdir(parents=True)
+        (pkg / "__init__.py").write_text("")
+        (pkg / "solution_2021_day_09.py").write_text(SOLUTION)
+        (tmp_path / "input.txt").write_text("200000")
+        monkeypatch.syspath_prepend(str(tmp_path / "sol"))
+
+        profiler = AoCProfiler(
+            AoCDate(2021, 9), output_dir=str(tmp_path / "profiles"), top=5
+        )
+        monkeypatch.setattr(profiler, "_get_input_path", lambda: str(tmp_path / "input.txt"))
+        return profiler
+
+    def test_output_dir_from_config(self, tmp_path):
+        cfg = {"profiles": {"path": str(tmp_path / "p")}}
+        profiler = AoCProfiler(AoCDate(2021, 9), config=MagicMock(config=cfg))
+        assert profiler.output_dir == tmp_path / "p"
+
+    def test_profile_writes_prof_files_and_collapsed_stacks(self, tmp_path, monkeypatch):
+        profiler = self._profiler(tmp_path, monkeypatch)
+        results = profiler.profile()
+
+        for phase in AoCProfiler.PHASES:
+            stats = pstats.Stats(results[phase]["prof"])
+            assert stats.total_calls > 0
+            assert results[phase]["time"] > 0
+            assert len(results[phase]["hotspots"]) <= 5
+
+        part1_functions = [h["function"] for h in results["part1"]["hotspots"]]
+        assert "solution_2021_day_09.py:1(busy)" in part1_functions
+        assert not any("profiler.py" in f for f in part1_functions)
+
+        collapsed = (tmp_path / "profiles" / "2021_day_09.collapsed").read_text()
+        assert results["collapsed"].endswith("2021_day_09.collapsed")
+        for line in collapsed.splitlines():
+            stack, count = line.rsplit(" ", 1)
+            assert stack.split(";")[0] in AoCProfiler.PHASES
+            assert int(count) > 0
+
+    def test_profile_returns_empty_on_import_failure(self, tmp_path, caplog):
+        profiler = AoCProfiler(AoCDate(2021, 9), output_dir=str(tmp_path))
+        with patch("pysleigh.modules.profiler.importlib.import_module", side_effect=ImportError("boom")):
+            assert profiler.profile() == {}
+        assert "Profiling failed" in caplog.text
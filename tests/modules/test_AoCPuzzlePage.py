@@ -0,0 +1,147 @@
+import asyncio
+import gzip
+import json
+import pytest
+from unittest.mock import patch, MagicMock
+from pysleigh.modules.page import AoCPuzzlePage
+from pysleigh.modules.article import AoCArticle
+from pysleigh.modules.answers import AoCAnswers
+from pysleigh.utilities.date import AoCDate
+
+HTML = """
+<article><h2>--- Day 1: Elves ---</h2><p>Part one.</p></article>
+<p>Your puzzle answer was <code>one</code>.</p>
+<article><h2>--- Part Two ---</h2><p>Part two.</p></article>
+<p>Your puzzle answer was <code>two</code>.</p>
+"""
+
+
+@pytest.mark.unit
+class TestAoCPuzzlePage:
+    def _config(self, tmp_path, **cache):
+        return MagicMock(config={"cache": {"path": str(tmp_path), **cache}})
+
+    def test_page_path_uses_cache_dir(self, tmp_path):
+        page = AoCPuzzlePage(AoCDate(2022, 3), self._config(tmp_path))
+        assert page.page_path == (
+            tmp_path / "pages" / page.account / "2022" / "day_03.json.gz"
+        )
+
+    def test_pages_are_cached_per_account(self, tmp_path):
+        def config(cookie):
+            return MagicMock(
+                config={
+                    "cache": {"path": str(tmp_path)},
+                    "session_cookie": {"session_cookie": cookie},
+                }
+            )
+
+        first = AoCPuzzlePage(AoCDate(2022, 1), config("alice"))
+        first.write_cached(HTML)
+        second = AoCPuzzlePage(AoCDate(2022, 1), config("bob"))
+        assert second.account != first.account
+        assert second.read_cached() == {}
+
+        # A record from another account is a miss even at the same path
+        second.page_path.parent.mkdir(parents=True)
+        second.page_path.write_bytes(first.page_path.read_bytes())
+        assert second.read_cached() == {}
+        assert AoCPuzzlePage(AoCDate(2022, 1), config("alice")).read_cached()["html"] == HTML
+
+    def test_fetch_stores_compressed_page_with_timestamp(self, tmp_path):
+        page = AoCPuzzlePage(AoCDate(2022, 1), self._config(tmp_path))
+        with patch("pysleigh.utilities.session.AoCSession.get") as mock_get:
+            mock_get.return_value = MagicMock(status_code=200, text=HTML)
+            assert page.get_html() == HTML
+
+        with gzip.open(page.page_path, "rt") as file:
+            record = json.load(file)
+        assert record["html"] == HTML
+        assert record["url"] == "https://adventofcode.com/2022/day/1"
+        assert record["fetched_at"] > 0
+
+    def test_article_and_answers_share_one_download(self, tmp_path):
+        config = self._config(tmp_path)
+        with patch("pysleigh.utilities.session.AoCSession.get") as mock_get:
+            mock_get.return_value = MagicMock(status_code=200, text=HTML)
+            article = AoCArticle(AoCDate(2022, 1), config=config).fetch_article()
+            answers = AoCAnswers(AoCDate(2022, 1), config=config).fetch_answers()
+        assert mock_get.call_count == 1
+        assert "Part two." in article
+        assert answers == {"part1": "one", "part2": "two"}
+
+    def test_stale_incomplete_page_is_refetched(self, tmp_path):
+        page = AoCPuzzlePage(AoCDate(2022, 1), self._config(tmp_path, page_max_age=0))
+        page.write_cached("<article>only part one</article>")
+        with patch("pysleigh.utilities.session.AoCSession.get") as mock_get:
+            mock_get.return_value = MagicMock(status_code=200, text=HTML)
+            html = page.get_html(complete=AoCArticle.is_complete)
+        assert html == HTML
+        assert mock_get.call_count == 1
+
+    def test_complete_page_is_reused_when_stale(self, tmp_path):
+        page = AoCPuzzlePage(AoCDate(2022, 1), self._config(tmp_path, page_max_age=0))
+        page.write_cached(HTML)
+        with patch("pysleigh.utilities.session.AoCSession.get") as mock_get:
+            assert page.get_html(complete=AoCArticle.is_complete) == HTML
+            mock_get.assert_not_called()
+
+            mock_get.return_value = MagicMock(status_code=404)
+            assert page.get_html(refresh=True) == ""
+            assert page.status_code == 404
+
+    def test_corrupt_cache_is_ignored(self, tmp_path, caplog):
+        page = AoCPuzzlePage(AoCDate(2022, 1), self._config(tmp_path))
+        page.page_path.parent.mkdir(parents=True)
+        page.page_path.write_bytes(b"not gzip")
+        assert page.read_cached() == {}
+        assert "corrupt page cache" in caplog.text
+
+    def test_refresh_revalidates_and_reuses_page_on_304(self, tmp_path):
+        page = AoCPuzzlePage(AoCDate(2022, 1), self._config(tmp_path))
+        page.write_cached(HTML)
+        with patch("pysleigh.utilities.session.AoCSession.get") as mock_get:
+            mock_get.return_value = MagicMock(status_code=304)
+            assert page.get_html(refresh=True) == HTML
+        mock_get.assert_called_once_with(page.url, conditional=True)
+
+    def test_unchanged_article_is_not_rewritten(self, tmp_path):
+        config = MagicMock(config={
+            "cache": {"path": str(tmp_path / "cache")},
+            "articles": {"path": str(tmp_path / "articles")},
+        })
+        article = AoCArticle(AoCDate(2022, 1), config=config)
+        with patch("pysleigh.utilities.session.AoCSession.get") as mock_get:
+            mock_get.return_value = MagicMock(status_code=200, text=HTML)
+            article.write_article()
+            written = article.article_path.stat().st_mtime_ns
+
+            mock_get.return_value = MagicMock(status_code=304)
+            article.write_article(overwrite=True)
+        assert mock_get.call_args.kwargs == {"conditional": True}
+        assert article.article_path.stat().st_mtime_ns == written
+
+    def test_async_fetches_share_the_page_cache(self, tmp_path):
+        from pysleigh.utilities.async_session import AoCAsyncSession, AoCAsyncResponse
+
+        calls = []
+
+        async def transport(method, url, **kwargs):
+            calls.append(url)
+            return AoCAsyncResponse(200, HTML, {})
+
+        config = self._config(tmp_path)
+        session = AoCAsyncSession(config, transport=transport)
+
+        async def fetch_both():
+            article = AoCArticle(AoCDate(2022, 1), config=config)
+            answers = AoCAnswers(AoCDate(2022, 1), config=config)
+            return (
+                await article.fetch_article_async(session=session),
+                await answers.fetch_answers_async(session=session),
+            )
+
+        article, answers = asyncio.run(fetch_both())
+        assert calls == ["https://adventofcode.com/2022/day/1"]
+        assert "Part two." in article
+        assert answers == {"part1": "one", "part2": "two"}
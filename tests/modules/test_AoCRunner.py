@@ -25,6 +25,27 @@ class TestAoCRunner:
         assert result["part2"] == "two"
         assert isinstance(result["time_part1"], float)
         assert isinstance(result["time_part2"], float)
+        assert isinstance(result["time_parse"], float)
+        assert result["time_total"] == pytest.approx(
+            result["time_parse"] + result["time_part1"] + result["time_part2"]
+        )
+
+    def test_run_solution_uses_worker_when_timeout_set(self):
+        config = MagicMock(config={"timeouts": {"day": 5, "part": 2}})
+        runner = AoCRunner(aoc_date=AoCDate(2022, 1), config=config)
+        assert runner.timeout == 5
+        assert runner.part_timeout == 2
+
+        with patch("pysleigh.modules.run_solution.AoCProcessPool") as MockPool:
+            MockPool.in_worker.return_value = False
+            MockPool.return_value.map.return_value = [
+                {"status": "timeout", "phase": "part2"}
+            ]
+            result = runner.run_solution()
+
+        MockPool.assert_called_once_with(jobs=1, timeout=5, phase_timeout=2)
+        assert MockPool.return_value.map.call_args.args[0] == runner._execute
+        assert result == {"status": "timeout", "phase": "part2"}
 
     def test_run_solution_handles_failure(self):
         date = AoCDate(2022, 1)
@@ -28,6 +28,39 @@ class TestAoCSubmitter:
             assert "HTTP 500" in caplog.text
             assert "Error: HTTP 500" in result
 
+    def test_correct_submit_invalidates_cached_page(self, tmp_path):
+        from pysleigh.modules.page import AoCPuzzlePage
+
+        config = MagicMock(config={"cache": {"path": str(tmp_path)}})
+        page = AoCPuzzlePage(AoCDate(2022, 1), config)
+        page.write_cached("<article>only part one</article>")
+        submitter = AoCSubmitter(AoCDate(2022, 1), config)
+
+        with patch.object(submitter.session, "post") as mock_post:
+            mock_post.return_value.status_code = 200
+            mock_post.return_value.text = "<article><p>That's not the right answer.</p></article>"
+            submitter.submit(1, "1")
+            assert page.page_path.exists()
+
+            mock_post.return_value.text = "<article><p>That's the right answer!</p></article>"
+            submitter.submit(1, "2")
+            assert not page.page_path.exists()
+
+    def test_submit_async_uses_given_session(self):
+        import asyncio
+        from pysleigh.utilities.async_session import AoCAsyncResponse
+
+        submitter = AoCSubmitter(AoCDate(2022, 1))
+        session = MagicMock()
+
+        async def post(url, data):
+            assert data == {"level": "2", "answer": "42"}
+            return AoCAsyncResponse(200, "<article><p>Right!</p></article>", {})
+
+        session.post = post
+        response = asyncio.run(submitter.submit_async(2, "42", session=session))
+        assert "Right!" in response
+
     def test_compute_answer_imports_correctly(self):
         date = AoCDate(2022, 1)
         submitter = AoCSubmitter(date)
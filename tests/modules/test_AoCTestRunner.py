@@ -54,3 +54,179 @@ class TestAoCTestRunner:
         with patch.object(runner, "run_all_tests", return_value=True) as mock:
             assert runner.run()
             mock.assert_called_once()
+
+    def _tree(self, tmp_path, assertion="True"):
+        sol = tmp_path / "solutions" / "year_2031"
+        sol.mkdir(parents=True)
+        (sol / "__init__.py").write_text("")
+        (sol / "solution_2031_day_01.py").write_text(
+            "class Solution:\n    def part1(self):\n        return 1\n"
+        )
+        tests = tmp_path / "tests" / "year_2031"
+        tests.mkdir(parents=True)
+        (tests / "test_2031_day_01.py").write_text(
+            "import year_2031.solution_2031_day_01 as mod\n\n"
+            f"def test_part1():\n    assert {assertion}\n"
+        )
+        return MagicMock(
+            config={
+                "solutions": {"path": str(tmp_path / "solutions")},
+                "tests": {"path": str(tmp_path / "tests"), "in_process": True},
+            }
+        )
+
+    def test_in_process_reuses_imported_solution_and_cleans_up(self, tmp_path):
+        import importlib
+        import sys
+
+        config = self._tree(tmp_path, "mod.MARKER == 'already imported'")
+        runner = AoCTestRunner(AoCDate(2031, 1), config)
+        assert runner.in_process is True
+        mod = importlib.import_module("year_2031.solution_2031_day_01")
+        mod.MARKER = "already imported"
+        path_before = list(sys.path)
+        try:
+            with patch("subprocess.run") as mock_run:
+                assert runner.run_specific_test() is True
+            mock_run.assert_not_called()
+            assert "test_2031_day_01" not in sys.modules
+            assert sys.path == path_before
+        finally:
+            sys.modules.pop("year_2031.solution_2031_day_01", None)
+            sys.modules.pop("year_2031", None)
+
+    def test_in_process_reports_failures(self, tmp_path):
+        import sys
+
+        config = self._tree(tmp_path, "mod.Solution().part1() == 2")
+        try:
+            assert AoCTestRunner(AoCDate(2031, 1), config).run_specific_test() is False
+        finally:
+            sys.modules.pop("year_2031.solution_2031_day_01", None)
+            sys.modules.pop("year_2031", None)
+
+    def test_in_process_keeps_extension_modules_loaded(self, tmp_path):
+        import importlib.machinery
+        import importlib.util
+        import sys
+
+        candidates = ("_testbuffer", "_testcapi", "_ctypes_test", "xxlimited", "_lzma")
+        ext = next(
+            (
+                name
+                for name in candidates
+                if name not in sys.modules
+                and isinstance(
+                    getattr(importlib.util.find_spec(name), "loader", None),
+                    importlib.machinery.ExtensionFileLoader,
+                )
+            ),
+            None,
+        )
+        if ext is None:
+            pytest.skip("No unloaded C extension module available")
+
+        config = self._tree(tmp_path)
+        test_file = tmp_path / "tests" / "year_2031" / "test_2031_day_01.py"
+        test_file.write_text(
+            f"import {ext}\nimport year_2031.solution_2031_day_01 as mod\n\n"
+            "def test_part1():\n    assert mod.Solution().part1() == 1\n"
+        )
+        runner = AoCTestRunner(AoCDate(2031, 1), config)
+        try:
+            assert runner.run_specific_test() is True
+            loaded = sys.modules[ext]
+            assert "test_2031_day_01" not in sys.modules
+            assert "year_2031.solution_2031_day_01" not in sys.modules
+            # The second session imports the same extension module object
+            assert runner.run_specific_test() is True
+            assert sys.modules[ext] is loaded
+        finally:
+            sys.modules.pop("year_2031.solution_2031_day_01", None)
+            sys.modules.pop("year_2031", None)
+
+    def test_subprocess_is_the_default(self):
+        runner = AoCTestRunner(config=MagicMock(config={}))
+        assert runner.in_process is False
+        assert AoCTestRunner(config=MagicMock(config={}), in_process=True).in_process
+
+    def _sharded_config(self, tmp_path):
+        tests = tmp_path / "tests" / "year_2030"
+        tests.mkdir(parents=True)
+        for day in range(1, 5):
+            (tests / f"test_2030_day_{day:02d}.py").write_text("")
+        return MagicMock(
+            config={
+                "tests": {"path": str(tmp_path / "tests")},
+                "cache": {"path": str(tmp_path / "cache")},
+            }
+        )
+
+    def test_plan_shards_balances_by_recorded_durations(self, tmp_path):
+        runner = AoCTestRunner(config=self._sharded_config(tmp_path), jobs=2)
+        runner.save_durations(
+            {
+                "year_2030/test_2030_day_01.py": 8.0,
+                "year_2030/test_2030_day_02.py": 1.0,
+                "year_2030/test_2030_day_03.py": 4.0,
+                "year_2030/test_2030_day_04.py": 3.0,
+            }
+        )
+        files = runner._collect_files(tmp_path / "tests")
+        shards = runner.plan_shards(files, 2)
+        assert [[f.name[-5:-3] for f in shard] for shard in shards] == [
+            ["01"],
+            ["03", "04", "02"],
+        ]
+
+    def test_plan_shards_spreads_zero_duration_files(self, tmp_path):
+        runner = AoCTestRunner(config=self._sharded_config(tmp_path))
+        files = runner._collect_files(tmp_path / "tests")
+        runner.save_durations({runner._relative(f): 0.0 for f in files})
+        shards = runner.plan_shards(files[:2], 4)
+        assert [len(shard) for shard in shards] == [1, 1]
+
+    def test_run_year_tests_shards_with_jobs(self, tmp_path):
+        runner = AoCTestRunner(config=self._sharded_config(tmp_path), jobs=4)
+        with patch.object(runner, "_run_sharded", return_value=True) as mock_sharded:
+            assert runner.run_year_tests(2030) is True
+        assert len(mock_sharded.call_args.args[0]) == 4
+
+    def test_merge_reports_counts_outcomes_and_durations(self, tmp_path):
+        report = tmp_path / "shard.xml"
+        report.write_text(
+            '<testsuites><testsuite>'
+            '<testcase file="y/test_a.py" name="test_ok" time="0.5"/>'
+            '<testcase file="y/test_a.py" name="test_bad" time="0.25">'
+            '<failure message="boom"/></testcase>'
+            '<testcase file="y/test_b.py" name="test_skip" time="0">'
+            '<skipped/></testcase>'
+            '</testsuite></testsuites>'
+        )
+        runner = AoCTestRunner(config=self._sharded_config(tmp_path))
+        summary = runner._merge_reports([report, tmp_path / "missing.xml"])
+        assert (summary["passed"], summary["failed"], summary["skipped"]) == (1, 1, 1)
+        assert summary["failures"] == ["y/test_a.py::test_bad"]
+        assert summary["file_durations"] == {"y/test_a.py": 0.75, "y/test_b.py": 0.0}
+
+    def test_changed_runs_only_affected_files(self, tmp_path, capsys):
+        runner = AoCTestRunner(config=self._sharded_config(tmp_path), changed=True)
+        runs = []
+
+        def fake_run(files, jobs):
+            runs.append([f.name for f in files])
+            runner.summary = {
+                "file_outcomes": {runner._relative(f): True for f in files}
+            }
+            return True
+
+        with patch.object(runner, "_run_sharded", side_effect=fake_run):
+            assert runner.run_year_tests(2030) is True
+            assert runner.run_year_tests(2030) is True
+            day = tmp_path / "tests" / "year_2030" / "test_2030_day_03.py"
+            day.write_text("# edited\n")
+            assert runner.run_year_tests(2030) is True
+
+        assert [len(run) for run in runs] == [4, 1]
+        assert runs[1] == ["test_2030_day_03.py"]
+        assert "No changes since the last green run" in capsys.readouterr().out
@@ -0,0 +1,92 @@
+import pytest
+from unittest.mock import MagicMock
+from pysleigh.modules.selection import AoCTestSelector
+
+
+@pytest.mark.unit
+class TestAoCTestSelector:
+    def _tree(self, tmp_path):
+        sol = tmp_path / "sol"
+        (sol / "year_2019").mkdir(parents=True)
+        (sol / "common").mkdir()
+        (sol / "year_2019" / "__init__.py").write_text("")
+        (sol / "common" / "__init__.py").write_text("")
+        (sol / "common" / "grid.py").write_text("from . import parsing\n")
+        (sol / "common" / "parsing.py").write_text("import re\n")
+        (sol / "common" / "unused.py").write_text("")
+        (sol / "year_2019" / "solution_2019_day_01.py").write_text(
+            "from common.grid import *\nimport collections\n"
+        )
+        tests = tmp_path / "tests" / "year_2019"
+        tests.mkdir(parents=True)
+        test_file = tests / "test_2019_day_01.py"
+        test_file.write_text("from year_2019 import solution_2019_day_01\n")
+        (tmp_path / "in").mkdir()
+        (tmp_path / "in" / "input_2019_day_01.txt").write_text("1\n")
+        config = MagicMock(
+            config={
+                "solutions": {"path": str(sol)},
+                "tests": {"path": str(tmp_path / "tests")},
+                "inputs": {
+                    "path": str(tmp_path / "in"),
+                    "format": "input_{year}_day_{day:02d}.txt",
+                },
+                "answers": {
+                    "path": str(tmp_path / "ans"),
+                    "format": "answer_{year}_day_{day:02d}.txt",
+                },
+                "cache": {"path": str(tmp_path / "cache")},
+            }
+        )
+        return AoCTestSelector(config), test_file
+
+    def test_puzzle_date_follows_test_format(self, tmp_path):
+        selector, test_file = self._tree(tmp_path)
+        assert selector.puzzle_date(test_file) == (2019, 1)
+        assert selector.puzzle_date(tmp_path / "tests" / "test_helpers.py") is None
+
+    def test_dependencies_follow_local_imports(self, tmp_path):
+        selector, test_file = self._tree(tmp_path)
+        names = {
+            path.relative_to(tmp_path.resolve()).as_posix()
+            for path in selector.dependencies(test_file)
+        }
+        assert names == {
+            "tests/year_2019/test_2019_day_01.py",
+            "sol/year_2019/__init__.py",
+            "sol/year_2019/solution_2019_day_01.py",
+            "sol/common/__init__.py",
+            "sol/common/grid.py",
+            "sol/common/parsing.py",
+        }
+
+    @pytest.mark.parametrize(
+        "changed, affects",
+        [
+            ("sol/common/parsing.py", True),
+            ("in/input_2019_day_01.txt", True),
+            ("ans/answer_2019_day_01.txt", True),
+            ("sol/common/unused.py", False),
+        ],
+    )
+    def test_fingerprint_tracks_dependencies(self, tmp_path, changed, affects):
+        selector, test_file = self._tree(tmp_path)
+        before = selector.fingerprint(test_file)
+        target = tmp_path / changed
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text("# edited\n")
+        assert (selector.fingerprint(test_file) != before) is affects
+
+    def test_select_skips_only_unchanged_green_files(self, tmp_path):
+        selector, test_file = self._tree(tmp_path)
+        other = test_file.with_name("test_2019_day_02.py")
+        other.write_text("")
+        fingerprints = {test_file: "a", other: "b"}
+        assert selector.select(fingerprints) == [test_file, other]
+
+        selector.record(fingerprints, {test_file: True, other: False})
+        assert selector.select(fingerprints) == [other]
+        assert selector.select({test_file: "changed", other: "b"}) == [
+            test_file,
+            other,
+        ]
@@ -0,0 +1,50 @@
+import pytest
+from unittest.mock import MagicMock
+from pysleigh.modules.verification import AoCVerificationCache
+
+
+@pytest.mark.unit
+class TestAoCVerificationCache:
+    def _cache(self, tmp_path):
+        cfg = {"cache": {"path": str(tmp_path / "cache")}}
+        return AoCVerificationCache(config=MagicMock(config=cfg))
+
+    def _files(self, tmp_path):
+        solution = tmp_path / "solution.py"
+        solution.write_text("class Solution: pass\n")
+        data = tmp_path / "input.txt"
+        data.write_text("1 2 3\n")
+        return solution, data
+
+    def test_default_cache_dir(self):
+        cache = AoCVerificationCache(config=MagicMock(config={}))
+        assert cache.cache_dir == AoCVerificationCache.DEFAULT_PATH.expanduser() / "verified"
+
+    def test_record_then_verified(self, tmp_path):
+        cache = self._cache(tmp_path)
+        solution, data = self._files(tmp_path)
+        key = cache.fingerprint(solution, data, {"part1": 6, "part2": 3})
+        assert not cache.is_verified(key)
+        cache.record(key, 2022, 1)
+        assert cache.is_verified(key)
+
+    def test_fingerprint_changes_with_source_input_or_answers(self, tmp_path):
+        solution, data = self._files(tmp_path)
+        answers = {"part1": 6, "part2": 3}
+        key = AoCVerificationCache.fingerprint(solution, data, answers)
+        assert key != AoCVerificationCache.fingerprint(solution, data, {"part1": 6, "part2": 4})
+
+        solution.write_text("class Solution: x = 1\n")
+        edited = AoCVerificationCache.fingerprint(solution, data, answers)
+        assert edited != key
+
+        data.write_text("1 2 4\n")
+        assert AoCVerificationCache.fingerprint(solution, data, answers) != edited
+
+    def test_unreadable_files_are_never_cached(self, tmp_path):
+        cache = self._cache(tmp_path)
+        key = cache.fingerprint(None, tmp_path / "missing.txt", {})
+        assert key is None
+        cache.record(key, 2022, 1)
+        assert not cache.is_verified(key)
+        assert not cache.cache_dir.exists()
@@ -0,0 +1,176 @@
+import os
+import sys
+import pytest
+from unittest.mock import patch, MagicMock
+from pysleigh.modules.watch import AoCWatchRunner
+from pysleigh.utilities.date import AoCDate
+
+SOLUTION = """from watch_helpers import scale
+
+
+class Solution:
+    def __init__(self, path):
+        self.nums = [int(x) for x in open(path).read().split()]
+
+    def part1(self):
+        return scale(sum(self.nums))
+
+    def part2(self):
+        return max(self.nums)
+"""
+
+
+@pytest.fixture
+def tree(tmp_path):
+    sol = tmp_path / "sol"
+    (sol / "year_2032").mkdir(parents=True)
+    (sol / "year_2032" / "__init__.py").write_text("")
+    (sol / "watch_helpers.py").write_text("def scale(x):\n    return x * 2\n")
+    (sol / "year_2032" / "solution_2032_day_01.py").write_text(SOLUTION)
+    (tmp_path / "in").mkdir()
+    (tmp_path / "in" / "input.txt").write_text("1\n2\n3\n")
+    yield tmp_path
+    for name in list(sys.modules):
+        if name.split(".")[0] in ("year_2032", "watch_helpers"):
+            del sys.modules[name]
+    if str(sol) in sys.path:
+        sys.path.remove(str(sol))
+
+
+def _runner(tmp_path):
+    config = MagicMock(
+        config={
+            "solutions": {"path": str(tmp_path / "sol")},
+            "inputs": {"path": str(tmp_path / "in"), "format": "input.txt"},
+        }
+    )
+    with patch("pysleigh.utilities.date.AoCDate._is_valid", return_value=True):
+        return AoCWatchRunner(AoCDate(2032, 1), config)
+
+
+def _edit(path, content):
+    path.write_text(content)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    return {path}
+
+
+@pytest.mark.unit
+class TestAoCWatchRunner:
+    def test_solution_shape_ignores_formatting(self):
+        shape = AoCWatchRunner.solution_shape(SOLUTION)
+        assert set(shape) == {"parse", "part1", "part2"}
+        reformatted = "# notes\n\n" + SOLUTION.replace("\n\n\n", "\n\n\n\n") + "# end\n"
+        assert AoCWatchRunner.solution_shape(reformatted) == shape
+        edited = AoCWatchRunner.solution_shape(SOLUTION.replace("max(", "min("))
+        assert edited["part2"] != shape["part2"]
+        assert edited["part1"] == shape["part1"] and edited["parse"] == shape["parse"]
+
+    def test_watched_paths(self, tree):
+        runner = _runner(tree)
+        runner.run_once()
+        assert runner.watched_paths() == {
+            (tree / "sol" / "year_2032" / "solution_2032_day_01.py").resolve(),
+            (tree / "sol" / "year_2032" / "__init__.py").resolve(),
+            (tree / "sol" / "watch_helpers.py").resolve(),
+            (tree / "in" / "input.txt").resolve(),
+        }
+
+    def test_part_edit_reruns_only_that_part(self, tree):
+        runner = _runner(tree)
+        first = runner.run_once()
+        assert first["error"] is None
+        assert first["phases"]["part1"]["answer"] == 12
+        assert first["phases"]["part2"]["delta"] is None
+
+        solution = tree / "sol" / "year_2032" / "solution_2032_day_01.py"
+        result = runner.handle_changes(
+            _edit(solution, SOLUTION.replace("max(", "min("))
+        )
+        assert result["reloaded"] == ["year_2032.solution_2032_day_01"]
+        assert result["phases"]["part2"]["answer"] == 1
+        assert result["phases"]["part2"]["rerun"] is True
+        assert result["phases"]["part2"]["delta"] is not None
+        assert result["phases"]["part1"] == {
+            "answer": 12,
+            "time": first["phases"]["part1"]["time"],
+            "rerun": False,
+            "delta": None,
+        }
+
+    def test_part_links(self):
+        assert AoCWatchRunner.part_links(SOLUTION) == {"part1": set(), "part2": set()}
+        calls = SOLUTION.replace("max(self.nums)", "self.part1() * 10")
+        assert AoCWatchRunner.part_links(calls) == {
+            "part1": {"part2"},
+            "part2": {"part1"},
+        }
+        # part1 sorts the numbers part2 reads, through a helper
+        state = SOLUTION.replace("sum(self.nums)", "self._lowest()").replace(
+            "    def part2(self):",
+            "    def _lowest(self):\n        self.nums.sort()\n        return self.nums[0]"
+            "\n\n    def part2(self):",
+        )
+        assert AoCWatchRunner.part_links(state)["part2"] == {"part1"}
+
+    def test_part_edit_reruns_parts_that_use_it(self, tree):
+        solution = tree / "sol" / "year_2032" / "solution_2032_day_01.py"
+        calls = SOLUTION.replace("max(self.nums)", "self.part1() * 10")
+        solution.write_text(calls)
+        runner = _runner(tree)
+        assert runner.run_once()["phases"]["part2"]["answer"] == 120
+
+        result = runner.handle_changes(_edit(solution, calls.replace("sum(", "max(")))
+        assert result["phases"]["part1"]["answer"] == 6
+        assert result["phases"]["part2"]["answer"] == 60
+        assert result["phases"]["part2"]["rerun"] is True
+
+    def test_helper_and_input_changes_rerun_everything(self, tree):
+        runner = _runner(tree)
+        runner.run_once()
+        result = runner.handle_changes(
+            _edit(
+                tree / "sol" / "watch_helpers.py", "def scale(x):\n    return x * 10\n"
+            )
+        )
+        assert result["reloaded"] == ["watch_helpers", "year_2032.solution_2032_day_01"]
+        assert result["phases"]["part1"]["answer"] == 60
+        assert result["phases"]["part2"]["rerun"] is True
+
+        result = runner.handle_changes(_edit(tree / "in" / "input.txt", "4\n"))
+        assert result["reloaded"] == []
+        assert result["phases"]["part1"]["answer"] == 40
+
+    def test_unchanged_content_is_ignored(self, tree):
+        runner = _runner(tree)
+        runner.run_once()
+        solution = tree / "sol" / "year_2032" / "solution_2032_day_01.py"
+        assert runner.handle_changes(_edit(solution, SOLUTION)) is None
+        result = runner.handle_changes(_edit(solution, SOLUTION + "# tidy\n"))
+        assert result["phases"] == {}
+
+    def test_recovers_from_syntax_errors(self, tree):
+        runner = _runner(tree)
+        runner.run_once()
+        solution = tree / "sol" / "year_2032" / "solution_2032_day_01.py"
+        broken = runner.handle_changes(_edit(solution, SOLUTION + "def (:\n"))
+        assert "SyntaxError" in broken["error"]
+
+        fixed = runner.handle_changes(_edit(solution, SOLUTION.replace("max(", "min(")))
+        assert fixed["error"] is None
+        assert fixed["reloaded"] == ["year_2032.solution_2032_day_01"]
+        assert fixed["phases"]["part1"]["rerun"] is True
+        assert fixed["phases"]["part2"]["answer"] == 1
+
+    def test_tests_rerun_with_solution_changes(self, tree):
+        runner = _runner(tree)
+        runner.test_runner = MagicMock()
+        runner.test_path = tree / "test_day.py"
+        runner.test_path.write_text("")
+        runner.test_runner.run_specific_test.return_value = True
+        assert runner.run_once()["tests_passed"] is True
+
+        result = runner.handle_changes(_edit(runner.test_path, "# more\n"))
+        assert result["phases"] == {}
+        assert result["tests_passed"] is True
+        assert runner.test_runner.run_specific_test.call_count == 2
@@ -0,0 +1,109 @@
+import asyncio
+import importlib.util
+import pytest
+from unittest.mock import patch, MagicMock
+from pysleigh.utilities.async_session import AoCAsyncSession, AoCAsyncResponse
+from pysleigh.utilities.circuit import AoCCircuitOpenError
+
+
+class FakeTransport:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    async def __call__(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def _config(tmp_path, **session_cfg):
+    return MagicMock(config={
+        "session_cookie": {"session_cookie": "abc"},
+        "session": {"rate_limit": 1000, **session_cfg},
+        "cache": {"path": str(tmp_path)},
+    })
+
+
+@pytest.fixture(autouse=True)
+def fresh_guards():
+    AoCAsyncSession.close_shared()
+    yield
+    AoCAsyncSession.close_shared()
+
+
+@pytest.mark.unit
+class TestAoCAsyncSession:
+    def test_get_returns_transport_response(self, tmp_path):
+        transport = FakeTransport(AoCAsyncResponse(200, "data", {}))
+        session = AoCAsyncSession(_config(tmp_path), transport=transport)
+        response = asyncio.run(session.get("https://example.com"))
+        assert response.text == "data"
+        assert transport.calls == [("GET", "https://example.com", {})]
+
+    @patch("pysleigh.utilities.async_session.asyncio.sleep")
+    def test_get_retries_with_backoff(self, mock_sleep, tmp_path):
+        async def no_sleep(_):
+            return None
+
+        mock_sleep.side_effect = no_sleep
+        transport = FakeTransport(
+            ConnectionError("reset"),
+            AoCAsyncResponse(503, "", {"Retry-After": "1"}),
+            AoCAsyncResponse(200, "ok", {"ETag": '"v1"'}),
+        )
+        session = AoCAsyncSession(_config(tmp_path), transport=transport)
+        response = asyncio.run(session.get("https://example.com"))
+        assert response.status_code == 200
+        assert len(transport.calls) == 3
+        assert mock_sleep.call_args.args[0] == 1.0
+
+        # Validators from the 200 are sent on the next conditional request
+        transport.responses.append(AoCAsyncResponse(304, "", {}))
+        asyncio.run(session.get("https://example.com", conditional=True))
+        assert transport.calls[-1][2] == {"headers": {"If-None-Match": '"v1"'}}
+
+    def test_post_is_not_retried_and_circuit_opens(self, tmp_path):
+        transport = FakeTransport(
+            AoCAsyncResponse(500, "", {}), AoCAsyncResponse(500, "", {})
+        )
+        session = AoCAsyncSession(
+            _config(tmp_path, breaker_threshold=2), transport=transport
+        )
+        for _ in range(2):
+            response = asyncio.run(session.post("https://example.com", data={"a": 1}))
+            assert response.status_code == 500
+        assert len(transport.calls) == 2
+        with pytest.raises(AoCCircuitOpenError):
+            asyncio.run(session.post("https://example.com"))
+
+    def test_temporary_sessions_share_limiter_and_breaker(self, tmp_path):
+        config = _config(tmp_path, breaker_threshold=1)
+        first, second = AoCAsyncSession(config), AoCAsyncSession(config)
+        assert first.limiter is second.limiter
+        assert first.breaker is second.breaker
+        assert AoCAsyncSession(_config(tmp_path, burst=1)).limiter is not first.limiter
+
+        first.transport = FakeTransport(AoCAsyncResponse(500, "", {}))
+        asyncio.run(first.post("https://example.com"))
+
+        async def fetch():
+            async with AoCAsyncSession.using(None, config) as temporary:
+                await temporary.get("https://example.com")
+
+        with pytest.raises(AoCCircuitOpenError):
+            asyncio.run(fetch())
+
+    def test_cannot_be_shared(self):
+        with pytest.raises(TypeError):
+            AoCAsyncSession.shared()
+
+    @pytest.mark.skipif(
+        importlib.util.find_spec("aiohttp") is not None, reason="aiohttp is installed"
+    )
+    def test_missing_aiohttp_explains_extra(self, tmp_path):
+        session = AoCAsyncSession(_config(tmp_path))
+        with pytest.raises(ImportError, match="pysleigh\\[async\\]"):
+            asyncio.run(session.get("https://example.com"))
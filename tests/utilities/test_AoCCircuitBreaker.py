@@ -0,0 +1,44 @@
+import pytest
+from unittest.mock import patch
+from pysleigh.utilities.circuit import AoCCircuitBreaker, AoCCircuitOpenError
+
+
+@pytest.mark.unit
+class TestAoCCircuitBreaker:
+    def test_opens_after_threshold_consecutive_failures(self):
+        breaker = AoCCircuitBreaker(threshold=2, cooldown=60)
+        breaker.record_failure()
+        breaker.before_request()
+        breaker.record_failure()
+        assert breaker.is_open
+        with pytest.raises(AoCCircuitOpenError):
+            breaker.before_request()
+
+    def test_success_resets_failures(self):
+        breaker = AoCCircuitBreaker(threshold=2)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert not breaker.is_open
+
+    def test_half_open_after_cooldown(self):
+        breaker = AoCCircuitBreaker(threshold=1, cooldown=10)
+        with patch("pysleigh.utilities.circuit.time.monotonic", return_value=100.0):
+            breaker.record_failure()
+        with patch("pysleigh.utilities.circuit.time.monotonic", return_value=111.0):
+            breaker.before_request()
+            assert not breaker.is_open
+            # A failed trial reopens immediately
+            breaker.record_failure()
+            assert breaker.is_open
+
+    def test_half_open_lets_one_trial_through(self):
+        breaker = AoCCircuitBreaker(threshold=1, cooldown=10)
+        with patch("pysleigh.utilities.circuit.time.monotonic", return_value=100.0):
+            breaker.record_failure()
+        with patch("pysleigh.utilities.circuit.time.monotonic", return_value=111.0):
+            assert breaker.before_request() is True
+            with pytest.raises(AoCCircuitOpenError, match="trial"):
+                breaker.before_request()
+            breaker.record_success()
+            assert breaker.before_request() is False
@@ -0,0 +1,59 @@
+import pytest
+from unittest.mock import patch, MagicMock
+from pysleigh.utilities.daemon_client import AoCDaemonClient, get_socket_path, main
+
+
+@pytest.mark.unit
+class TestAoCDaemonClient:
+    def test_get_socket_path(self, tmp_path):
+        config = MagicMock(config={"cache": {"path": str(tmp_path)}})
+        assert get_socket_path(config) == tmp_path / "daemon.sock"
+        config = MagicMock(config={"daemon": {"socket": str(tmp_path / "x.sock")}})
+        assert get_socket_path(config) == tmp_path / "x.sock"
+
+    def test_request_without_daemon(self, tmp_path):
+        client = AoCDaemonClient(tmp_path / "missing.sock")
+        with pytest.raises(ConnectionError, match="pysleigh daemon start"):
+            client.request("ping")
+        assert client.ping() is None
+
+    @patch.object(AoCDaemonClient, "request")
+    def test_main_run(self, mock_request, capsys):
+        mock_request.return_value = {
+            "ok": True,
+            "output": "debug line\n",
+            "reloaded": ["year_2022.solution_2022_day_01"],
+            "result": {
+                "part1": 7,
+                "part2": 9,
+                "time_parse": 0.1,
+                "time_part1": 0.2,
+                "time_part2": 0.3,
+                "time_total": 0.6,
+                "tests_passed": True,
+            },
+        }
+        code = main(
+            ["--socket", "/tmp/x.sock", "run", "--year", "2022", "--day", "1", "--test"]
+        )
+        assert code == 0
+        mock_request.assert_called_once_with("run", year=2022, day=1, test=True)
+        out = capsys.readouterr().out
+        assert out.startswith("debug line\n")
+        assert "Reloaded: year_2022.solution_2022_day_01" in out
+        assert "Part 1: 7 (took 0.200000s)" in out
+        assert "✅ Tests passed." in out
+
+    @patch.object(AoCDaemonClient, "request")
+    def test_main_failures_exit_nonzero(self, mock_request, capsys):
+        mock_request.return_value = {"ok": True, "result": {}, "output": "Traceback\n"}
+        assert main(["--socket", "/tmp/x.sock", "run"]) == 1
+        mock_request.return_value = {"ok": True, "result": False, "output": ""}
+        assert main(["--socket", "/tmp/x.sock", "test"]) == 1
+        mock_request.return_value = {"ok": False, "error": "boom"}
+        assert main(["--socket", "/tmp/x.sock", "benchmark"]) == 1
+        assert "[Error] boom" in capsys.readouterr().err
+
+    def test_main_without_daemon(self, tmp_path, capsys):
+        assert main(["--socket", str(tmp_path / "missing.sock"), "status"]) == 1
+        assert "No pysleigh daemon" in capsys.readouterr().err
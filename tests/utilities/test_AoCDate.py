@@ -29,3 +29,9 @@ class TestAoCDate:
         with caplog.at_level("ERROR"):
             AoCDate(future_year, 1)
         assert "not yet unlocked" in caplog.text
+
+    def test_released_days(self):
+        assert AoCDate.released_days(2015) == list(range(1, AOC_MAX_DAY + 1))
+        assert AoCDate.released_days(2014) == []
+        max_year, max_day = AoCDate._compute_max_date()
+        assert AoCDate.released_days(max_year) == list(range(1, max_day + 1))
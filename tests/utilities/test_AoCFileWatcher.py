@@ -0,0 +1,82 @@
+import os
+import sys
+import threading
+import time
+import pytest
+from pysleigh.utilities.filewatch import AoCFileWatcher
+
+BACKENDS = [
+    pytest.param(
+        "inotify",
+        marks=pytest.mark.skipif(
+            not sys.platform.startswith("linux"), reason="inotify is Linux-only"
+        ),
+    ),
+    "polling",
+]
+
+
+def _later(delay, action):
+    timer = threading.Timer(delay, action)
+    timer.start()
+    return timer
+
+
+def _bump(path, content):
+    path.write_text(content)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("backend", BACKENDS)
+class TestAoCFileWatcher:
+    def test_reports_changed_file(self, tmp_path, backend):
+        watched = tmp_path / "solution.py"
+        watched.write_text("a")
+        with AoCFileWatcher(
+            [watched], debounce=0.05, poll_interval=0.01, backend=backend
+        ) as watcher:
+            assert watcher.backend == backend
+            _later(0.05, lambda: _bump(watched, "b"))
+            assert watcher.wait(timeout=5) == {watched.resolve()}
+
+    def test_ignores_unwatched_files(self, tmp_path, backend):
+        watched = tmp_path / "solution.py"
+        watched.write_text("a")
+        with AoCFileWatcher(
+            [watched], debounce=0.05, poll_interval=0.01, backend=backend
+        ) as watcher:
+            (tmp_path / "notes.txt").write_text("x")
+            assert watcher.wait(timeout=0.3) == set()
+
+    def test_coalesces_bursts_and_replacements(self, tmp_path, backend):
+        first, second = tmp_path / "a.py", tmp_path / "b.py"
+        first.write_text("a")
+        second.write_text("b")
+
+        def burst():
+            _bump(first, "a2")
+            time.sleep(0.05)
+            # Editors often save by writing a new file and renaming it over
+            replacement = tmp_path / "b.py.tmp"
+            replacement.write_text("b2")
+            os.utime(replacement, ns=(0, second.stat().st_mtime_ns + 10**9))
+            os.replace(replacement, second)
+
+        with AoCFileWatcher(
+            [first, second], debounce=0.3, poll_interval=0.01, backend=backend
+        ) as watcher:
+            _later(0.05, burst)
+            assert watcher.wait(timeout=5) == {first.resolve(), second.resolve()}
+
+    def test_update_watches_new_files(self, tmp_path, backend):
+        (tmp_path / "helpers").mkdir()
+        helper = tmp_path / "helpers" / "grid.py"
+        helper.write_text("a")
+        with AoCFileWatcher(
+            [], debounce=0.05, poll_interval=0.01, backend=backend
+        ) as watcher:
+            watcher.update([helper])
+            _later(0.05, lambda: _bump(helper, "b"))
+            assert watcher.wait(timeout=5) == {helper.resolve()}
@@ -0,0 +1,64 @@
+import pytest
+from pysleigh.utilities.reader import AoCInputReader
+
+
+@pytest.mark.unit
+class TestAoCInputReader:
+    def _write(self, tmp_path, data: bytes):
+        path = tmp_path / "input.txt"
+        path.write_bytes(data)
+        return path
+
+    def test_bytes_and_text_access(self, tmp_path):
+        path = self._write(tmp_path, b"12\n34\n")
+        with AoCInputReader(path) as reader:
+            assert len(reader) == 6
+            assert reader.view[:2] == b"12"
+            assert reader.read_bytes() == b"12\n34\n"
+            assert reader.read_text() == "12\n34\n"
+
+    def test_lines_are_lazy_and_strip_newlines(self, tmp_path):
+        path = self._write(tmp_path, b"1\r\n\r\n22\n3")
+        with AoCInputReader(path) as reader:
+            lines = reader.lines()
+            assert next(lines) == b"1"
+            assert list(lines) == [b"", b"22", b"3"]
+            assert list(reader.lines(keepends=True))[0] == b"1\r\n"
+
+    def test_empty_input(self, tmp_path):
+        path = self._write(tmp_path, b"")
+        with AoCInputReader(path) as reader:
+            assert len(reader) == 0
+            assert list(reader.lines()) == []
+            assert reader.grid().shape == (0, 0)
+
+    @pytest.mark.parametrize("data", [b"#.#\n..#\n", b"#.#\n..#", b"#.#\r\n..#\r\n"])
+    def test_grid_views_cells_in_place(self, tmp_path, data):
+        path = self._write(tmp_path, data)
+        with AoCInputReader(path) as reader:
+            grid = reader.grid()
+            assert grid.shape == (2, 3)
+            assert grid[1, 2] == ord("#")
+            assert [bytes(row) for row in grid.rows()] == [b"#.#", b"..#"]
+            with pytest.raises(IndexError):
+                grid[0, 3]
+
+    @pytest.mark.parametrize("data", [b"ab\nc\n", b"abc\nd\nf\nghi\n", b"ab\ncde\n"])
+    def test_ragged_input_is_not_a_grid(self, tmp_path, data):
+        path = self._write(tmp_path, data)
+        with AoCInputReader(path) as reader:
+            with pytest.raises(ValueError, match="not a grid"):
+                reader.grid()
+
+    def test_grid_to_numpy_shares_memory(self, tmp_path):
+        np = pytest.importorskip("numpy")
+        path = self._write(tmp_path, b"#.#\n..#\n")
+        reader = AoCInputReader(path)
+        array = reader.grid().to_numpy()
+        assert array.shape == (2, 3)
+        assert (array == ord("#")).sum() == 3
+        assert not array.flags.writeable
+        mapped = np.frombuffer(reader.view, dtype=np.uint8)
+        assert np.shares_memory(array, mapped)
+        del array, mapped
+        reader.close()
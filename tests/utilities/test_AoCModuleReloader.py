@@ -0,0 +1,77 @@
+import os
+import sys
+import pytest
+from pysleigh.utilities.reloader import AoCModuleReloader
+
+
+@pytest.fixture
+def modules(tmp_path, monkeypatch):
+    (tmp_path / "reload_pkg").mkdir()
+    (tmp_path / "reload_pkg" / "__init__.py").write_text("")
+    (tmp_path / "reload_pkg" / "base.py").write_text("VALUE = 1\n")
+    (tmp_path / "reload_pkg" / "user.py").write_text(
+        "from reload_pkg.base import VALUE\n\n\ndef value():\n    return VALUE\n"
+    )
+    (tmp_path / "reload_pkg" / "other.py").write_text("import json\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    import reload_pkg.user
+    import reload_pkg.other
+
+    yield tmp_path
+    for name in list(sys.modules):
+        if name.split(".")[0] == "reload_pkg":
+            del sys.modules[name]
+
+
+def _edit(path, content):
+    path.write_text(content)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+@pytest.mark.unit
+class TestAoCModuleReloader:
+    def test_loaded_is_limited_to_root(self, modules):
+        reloader = AoCModuleReloader(modules)
+        assert set(reloader.loaded()) == {
+            "reload_pkg",
+            "reload_pkg.base",
+            "reload_pkg.user",
+            "reload_pkg.other",
+        }
+        assert AoCModuleReloader(None).loaded() == {}
+
+    def test_changed_and_affected(self, modules):
+        reloader = AoCModuleReloader(modules)
+        reloader.track()
+        assert reloader.changed() == set()
+        _edit(modules / "reload_pkg" / "base.py", "VALUE = 2\n")
+        assert reloader.changed() == {"reload_pkg.base"}
+        # The package holds its submodules but does not use them
+        assert reloader.affected({"reload_pkg.base"}) == {
+            "reload_pkg.base",
+            "reload_pkg.user",
+        }
+
+    def test_reload_refreshes_dependents_in_order(self, modules):
+        reloader = AoCModuleReloader(modules)
+        reloader.track()
+        user = sys.modules["reload_pkg.user"]
+        _edit(modules / "reload_pkg" / "base.py", "VALUE = 2\n")
+        stale = reloader.affected(reloader.changed())
+        assert reloader.reload(stale) == ["reload_pkg.base", "reload_pkg.user"]
+        assert user.value() == 2
+        assert sys.modules["reload_pkg.user"] is user
+        assert reloader.changed() == set()
+
+    def test_evict_forces_fresh_import(self, modules):
+        reloader = AoCModuleReloader(modules)
+        reloader.track()
+        _edit(modules / "reload_pkg" / "base.py", "VALUE = 3\n")
+        assert reloader.evict(reloader.affected(reloader.changed())) == [
+            "reload_pkg.base",
+            "reload_pkg.user",
+        ]
+        import reload_pkg.user
+
+        assert reload_pkg.user.value() == 3
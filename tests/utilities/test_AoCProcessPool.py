@@ -0,0 +1,95 @@
+import os
+import time
+import pytest
+from pysleigh.utilities.process import AoCProcessPool
+
+
+def _square(x):
+    return {"x": x, "value": x * x, "pid": os.getpid()}
+
+
+def _sleep(seconds):
+    time.sleep(seconds)
+    return {"seconds": seconds}
+
+
+def _crash():
+    os._exit(3)
+
+
+def _raise():
+    raise ValueError("boom")
+
+
+def _phases(seconds):
+    AoCProcessPool.report_phase("part1")
+    time.sleep(0.1)
+    AoCProcessPool.report_phase("part2")
+    time.sleep(seconds)
+    return {"in_worker": AoCProcessPool.in_worker()}
+
+
+def _untimed(seconds):
+    AoCProcessPool.report_phase("part2")
+    AoCProcessPool.report_phase("memory")
+    time.sleep(seconds)
+    return {"seconds": seconds}
+
+
+def _affinity():
+    return {"cpus": sorted(os.sched_getaffinity(0))}
+
+
+@pytest.mark.unit
+class TestAoCProcessPool:
+    def test_map_preserves_order_and_isolates_processes(self):
+        pool = AoCProcessPool(jobs=2)
+        results = pool.map(_square, [{"x": i} for i in range(4)])
+        assert [r["value"] for r in results] == [0, 1, 4, 9]
+        pids = {r["pid"] for r in results}
+        assert len(pids) == 4
+        assert os.getpid() not in pids
+
+    def test_timeout_kills_worker_and_continues(self):
+        pool = AoCProcessPool(jobs=2, timeout=0.5)
+        started = time.monotonic()
+        results = pool.map(_sleep, [{"seconds": 30}, {"seconds": 0}])
+        assert time.monotonic() - started < 15
+        assert results[0] == {"seconds": 30, "status": "timeout"}
+        assert results[1] == {"seconds": 0}
+
+    def test_phase_timeout_reports_running_phase(self):
+        pool = AoCProcessPool(jobs=1, phase_timeout=0.5)
+        results = pool.map(_phases, [{"seconds": 30}, {"seconds": 0}])
+        assert results[0] == {"seconds": 30, "status": "timeout", "phase": "part2"}
+        assert results[1] == {"in_worker": True}
+
+    def test_untimed_phases_skip_phase_timeout(self):
+        pool = AoCProcessPool(jobs=1, phase_timeout=0.2, untimed_phases=("memory",))
+        assert pool.map(_untimed, [{"seconds": 0.6}]) == [{"seconds": 0.6}]
+        pool = AoCProcessPool(
+            jobs=1, timeout=0.5, phase_timeout=0.2, untimed_phases=("memory",)
+        )
+        results = pool.map(_untimed, [{"seconds": 30}])
+        assert results == [{"seconds": 30, "status": "timeout", "phase": "memory"}]
+
+    def test_report_phase_is_noop_outside_workers(self):
+        assert not AoCProcessPool.in_worker()
+        AoCProcessPool.report_phase("parse")
+
+    def test_crashed_worker_reports_error(self):
+        results = AoCProcessPool().map(_crash, [{}])
+        assert results == [{"status": "error"}]
+
+    def test_exception_in_worker_reports_error(self):
+        results = AoCProcessPool().map(_raise, [{}])
+        assert results[0]["status"] == "error"
+        assert "boom" in results[0]["error"]
+
+    @pytest.mark.skipif(
+        not hasattr(os, "sched_setaffinity"), reason="CPU affinity unsupported"
+    )
+    def test_pin_cpus_restricts_worker_affinity(self):
+        pool = AoCProcessPool(jobs=1, pin_cpus=True)
+        results = pool.map(_affinity, [{}])
+        assert results[0]["cpus"] == [pool.cpus[0]]
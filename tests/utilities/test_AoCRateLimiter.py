@@ -0,0 +1,43 @@
+import threading
+import time
+import pytest
+from unittest.mock import MagicMock
+from pysleigh.utilities.ratelimit import AoCRateLimiter
+
+
+@pytest.mark.unit
+class TestAoCRateLimiter:
+    def test_burst_is_immediate(self):
+        limiter = AoCRateLimiter(rate=1.0, burst=3)
+        started = time.monotonic()
+        waits = [limiter.acquire() for _ in range(3)]
+        assert waits == [0.0, 0.0, 0.0]
+        assert time.monotonic() - started < 0.5
+
+    def test_blocks_once_bucket_is_empty(self):
+        limiter = AoCRateLimiter(rate=20.0, burst=1)
+        limiter.acquire()
+        started = time.monotonic()
+        limiter.acquire()
+        assert time.monotonic() - started >= 0.04
+
+    def test_rate_holds_across_threads(self):
+        limiter = AoCRateLimiter(rate=50.0, burst=1)
+        started = time.monotonic()
+        threads = [threading.Thread(target=limiter.acquire) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        # One token up front, then five more at 50/s
+        assert time.monotonic() - started >= 0.09
+
+    def test_from_config(self):
+        config = MagicMock(config={"session": {"rate_limit": 0.5, "burst": 2}})
+        limiter = AoCRateLimiter.from_config(config)
+        assert limiter.rate == 0.5
+        assert limiter.burst == 2
+
+    def test_rejects_non_positive_rate(self):
+        with pytest.raises(ValueError):
+            AoCRateLimiter(rate=0)
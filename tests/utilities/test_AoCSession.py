@@ -26,7 +26,9 @@ class TestAoCSession:
 
             s = AoCSession()
             resp = s.get("https://example.com")
-            mock_sess.get.assert_called_once_with("https://example.com")
+            mock_sess.get.assert_called_once_with(
+                "https://example.com", timeout=(5.0, 30.0)
+            )
             assert resp.status_code == 200
 
     def test_post_delegates_to_requests(self):
@@ -38,6 +40,154 @@ class TestAoCSession:
             s = AoCSession()
             resp = s.post("https://example.com", data={"key": "value"})
             mock_sess.post.assert_called_once_with(
-                "https://example.com", data={"key": "value"}
+                "https://example.com", data={"key": "value"}, timeout=(5.0, 30.0)
             )
             assert resp.status_code == 201
+
+    def test_shared_reuses_one_session_per_cookie(self):
+        AoCSession.close_shared()
+        config = MagicMock(config={"session_cookie": {"session_cookie": "abc"}})
+        other = MagicMock(config={"session_cookie": {"session_cookie": "xyz"}})
+        try:
+            first = AoCSession.shared(config)
+            assert AoCSession.shared(config) is first
+            assert AoCSession.shared(other) is not first
+        finally:
+            AoCSession.close_shared()
+
+    def test_shared_sessions_are_kept_per_settings(self, tmp_path):
+        AoCSession.close_shared()
+
+        def config(session=None, cache=None):
+            return MagicMock(
+                config={
+                    "session_cookie": {"session_cookie": "abc"},
+                    "session": session or {},
+                    "cache": {"path": str(cache or tmp_path)},
+                }
+            )
+
+        try:
+            first = AoCSession.shared(config({"retries": 3}))
+            assert AoCSession.shared(config({"retries": 3})) is first
+            for other in (
+                config({"retries": 0}),
+                config({"retries": 3, "rate_limit": 0.5}),
+                config({"retries": 3, "base_url": "http://127.0.0.1:8000"}),
+                config({"retries": 3}, cache=tmp_path / "other"),
+            ):
+                assert AoCSession.shared(other) is not first
+            assert AoCSession.shared(config({"retries": 0})).retries == 0
+        finally:
+            AoCSession.close_shared()
+
+    def test_pool_size_from_config(self):
+        config = MagicMock(config={
+            "session_cookie": {"session_cookie": "abc"},
+            "session": {"pool_size": 4},
+        })
+        s = AoCSession(config)
+        adapter = s.session.get_adapter("https://adventofcode.com")
+        assert s.pool_size == 4
+        assert adapter._pool_maxsize == 4
+
+    def test_conditional_get_sends_stored_validators(self, tmp_path):
+        config = MagicMock(config={
+            "session_cookie": {"session_cookie": "abc"},
+            "cache": {"path": str(tmp_path)},
+        })
+        with patch("requests.Session") as MockSession:
+            mock_sess = MockSession.return_value
+            mock_sess.get.return_value = MagicMock(
+                status_code=200, headers={"ETag": '"v1"'}
+            )
+            s = AoCSession(config)
+            s.get("https://example.com")
+            mock_sess.get.assert_called_with("https://example.com", timeout=(5.0, 30.0))
+
+            mock_sess.get.return_value = MagicMock(status_code=304, headers={})
+            resp = s.get("https://example.com", conditional=True)
+            mock_sess.get.assert_called_with(
+                "https://example.com",
+                headers={"If-None-Match": '"v1"'},
+                timeout=(5.0, 30.0),
+            )
+            assert resp.status_code == 304
+
+    def _session(self, MockSession, **session_cfg):
+        config = MagicMock(config={
+            "session_cookie": {"session_cookie": "abc"},
+            "session": {"rate_limit": 1000, **session_cfg},
+        })
+        return AoCSession(config)
+
+    @patch("pysleigh.utilities.session.time.sleep")
+    def test_get_retries_transient_errors(self, mock_sleep):
+        import requests as real_requests
+        with patch("requests.Session") as MockSession:
+            mock_sess = MockSession.return_value
+            unavailable = MagicMock(status_code=503, headers={"Retry-After": "2"})
+            mock_sess.get.side_effect = [
+                real_requests.ConnectionError("reset"),
+                unavailable,
+                MagicMock(status_code=200, headers={}),
+            ]
+            s = self._session(MockSession)
+            resp = s.get("https://example.com")
+        assert resp.status_code == 200
+        unavailable.close.assert_called_once()
+        resp.close.assert_not_called()
+        assert mock_sess.get.call_count == 3
+        assert mock_sess.get.call_args.kwargs["timeout"] == (5.0, 30.0)
+        assert mock_sleep.call_count == 2
+        assert mock_sleep.call_args.args[0] == 2.0
+
+    @patch("pysleigh.utilities.session.time.sleep")
+    def test_get_gives_up_after_retries(self, mock_sleep):
+        import requests as real_requests
+        with patch("requests.Session") as MockSession:
+            mock_sess = MockSession.return_value
+            mock_sess.get.side_effect = real_requests.Timeout("slow")
+            s = self._session(MockSession, retries=2)
+            with pytest.raises(real_requests.Timeout):
+                s.get("https://example.com")
+        assert mock_sess.get.call_count == 3
+
+    def test_post_is_not_retried(self):
+        with patch("requests.Session") as MockSession:
+            mock_sess = MockSession.return_value
+            mock_sess.post.return_value = MagicMock(status_code=502)
+            s = self._session(MockSession)
+            assert s.post("https://example.com").status_code == 502
+        assert mock_sess.post.call_count == 1
+
+    @patch("pysleigh.utilities.session.time.sleep")
+    def test_circuit_opens_when_upstream_is_down(self, mock_sleep):
+        from pysleigh.utilities.circuit import AoCCircuitOpenError
+        with patch("requests.Session") as MockSession:
+            mock_sess = MockSession.return_value
+            mock_sess.get.return_value = MagicMock(status_code=500)
+            s = self._session(MockSession, retries=0, breaker_threshold=2)
+            s.get("https://example.com/1")
+            s.get("https://example.com/2")
+            with pytest.raises(AoCCircuitOpenError):
+                s.get("https://example.com/3")
+        assert mock_sess.get.call_count == 2
+
+    @patch("pysleigh.utilities.session.time.sleep")
+    def test_half_open_trial_is_not_retried(self, mock_sleep):
+        with patch("requests.Session") as MockSession:
+            mock_sess = MockSession.return_value
+            mock_sess.get.return_value = MagicMock(status_code=500)
+            s = self._session(
+                MockSession, retries=3, breaker_threshold=1, breaker_cooldown=0
+            )
+            s.breaker.record_failure()
+            assert s.get("https://example.com").status_code == 500
+        assert mock_sess.get.call_count == 1
+        assert s.breaker.is_open and not s.breaker.trial
+
+    def test_base_url_defaults_to_site_and_is_configurable(self):
+        assert AoCSession.get_base_url(MagicMock(config={})) == "https://adventofcode.com"
+        config = MagicMock(config={"session": {"base_url": "http://127.0.0.1:8000/"}})
+        assert AoCSession.get_base_url(config) == "http://127.0.0.1:8000"
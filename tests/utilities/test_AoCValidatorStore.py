@@ -0,0 +1,36 @@
+import pytest
+from unittest.mock import MagicMock
+from pysleigh.utilities.validators import AoCValidatorStore
+
+URL = "https://adventofcode.com/2022/day/1"
+
+
+@pytest.mark.unit
+class TestAoCValidatorStore:
+    def _store(self, tmp_path, account=""):
+        return AoCValidatorStore(
+            config=MagicMock(config={"cache": {"path": str(tmp_path)}}), account=account
+        )
+
+    def test_no_headers_for_unknown_url(self, tmp_path):
+        assert self._store(tmp_path).headers_for(URL) == {}
+
+    def test_update_persists_validators(self, tmp_path):
+        self._store(tmp_path).update(
+            URL, {"ETag": '"abc"', "Last-Modified": "Sat, 01 Dec 2022 05:00:00 GMT"}
+        )
+        headers = self._store(tmp_path).headers_for(URL)
+        assert headers == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Sat, 01 Dec 2022 05:00:00 GMT",
+        }
+
+    def test_responses_without_validators_are_not_stored(self, tmp_path):
+        store = self._store(tmp_path)
+        store.update(URL, {"Content-Type": "text/html"})
+        assert not store.path.exists()
+
+    def test_validators_are_kept_per_account(self, tmp_path):
+        self._store(tmp_path, "alice").update(URL, {"ETag": '"abc"'})
+        assert self._store(tmp_path, "alice").headers_for(URL) == {"If-None-Match": '"abc"'}
+        assert self._store(tmp_path, "bob").headers_for(URL) == {}